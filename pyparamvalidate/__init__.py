@@ -1,2 +1,38 @@
+__version__ = '0.3.3'
+
+from pyparamvalidate.core.code_cache import set_cache_dir
+from pyparamvalidate.core.cross_validator import CrossParameterValidator
+from pyparamvalidate.core.memoize import register_pure_rule
 from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.plan import compile_all, warmup
 from pyparamvalidate.core.validator import Validator
+
+'''
+以下名称所在的模块只在第一次访问时导入，降低 import pyparamvalidate 的耗时(如命令行工具、serverless 函数的冷启动)：
+{名称: 所在模块}
+'''
+_LAZY_NAMES = {
+    'DataFrameValidator': 'pyparamvalidate.core.dataframe',
+    'ReturnValidator': 'pyparamvalidate.core.return_validator',
+    'Rules': 'pyparamvalidate.core.container',
+    'compact_allowlist': 'pyparamvalidate.utils.compact_set',
+    'validate_methods': 'pyparamvalidate.core.class_validator',
+    'validated_dataclass': 'pyparamvalidate.core.record',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    # 缓存到模块的全局变量中，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_NAMES})
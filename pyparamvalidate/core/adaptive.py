@@ -0,0 +1,183 @@
+from _thread import allocate_lock
+from time import perf_counter
+
+from pyparamvalidate.core.fastpath import build_fast_check
+from pyparamvalidate.core.memoize import is_pure_rule
+
+'''
+自适应校验规则顺序(可选)
+
+ParameterValidator 默认按声明顺序执行校验规则，.customize(expensive_check).is_string() 对于不是字符串的参数值，
+也会先执行耗时的 expensive_check。开启 adaptive 之后：
+
+    @register_pure_rule
+    def is_valid_checksum(user_id):
+        ...
+
+    @ParameterValidator("user_id", adaptive=True).customize(is_valid_checksum).is_int()
+    def example_function(user_id):
+        ...
+
+1. 前 adaptive_window 次常规校验中，统计每条校验规则的耗时和不通过的次数(学习期间不使用快速校验)；
+2. 学习结束后，按 "平均耗时 / 不通过率" 从小到大重新排序，耗时短、不通过率高的规则先执行，之后不再统计，顺序固定；
+3. 只有纯校验规则(见 pyparamvalidate.core.memoize)可以调整顺序，非纯校验规则(如未注册为纯函数的 customize、
+   schema_validate、is_file)和会修改参数值的 is_not_empty 保持原位置，其他规则也不会越过它们；
+4. 类型校验规则(is_string、is_int 等)可以提前，其他规则不会被移动到它之前声明的类型校验规则前面，如 max_length 总是在 is_string 之后执行。
+
+调整顺序后，参数值同时不满足多条规则时，抛出的异常可能来自另一条规则。需要确定的顺序时(如多个部署实例保持一致)，
+可以通过 ParameterValidator.rule_order() 获取学习到的顺序，并通过 freeze_order(order) 固定；
+未开启 adaptive 时，也可以通过 freeze_order(order) 直接指定执行顺序。
+'''
+
+# 类型校验规则：其他规则可能依赖参数值的类型，不会被移动到它之前声明的类型校验规则前面
+GUARD_RULES = frozenset({
+    'is_string', 'is_int', 'is_float', 'is_number', 'is_list', 'is_dict', 'is_set', 'is_tuple', 'is_not_none', 'is_method',
+    'is_bytes',
+})
+
+# 会修改参数值的纯校验规则，不调整顺序
+_TRANSFORM_RULES = frozenset({'is_not_empty'})
+
+
+def rule_kind(method_name, vargs):
+    """
+    返回校验规则的类型：'guard'(类型校验)、'movable'(可调整顺序)、'barrier'(固定位置)
+    """
+    if not is_pure_rule(method_name, vargs) or method_name in _TRANSFORM_RULES:
+        return 'barrier'
+    return 'guard' if method_name in GUARD_RULES else 'movable'
+
+
+def plan_order(kinds, scores):
+    """
+    根据规则类型和得分计算执行顺序
+
+    :param kinds: 按声明顺序排列的规则类型
+    :param scores: 按声明顺序排列的规则得分，得分小的先执行
+    :return: 规则的声明下标元组
+    """
+    order = []
+    segment = []
+
+    def flush():
+        pending = list(segment)
+        placed = set()
+        while pending:
+            # 非类型校验规则，需要等待它之前声明的类型校验规则全部执行
+            available = [index for index in pending
+                         if kinds[index] == 'guard'
+                         or all(kinds[other] != 'guard' or other in placed for other in segment if other < index)]
+            index = min(available, key=lambda i: (scores[i], i))
+            pending.remove(index)
+            placed.add(index)
+            order.append(index)
+        segment.clear()
+
+    for index, kind in enumerate(kinds):
+        if kind == 'barrier':
+            flush()
+            order.append(index)
+        else:
+            segment.append(index)
+    flush()
+    return tuple(order)
+
+
+def check_order(kinds, order):
+    """
+    判断执行顺序是否满足约束：是声明下标的一个排列，固定位置的规则不移动，非类型校验规则不在它之前声明的类型校验规则前面执行
+    """
+    if sorted(order) != list(range(len(kinds))):
+        return False
+
+    positions = {index: position for position, index in enumerate(order)}
+    for index, kind in enumerate(kinds):
+        for other in range(index):
+            if kinds[other] == 'barrier' or kind == 'barrier' or (kinds[other] == 'guard' and kind != 'guard'):
+                if positions[other] > positions[index]:
+                    return False
+    return True
+
+
+class RuleOptimizer:
+    """
+    校验规则顺序优化器，一个 ParameterValidator 的所有被装饰函数共用一个优化器
+    """
+
+    def __init__(self, rules, names, window=1000, order=None):
+        """
+        :param rules: 按声明顺序排列的校验规则，元素为 (校验方法, 位置参数, 关键字参数)
+        :param names: 按声明顺序排列的 (校验方法名, 位置参数)
+        :param window: 学习的常规校验次数
+        :param order: 固定的执行顺序，为 None 时学习执行顺序
+        """
+        self._declared = tuple(rules)
+        self._kinds = tuple(rule_kind(name, vargs) for name, vargs in names)
+        self._window = window
+        self._calls = 0
+        # 每条规则的统计信息：[执行次数, 不通过次数, 总耗时]，按声明顺序排列
+        self._stats = [[0, 0, 0.0] for _ in self._declared]
+        self._lock = allocate_lock()
+
+        self.order = tuple(range(len(self._declared)))
+        self.rules = self._declared
+        self.fast_check = None
+        self.frozen = False
+        if order is not None:
+            self.freeze(order)
+
+    def freeze(self, order=None):
+        """
+        停止学习，固定执行顺序
+
+        :param order: 执行顺序(声明下标元组)，为 None 时使用当前顺序
+        """
+        order = tuple(order) if order is not None else self.order
+        if not check_order(self._kinds, order):
+            raise ValueError(f'invalid rule order {order}, type guards and impure rules can not be moved')
+
+        self.order = order
+        self.rules = tuple(self._declared[index] for index in order)
+        self.fast_check = build_fast_check(self.rules)
+        self.frozen = True
+
+    def validate(self, validator):
+        """
+        按当前顺序执行校验规则，学习期间统计每条规则的耗时和不通过次数
+        """
+        if self.frozen:
+            for validate_method, vargs, vkwargs in self.rules:
+                validate_method(validator, *vargs, **vkwargs)
+            return
+
+        stats = self._stats
+        try:
+            for index in self.order:
+                validate_method, vargs, vkwargs = self._declared[index]
+                stat = stats[index]
+                start = perf_counter()
+                try:
+                    validate_method(validator, *vargs, **vkwargs)
+                except ValueError:
+                    stat[1] += 1
+                    raise
+                finally:
+                    stat[0] += 1
+                    stat[2] += perf_counter() - start
+        finally:
+            self._calls += 1
+            if self._calls >= self._window:
+                self._learn()
+
+    def _learn(self):
+        with self._lock:
+            if self.frozen:
+                return
+
+            scores = []
+            for runs, failures, elapsed in self._stats:
+                # 使用拉普拉斯平滑估计不通过率，避免没有不通过记录的规则得分为无穷大
+                failure_rate = (failures + 1) / (runs + 2)
+                scores.append((elapsed / runs if runs else 0.0) / failure_rate)
+            self.order = plan_order(self._kinds, scores)
+            self.freeze()
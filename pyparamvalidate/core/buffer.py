@@ -0,0 +1,94 @@
+'''
+二进制数据(bytes、bytearray、memoryview 等支持缓冲区协议的对象)校验
+
+校验规则通过 memoryview 切片访问数据，不会复制整个数据，适用于在请求处理函数中校验几十 MB 的上传数据：
+
+    @ParameterValidator("body").is_bytes().byte_size(max_size=50 * 1024 * 1024).has_magic(b'%PDF-').is_utf8()
+    def example_function(body):
+        ...
+
+- 对于 format 不是 'B' 的 memoryview(如 array('q') 的 memoryview)，按字节校验，非 C 连续的 memoryview 校验不通过；
+- is_utf8 使用增量解码器分块解码，每次只解码 UTF8_CHUNK_SIZE 字节，内存占用与数据大小无关。
+'''
+
+# is_utf8 每次解码的字节数
+UTF8_CHUNK_SIZE = 1 << 16
+
+
+def byte_view(value):
+    """
+    返回 value 的字节视图(format 为 'B' 的一维 memoryview)，不复制数据
+
+    :raise TypeError: value 不支持缓冲区协议，或者不是 C 连续的
+    """
+    view = memoryview(value)
+    if not view.c_contiguous:
+        # 如 memoryview(b'abcd')[::2]，format 为 'B' 时 cast 不会检查，需要单独判断
+        view.release()
+        raise TypeError('memoryview is not C-contiguous')
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+
+def is_valid_utf8(value, chunk_size=UTF8_CHUNK_SIZE):
+    """
+    判断二进制数据是否为合法的 UTF-8 编码，value 不支持缓冲区协议时返回 False
+    """
+    import codecs
+
+    try:
+        view = byte_view(value)
+    except TypeError:
+        return False
+
+    with view:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        try:
+            for start in range(0, len(view), chunk_size):
+                # 切片不复制数据，解码结果直接丢弃
+                decoder.decode(view[start:start + chunk_size])
+            decoder.decode(b'', True)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+
+def has_magic(value, magic, offset=0):
+    """
+    判断二进制数据从 offset 开始是否为 magic，magic 为元组时，匹配其中任意一个即可
+    """
+    try:
+        view = byte_view(value)
+    except TypeError:
+        return False
+
+    with view:
+        magics = magic if isinstance(magic, tuple) else (magic,)
+        return any(view[offset:offset + len(item)] == item for item in magics)
+
+
+def byte_size(value):
+    """
+    返回二进制数据的字节数，value 不支持缓冲区协议时返回 None
+    """
+    try:
+        with memoryview(value) as view:
+            return view.nbytes
+    except TypeError:
+        return None
+
+
+def is_aligned(value, alignment=None, itemsize=None):
+    """
+    判断二进制数据的字节数是否为 alignment 的整数倍，元素大小(memoryview.itemsize)是否为 itemsize
+    """
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return False
+
+    with view:
+        if itemsize is not None and view.itemsize != itemsize:
+            return False
+        return alignment is None or view.nbytes % alignment == 0
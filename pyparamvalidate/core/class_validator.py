@@ -0,0 +1,129 @@
+from pyparamvalidate.core.container import Rules
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.plan import compile_wrapper, signature_of, validation_stack
+
+'''
+根据类型注解校验类中的方法
+
+validate_methods 在定义类时一次性处理类中的所有方法，根据参数的类型注解生成校验规则，并立即编译校验计划：
+
+    @validate_methods
+    class Account:
+        def deposit(self, amount: int, note: str = ""):
+            ...
+
+        @classmethod
+        def open(cls, owner: str, *tags: str):
+            ...
+
+        @staticmethod
+        def parse(raw: bytes, **options: int):
+            ...
+
+- 实例方法的 self、classmethod 的 cls 不校验，staticmethod 校验全部参数；
+- 支持的类型注解：str、int、float、list、dict、set、tuple、bytes(或对应的字符串，如 "int")，
+  与 PEP 484 一致，float 注解也接受 int(不包括 bool，见 Validator.is_number)，
+  *args 参数校验每个元素，**kwargs 参数校验每个 value；其他注解(如 Optional[int]、List[int])不校验；
+- 未传值(使用默认值)的参数不校验；默认值为 None 的参数(如 note: str = None)允许传入 None，其他值仍然校验；
+- 方法已经使用 ParameterValidator 装饰时，合并为一个 wrapper，类型注解生成的校验规则先执行；
+- 默认只处理公开方法和 __init__，private=True 时同时处理以单下划线开头的方法。
+
+ParameterValidator 也可以直接装饰 classmethod / staticmethod 对象(写在 @classmethod 上方)。
+'''
+
+_ANNOTATION_RULES = {
+    str: 'is_string', int: 'is_int', float: 'is_number', list: 'is_list', dict: 'is_dict', set: 'is_set',
+    tuple: 'is_tuple', bytes: 'is_bytes',
+}
+
+# from __future__ import annotations 时，注解为字符串
+_ANNOTATION_NAMES = {annotation.__name__: rule for annotation, rule in _ANNOTATION_RULES.items()}
+
+
+def annotation_rule(annotation):
+    """
+    返回类型注解对应的校验方法名，不支持的注解返回 None
+    """
+    if isinstance(annotation, str):
+        return _ANNOTATION_NAMES.get(annotation)
+    try:
+        return _ANNOTATION_RULES.get(annotation)
+    except TypeError:
+        # 不可哈希的注解
+        return None
+
+
+def annotation_validators(func, skip_receiver=False):
+    """
+    根据 func 参数的类型注解生成 ParameterValidator 列表
+
+    :param func: 被装饰函数，可以是已经被校验装饰器装饰的 wrapper
+    :param skip_receiver: 是否跳过第一个参数(self / cls)
+    """
+    import inspect
+
+    stack = validation_stack(func)
+    if stack is not None:
+        func = stack[0]
+
+    parameters = list(signature_of(func).parameters.values())
+    if skip_receiver:
+        parameters = parameters[1:]
+
+    validators = []
+    for parameter in parameters:
+        rule = annotation_rule(parameter.annotation)
+        if rule is None:
+            continue
+
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            validators.append(ParameterValidator(parameter.name).each(getattr(Rules(), rule)()))
+        elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            validators.append(ParameterValidator(parameter.name).values(getattr(Rules(), rule)()))
+        else:
+            validator = ParameterValidator(parameter.name, skip_missing=parameter.default is not inspect.Parameter.empty,
+                                           allow_none=parameter.default is None)
+            validators.append(getattr(validator, rule)())
+    return validators
+
+
+def _is_validated_name(name, private):
+    if name == '__init__':
+        return True
+    if name.startswith('__'):
+        return False
+    return private or not name.startswith('_')
+
+
+def validate_methods(cls=None, *, private=False):
+    """
+    类装饰器：根据类型注解校验类中的方法，详见 pyparamvalidate.core.class_validator
+
+    可以直接使用 @validate_methods，也可以指定参数 @validate_methods(private=True)
+    """
+    if cls is None:
+        return lambda cls: validate_methods(cls, private=private)
+
+    for name, attribute in list(vars(cls).items()):
+        if not _is_validated_name(name, private):
+            continue
+
+        if isinstance(attribute, (classmethod, staticmethod)):
+            func, skip_receiver = attribute.__func__, isinstance(attribute, classmethod)
+        elif callable(attribute) and hasattr(attribute, '__code__'):
+            func, skip_receiver = attribute, True
+        else:
+            continue
+
+        validators = annotation_validators(func, skip_receiver)
+        if not validators:
+            continue
+
+        # 后声明的参数先包装，同一阶段内外层装饰器先执行，因此按参数声明顺序校验
+        for validator in reversed(validators):
+            func = validator(func)
+        # 在定义类时编译校验计划，第一次调用时不再编译
+        compile_wrapper(func)
+        setattr(cls, name, type(attribute)(func) if isinstance(attribute, (classmethod, staticmethod)) else func)
+
+    return cls
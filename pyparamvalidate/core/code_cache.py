@@ -0,0 +1,103 @@
+import marshal
+import os
+
+'''
+生成代码的编译缓存
+
+- pyparamvalidate 会为校验计划生成 Python 源码(如 fastpath 中的快速校验函数)，使用 compile_source 编译为 code 对象；
+- 相同的源码在进程内只编译一次；
+- 设置缓存目录后(set_cache_dir 或环境变量 PYPARAMVALIDATE_CACHE_DIR)，编译结果使用 marshal 序列化后写入磁盘，
+  worker 下次启动时直接加载，不再重复编译；
+- 缓存文件名由 pyparamvalidate 版本号、Python 字节码版本(MAGIC_NUMBER) 和源码共同计算哈希得到，
+  升级 pyparamvalidate 或 Python 之后，旧的缓存文件自动失效；
+- 缓存文件先写入临时文件，再通过 os.replace 原子替换，多个 worker 同时写入同一个缓存文件也不会读到不完整的内容。
+'''
+
+CACHE_DIR_ENV = 'PYPARAMVALIDATE_CACHE_DIR'
+
+# 进程内缓存：{源码: code 对象}
+_compiled = {}
+
+# 磁盘缓存目录，None 表示尚未从环境变量读取，'' 表示不使用磁盘缓存
+_cache_dir = None
+
+
+def set_cache_dir(path):
+    """
+    设置磁盘缓存目录，path 为 None 时关闭磁盘缓存，目录不存在时自动创建
+    """
+    global _cache_dir
+    if path:
+        os.makedirs(path, exist_ok=True)
+    _cache_dir = path or ''
+
+
+def get_cache_dir():
+    global _cache_dir
+    if _cache_dir is None:
+        set_cache_dir(os.environ.get(CACHE_DIR_ENV))
+    return _cache_dir or None
+
+
+def _cache_path(cache_dir, source):
+    import hashlib
+    from importlib.util import MAGIC_NUMBER
+
+    from pyparamvalidate import __version__
+
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    digest.update(MAGIC_NUMBER)
+    digest.update(source.encode())
+    return os.path.join(cache_dir, f'{digest.hexdigest()}.bin')
+
+
+def _load(path):
+    try:
+        with open(path, 'rb') as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        # 缓存文件不存在或已损坏，重新编译
+        return None
+
+
+def _dump(path, code):
+    import tempfile
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump(code, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # 缓存目录不可写时，不影响校验功能
+        pass
+
+
+def compile_source(source, filename='<pyparamvalidate>'):
+    """
+    编译源码并返回 code 对象，优先使用进程内缓存，其次使用磁盘缓存
+    """
+    code = _compiled.get(source)
+    if code is not None:
+        return code
+
+    cache_dir = get_cache_dir()
+    path = _cache_path(cache_dir, source) if cache_dir else None
+
+    code = _load(path) if path else None
+    if code is None:
+        code = compile(source, filename, 'exec')
+        if path:
+            _dump(path, code)
+
+    _compiled[source] = code
+    return code
+
+
+def clear_memory_cache():
+    _compiled.clear()
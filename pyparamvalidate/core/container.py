@@ -0,0 +1,341 @@
+import operator
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping
+from itertools import islice, repeat
+
+from pyparamvalidate.core.fastpath import FAILED, build_fast_check
+
+'''
+容器元素校验
+
+Validator / ParameterValidator 的 each、keys、values 方法，对容器中的每个元素执行一组校验规则：
+
+    @ParameterValidator("ids").is_list().max_length(10000).each(Rules().is_int().is_positive())
+    @ParameterValidator("options").is_dict().keys(Rules().is_string()).values(Rules().is_not_none())
+    def example_function(ids, options):
+        ...
+
+元素校验分为三层，前一层不通过时才进入下一层：
+
+1. 向量化校验：每条规则对整个容器执行一次 C 语言层面的批量操作，如 set(map(type, value)) 判断元素类型、
+   all(map(operator.lt, repeat(0), value)) 判断是否为正数、max(map(len, value)) <= n 判断长度，array('q') 等整数数组直接跳过类型判断；
+2. 逐个元素执行快速校验函数(见 pyparamvalidate.core.fastpath)，找出所有不通过的元素下标；
+3. 对第一个不通过的元素执行常规校验流程，抛出与 Validator 一致的异常信息，并附带不通过的元素下标。
+
+超大容器可以使用抽样校验，只校验首尾各 edge 个元素和 sample 个随机元素，校验耗时与容器大小无关：
+
+    @ParameterValidator("ids").is_list().each(Rules().is_int(), sample=1000, seed=0)
+
+抽样校验通过不代表所有元素都通过，Rules.stats() 中分别统计全量校验和抽样校验的次数。
+
+迭代器、生成器(如数据库游标)类型的参数可以使用 lazy_each，将参数值替换为 ValidatingIterator，
+在被装饰函数迭代时逐个校验元素并累计元素数量，不会预先读取全部元素：
+
+    @ParameterValidator("rows").lazy_each(Rules().is_dict(), max_count=100000)
+'''
+
+# 异常信息中最多列出的不通过元素下标数量
+MAX_REPORTED_FAILURES = 10
+
+# 抽样校验时，首尾各校验的元素数量
+DEFAULT_EDGE = 10
+
+ElementStats = namedtuple('ElementStats', ['validations', 'sampled_validations', 'checked_elements',
+                                           'skipped_elements'])
+
+_INT_TYPECODES = frozenset('bBhHiIlLqQ')
+_FLOAT_TYPECODES = frozenset('fd')
+
+
+class Rules:
+    """
+    元素校验规则，使用方法与 ParameterValidator 相同，通过链式调用收集 Validator 中的校验方法：
+
+        Rules().is_string().max_length(32)
+    """
+
+    def __init__(self):
+        self._validators = []
+        self._plan = None
+        # 校验统计：[校验次数, 抽样校验次数, 校验的元素数量, 抽样时跳过的元素数量]
+        self._stats = [0, 0, 0, 0]
+
+    def __getattr__(self, name):
+        # 只有不存在的属性才会进入 __getattr__，私有属性和魔术方法(如 copy 使用的 __deepcopy__)不作为校验方法收集
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def validator_method(*args, **kwargs):
+            self._validators.append((name, args, kwargs))
+            self._plan = None
+            return self
+
+        return validator_method
+
+    def stats(self):
+        """
+        返回校验统计信息 ElementStats(validations, sampled_validations, checked_elements, skipped_elements)，
+        sampled_validations 为其中使用抽样校验的次数，skipped_elements 为抽样时未校验的元素数量
+        """
+        return ElementStats(*self._stats)
+
+    def __repr__(self):
+        return f'Rules({", ".join(name for name, _, _ in self._validators)})'
+
+
+def _type_check(expected_type):
+    def check(elements):
+        if isinstance(elements, array) or isinstance(elements, memoryview):
+            code = elements.typecode if isinstance(elements, array) else elements.format
+            if expected_type is int and code in _INT_TYPECODES:
+                return True
+            if expected_type is float and code in _FLOAT_TYPECODES:
+                return True
+        return all(issubclass(element_type, expected_type) for element_type in set(map(type, elements)))
+
+    return check
+
+
+def _vector_check(method_name, args, kwargs):
+    """
+    返回校验规则的向量化校验函数 check(elements) -> bool，不支持时返回 None
+
+    向量化校验函数只用于快速判断 "全部通过"，返回 False 或抛出异常时，会逐个元素重新校验。
+    """
+    type_rules = {'is_int': int, 'is_string': str, 'is_float': float, 'is_list': list, 'is_dict': dict,
+                  'is_set': set, 'is_tuple': tuple}
+    if method_name in type_rules:
+        return _type_check(type_rules[method_name])
+
+    if method_name == 'is_positive':
+        # 不使用 min(elements) > 0：包含 NaN 时 min 的结果依赖元素顺序
+        return lambda elements: all(map(operator.lt, repeat(0), elements))
+
+    if method_name == 'is_not_none':
+        return lambda elements: all(map(operator.is_not, elements, repeat(None)))
+
+    if method_name == 'max_length':
+        max_length = args[0] if args else kwargs['max_length']
+        return lambda elements: not len(elements) or max(map(len, elements)) <= max_length
+
+    if method_name == 'min_length':
+        min_length = args[0] if args else kwargs['min_length']
+        return lambda elements: not len(elements) or min(map(len, elements)) >= min_length
+
+    if method_name == 'is_allowed_value':
+        allowed_values = args[0] if args else kwargs['allowed_values']
+        return lambda elements: all(map(allowed_values.__contains__, elements))
+
+    return None
+
+
+class ElementPlan:
+    """
+    元素校验计划，由 Rules 编译得到，缓存在 Rules 对象中
+    """
+
+    def __init__(self, rules: Rules):
+        from pyparamvalidate.core.validator import Validator
+
+        self.rules = tuple((getattr(Validator, name), vargs, vkwargs) for name, vargs, vkwargs in rules._validators)
+        self.fast_check = build_fast_check(self.rules)
+
+        vector_checks = [_vector_check(name, vargs, vkwargs) for name, vargs, vkwargs in rules._validators]
+        self.vector_checks = tuple(vector_checks) if all(vector_checks) else None
+
+    def all_passed(self, elements):
+        """
+        向量化校验，elements 必须支持 len() 和多次迭代
+        """
+        if self.vector_checks is None:
+            return False
+        try:
+            return all(check(elements) for check in self.vector_checks)
+        except Exception:
+            return False
+
+    def passed(self, element):
+        fast_check = self.fast_check
+        if fast_check is None:
+            return False
+        try:
+            return fast_check(element) is not FAILED
+        except Exception:
+            return False
+
+    def validate(self, element, field, rule_des):
+        """
+        使用常规校验流程校验单个元素，不通过时抛出 ValueError
+        """
+        from pyparamvalidate.core.validator import Validator
+
+        validator = Validator(element, field=field, rule_des=rule_des)
+        for validate_method, vargs, vkwargs in self.rules:
+            validate_method(validator, *vargs, **vkwargs)
+
+
+class ValidatingIterator:
+    """
+    校验迭代器：包装原迭代器，在迭代时逐个校验元素，只保存已迭代的元素数量，内存占用与元素数量无关
+    """
+
+    __slots__ = ('_iterator', '_plan', '_max_count', '_count', '_field', '_rule_des', '_exception_msg')
+
+    def __init__(self, iterable, rules=None, max_count=None, field=None, rule_des=None, exception_msg=None):
+        """
+        :param iterable: 被包装的可迭代对象
+        :param rules: 元素校验规则(Rules)，为 None 时只校验元素数量
+        :param max_count: 最大元素数量，为 None 时不限制
+        :param exception_msg: 元素数量超过 max_count 时的错误提示
+        """
+        self._iterator = iter(iterable)
+        self._plan = compile_rules(rules) if rules is not None else None
+        self._max_count = max_count
+        self._count = 0
+        self._field = field or ''
+        self._rule_des = rule_des
+        self._exception_msg = exception_msg
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        element = next(self._iterator)
+        index = self._count
+        if self._max_count is not None and index >= self._max_count:
+            from pyparamvalidate.core.validator import _error_prompt
+
+            raise ValueError(_error_prompt(element, self._exception_msg or f'more than {self._max_count} elements',
+                                           self._rule_des, f'{self._field}[{index}]'))
+        self._count = index + 1
+
+        plan = self._plan
+        if plan is not None and not plan.passed(element):
+            plan.validate(element, f'{self._field}[{index}]', self._rule_des)
+        return element
+
+    @property
+    def count(self):
+        """
+        已迭代(且校验通过)的元素数量
+        """
+        return self._count
+
+    def close(self):
+        """
+        关闭被包装的生成器
+        """
+        close = getattr(self._iterator, 'close', None)
+        if close is not None:
+            close()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._iterator!r}, count={self._count})'
+
+
+def compile_rules(rules: Rules) -> ElementPlan:
+    if not isinstance(rules, Rules):
+        from pyparamvalidate.core.validator import CallValidateMethodError
+
+        raise CallValidateMethodError(f'{rules} must be a instance of Rules, not {type(rules)}, '
+                                      f'Please use "Rules().is_int()" to declare the element rules.')
+
+    if rules._plan is None:
+        rules._plan = ElementPlan(rules)
+    return rules._plan
+
+
+def sample_size(confidence, tolerance=0.01):
+    """
+    计算抽样数量：不通过的元素占比不低于 tolerance 时，以 confidence 的概率至少抽到一个不通过的元素
+
+        sample_size(0.99, 0.01) -> 459
+
+    :param confidence: 置信度，如 0.99
+    :param tolerance: 可以容忍(漏检)的不通过元素占比，如 0.01
+    """
+    import math
+
+    if not 0 < confidence < 1 or not 0 < tolerance < 1:
+        raise ValueError(f'confidence and tolerance must be between 0 and 1, got {confidence}, {tolerance}')
+    return math.ceil(math.log(1 - confidence) / math.log(1 - tolerance))
+
+
+def sample_elements(elements, sample, seed=None, edge=DEFAULT_EDGE):
+    """
+    抽取首尾各 edge 个元素和 sample 个随机元素
+
+    :param elements: 支持 len() 的容器；不支持下标访问的容器(如 set、dict)按迭代顺序计算下标
+    :return: (元素列表, 元素下标列表)，容器元素数量不超过抽样数量时返回 None
+    """
+    size = len(elements)
+    if size <= 2 * edge + sample:
+        return None
+
+    import random
+
+    generator = random.Random(seed) if seed is not None else random
+    indices = sorted(generator.sample(range(edge, size - edge), sample))
+    indices = [*range(edge), *indices, *range(size - edge, size)]
+    if hasattr(elements, '__getitem__') and not isinstance(elements, Mapping):
+        return [elements[index] for index in indices], indices
+
+    # 不支持下标访问的容器，遍历一次，跳过未抽中的元素(只迭代，不校验)
+    iterator = iter(elements)
+    picked = []
+    previous = -1
+    for index in indices:
+        picked.append(next(islice(iterator, index - previous - 1, None)))
+        previous = index
+    return picked, indices
+
+
+def validate_elements(rules, elements, labels=None, field_format='{field}[{label}]', field=None, rule_des=None,
+                      total=None):
+    """
+    校验容器中的所有元素，全部通过时返回 True，不通过时抛出 ValueError
+
+    :param rules: 元素校验规则(Rules)
+    :param elements: 元素，必须支持 len() 和多次迭代(如 list、tuple、dict.keys()、dict.values())
+    :param labels: 元素标识(如字典的 key)，与 elements 一一对应，为 None 时使用元素下标
+    :param field_format: 元素字段名的格式，用于错误提示，可以使用 {field}(容器的字段名) 和 {label}(元素标识)
+    :param field: 容器的字段名
+    :param rule_des: 规则描述
+    :param total: 抽样校验时容器的元素总数，elements 为抽取的元素，用于统计
+    """
+    plan = compile_rules(rules)
+
+    stats = rules._stats
+    stats[0] += 1
+    stats[2] += len(elements)
+    if total is not None:
+        stats[1] += 1
+        stats[3] += total - len(elements)
+
+    if plan.all_passed(elements):
+        return True
+
+    labels = range(len(elements)) if labels is None else labels
+    field = field or ''
+
+    first_error = None
+    failures = []
+    for label, element in zip(labels, elements):
+        if plan.passed(element):
+            continue
+
+        # 快速校验不通过时，使用常规校验流程确认，并得到与 Validator 一致的异常信息
+        try:
+            plan.validate(element, field_format.format(field=field, label=repr(label)), rule_des)
+        except ValueError as e:
+            first_error = first_error or e
+            failures.append(label)
+            if len(failures) >= MAX_REPORTED_FAILURES:
+                break
+
+    if first_error is None:
+        return True
+
+    raise ValueError(f'{first_error} (failed elements: {", ".join(map(repr, failures))}'
+                     f'{", ..." if len(failures) >= MAX_REPORTED_FAILURES else ""})') from first_error
@@ -0,0 +1,97 @@
+from typing import TypeVar, Callable
+
+from pyparamvalidate.core.plan import CROSS_PARAMETER_STAGE, build_wrapper, signature_of
+from pyparamvalidate.core.validator import CallValidateMethodError, _error_prompt
+
+Self = TypeVar('Self', bound='CrossParameterValidator')
+
+
+class CrossParameterValidator:
+    """
+    跨参数校验器：校验多个参数之间的关系，如 start < end、len(ids) == len(weights)、a 和 b 有且只有一个不为 None
+
+    示例：
+
+        @ParameterValidator("start").is_int()
+        @ParameterValidator("end").is_int()
+        @CrossParameterValidator().rule(lambda start, end: start < end, exception_msg="start must be less than end")
+        def example_function(start, end):
+            ...
+
+    - 与 ParameterValidator 叠加使用时合并为一个 wrapper，不论装饰器的书写顺序，总是先执行所有参数校验，再执行跨参数校验，
+      因此依赖的参数校验不通过时，会直接抛出参数校验的异常，不会执行(可能很耗时的)跨参数校验；
+    - 同一个 CrossParameterValidator 中的所有规则共用一次参数绑定(signature.bind)，按声明顺序执行，遇到第一个不通过的规则即抛出异常，
+      因此应将依赖其他规则的、耗时的规则声明在后面。
+    """
+
+    def __init__(self, rule_des=None):
+        """
+        :param rule_des: 规则描述，规则未指定 exception_msg 时使用
+        """
+        self.rule_des = rule_des
+        self._rules = []
+
+    def rule(self, validate_method: Callable, params=None, exception_msg=None) -> Self:
+        """
+        :param validate_method: 校验函数，以关键字参数的形式接收 params 中的参数值，返回 bool
+        :param params: 校验函数依赖的参数名，默认为校验函数的参数名
+        :param exception_msg: 校验不通过时的错误提示
+        """
+        self._rules.append((validate_method, tuple(params) if params is not None else None, exception_msg))
+        return self
+
+    def exactly_one_of(self, *params, exception_msg=None) -> Self:
+        """
+        params 中有且只有一个参数的值不为 None
+        """
+        return self.rule(lambda **values: sum(value is not None for value in values.values()) == 1,
+                         params, exception_msg)
+
+    def __call__(self, func: Callable) -> Callable:
+        return build_wrapper(func, self, CROSS_PARAMETER_STAGE)
+
+    def _paths(self):
+        return ()
+
+    def _compile(self, func: Callable, prefixes=None) -> Callable:
+        """
+        编译校验计划，返回校验函数 check(args, kwargs, scope) -> args
+        """
+        import inspect
+
+        signature = signature_of(func)
+        var_keyword = next((name for name, parameter in signature.parameters.items()
+                            if parameter.kind is inspect.Parameter.VAR_KEYWORD), None)
+
+        rules = []
+        for validate_method, params, exception_msg in self._rules:
+            if params is None:
+                params = tuple(name for name, parameter in inspect.signature(validate_method).parameters.items()
+                               if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                                     inspect.Parameter.KEYWORD_ONLY))
+
+            # 参数名不存在且被装饰函数没有 **kwargs 时，在编译时报错，而不是在每次调用时得到 None
+            unknown = [name for name in params if name not in signature.parameters]
+            if unknown and var_keyword is None:
+                raise CallValidateMethodError(f'{func.__qualname__} has no parameter named {", ".join(unknown)}')
+
+            rules.append((validate_method, params, ', '.join(params), exception_msg))
+
+        rules = tuple(rules)
+        rule_des = self.rule_des
+
+        def check(args, kwargs, scope=None):
+            # 所有规则共用一次参数绑定，并使用默认值补全未传值的参数
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            extra_kwargs = arguments.get(var_keyword, {}) if var_keyword is not None else {}
+
+            for validate_method, params, field, exception_msg in rules:
+                values = {name: arguments[name] if name in arguments else extra_kwargs.get(name) for name in params}
+                if not validate_method(**values):
+                    raise ValueError(_error_prompt(values, exception_msg, rule_des, field))
+
+            return args
+
+        return check
@@ -0,0 +1,256 @@
+from collections import namedtuple
+
+from pyparamvalidate.core.container import Rules
+from pyparamvalidate.core.fastpath import _bind_rule_arguments
+
+'''
+pandas DataFrame 向量化校验(需要安装 pandas，pandas 为可选依赖，只在校验时导入)
+
+使用 Rules 声明每一列的校验规则，规则名与 Validator 相同，每条规则对整列执行一次 pandas / NumPy 向量操作，
+而不是为每个单元格实例化 Validator：
+
+    from pyparamvalidate import DataFrameValidator, Rules
+
+    validator = DataFrameValidator() \
+        .column("id", Rules().is_int().is_positive()) \
+        .column("name", Rules().is_string().is_not_empty().max_length(32)) \
+        .column("status", Rules().is_allowed_value(["active", "inactive"]))
+
+    result = validator.validate(df)
+    df[result.mask]        # 全部校验通过的行
+    result.failures        # [ColumnFailure(column='id', rule='is_positive', count=3, examples=[5, 8, 13]), ...]
+
+- 类型规则优先根据列的 dtype 判断(如 int64 列的 is_int 直接通过)，object 列逐个单元格判断类型；
+- 每行只统计到第一条不通过的规则上，与 Validator 遇到第一条不通过的规则即抛出异常一致；
+- 与 Validator 一致，规则对值的修改传递给后续规则，如 is_not_empty 去除前后空格之后，max_length 校验去除空格之后的字符串；
+- 规则抛出异常(如字符串列的 is_positive)视为不通过；
+- 没有向量化实现的规则(如 is_file、schema_validate)逐个单元格使用 Validator 校验。
+'''
+
+# 每条不通过的规则最多记录的行索引数量
+MAX_EXAMPLES = 5
+
+'''
+- column: 列名
+- rule: 不通过的校验规则名，列不存在时为 'missing_column'
+- count: 以该规则为第一条不通过规则的行数
+- examples: 不通过的行索引(最多 MAX_EXAMPLES 个)
+'''
+ColumnFailure = namedtuple('ColumnFailure', ['column', 'rule', 'count', 'examples'])
+
+'''
+- mask: 布尔 Series，与 DataFrame 的索引相同，全部规则都通过的行为 True
+- failures: ColumnFailure 列表，按列和规则的声明顺序排列
+'''
+FrameValidation = namedtuple('FrameValidation', ['mask', 'failures'])
+
+_TYPE_RULES = {'is_string': str, 'is_int': int, 'is_float': float, 'is_list': list, 'is_dict': dict,
+               'is_set': set, 'is_tuple': tuple}
+
+
+def _cells(series, predicate):
+    """
+    逐个单元格判断，predicate 抛出异常时视为不通过
+    """
+    import numpy
+
+    def safe(value):
+        try:
+            return bool(predicate(value))
+        except Exception:
+            return False
+
+    return numpy.fromiter((safe(value) for value in series), dtype=bool, count=len(series))
+
+
+def _type_mask(series, expected_type):
+    from pandas.api import types
+
+    dtype = series.dtype
+    if expected_type is int and (types.is_integer_dtype(dtype) or types.is_bool_dtype(dtype)):
+        # 可空整数类型(Int64)中的 <NA> 不是 int
+        return series.notna().to_numpy(dtype=bool)
+    if expected_type is float and types.is_float_dtype(dtype):
+        # numpy.float64 是 float 的子类，NaN 也是 float
+        return series.notna().to_numpy(dtype=bool) if types.is_extension_array_dtype(dtype) else True
+    if expected_type is str and types.is_string_dtype(dtype) and not types.is_object_dtype(dtype):
+        return series.notna().to_numpy(dtype=bool)
+    if not types.is_object_dtype(dtype):
+        return False
+    return _cells(series, lambda value: isinstance(value, expected_type))
+
+
+def _not_empty_mask(series, stripped):
+    """
+    返回 (校验结果, 去除字符串前后空格之后的列)
+    """
+    from pandas.api import types
+
+    if types.is_numeric_dtype(series.dtype):
+        return (series != 0).to_numpy(dtype=bool), series
+
+    if types.infer_dtype(series, skipna=True) != 'string':
+        # 混合类型的列逐个单元格判断，与 Validator 一致，只去除 str 的前后空格(bytes 等二进制数据不去除)
+        values = [value.strip() if stripped and isinstance(value, str) else value for value in series]
+        if stripped:
+            import pandas
+
+            series = pandas.Series(values, index=series.index, name=series.name, dtype=object)
+        return _cells(values, bool), series
+
+    # 字符串列使用 str 访问器批量去除空格、计算长度
+    if stripped:
+        series = series.str.strip()
+    mask = (series.str.len() > 0).fillna(False).to_numpy(dtype=bool, copy=True)
+    missing = series.isna().to_numpy(dtype=bool)
+    if missing.any():
+        # 缺失值(None、NaN)逐个单元格判断
+        mask[missing] = _cells(series[missing], bool)
+    return mask, series
+
+
+def _length_mask(series, compare):
+    try:
+        # 字符串、列表等单元格使用 str.len() 批量计算长度，其他单元格(如 None、数字、bytes)结果为 NaN
+        lengths = series.str.len()
+    except (AttributeError, TypeError):
+        # 列中没有字符串，不能使用 str 访问器
+        return _cells(series, lambda value: compare(len(value)))
+
+    mask = compare(lengths).fillna(False).to_numpy(dtype=bool, copy=True)
+    unknown = lengths.isna().to_numpy(dtype=bool)
+    if unknown.any():
+        # 没有批量计算长度的单元格，逐个单元格判断(没有长度的单元格抛出异常，视为不通过)
+        mask[unknown] = _cells(series[unknown], lambda value: compare(len(value)))
+    return mask
+
+
+def _rule_mask(series, method_name, vargs, vkwargs):
+    """
+    返回 (校验规则对整列的校验结果, 校验之后的列)：
+    - 校验结果为布尔数组，或者 True / False(整列通过或不通过)；
+    - 校验之后的列包含规则对值的修改(如 is_not_empty 去除前后空格)，传递给后续规则
+    """
+    if method_name in _TYPE_RULES:
+        return _type_mask(series, _TYPE_RULES[method_name]), series
+
+    from pyparamvalidate.core.validator import Validator
+
+    arguments = _bind_rule_arguments(getattr(Validator, method_name), vargs, vkwargs)
+    if arguments is None:
+        from pyparamvalidate.core.validator import CallValidateMethodError
+
+        raise CallValidateMethodError(f'invalid arguments for {method_name}: {vargs}, {vkwargs}')
+
+    if method_name == 'is_positive':
+        try:
+            return (series > 0).to_numpy(dtype=bool), series
+        except TypeError:
+            return _cells(series, lambda value: value > 0), series
+
+    if method_name == 'is_not_none':
+        from pandas.api import types
+
+        if not types.is_object_dtype(series.dtype):
+            return True, series
+        return _cells(series, lambda value: value is not None), series
+
+    if method_name == 'is_not_empty':
+        return _not_empty_mask(series, arguments['stripped'])
+
+    if method_name == 'is_allowed_value':
+        return series.isin(list(arguments['allowed_values'])).to_numpy(dtype=bool), series
+
+    if method_name == 'is_specific_value':
+        from pandas.api import types
+
+        specific_value = arguments['specific_value']
+        if types.is_object_dtype(series.dtype):
+            return _cells(series, lambda value: value == specific_value), series
+        return (series == specific_value).to_numpy(dtype=bool), series
+
+    if method_name == 'max_length':
+        max_length = arguments['max_length']
+        return _length_mask(series, lambda lengths: lengths <= max_length), series
+
+    if method_name == 'min_length':
+        min_length = arguments['min_length']
+        return _length_mask(series, lambda lengths: lengths >= min_length), series
+
+    if method_name == 'customize':
+        validate_method, args, kwargs = arguments['validate_method'], arguments['args'], arguments['kwargs']
+        return _cells(series, lambda value: validate_method(value, *args, **kwargs)), series
+
+    # 其他规则没有向量化实现，逐个单元格使用 Validator 校验，并保留校验之后的值(如 schema_validate 转换之后的值)
+    values = series.tolist()
+    changed = False
+
+    def validate(position):
+        nonlocal changed
+        validator = Validator(values[position])
+        getattr(validator, method_name)(*vargs, **vkwargs)
+        if validator.value is not values[position]:
+            values[position] = validator.value
+            changed = True
+        return True
+
+    mask = _cells(range(len(values)), validate)
+    if changed:
+        import pandas
+
+        series = pandas.Series(values, index=series.index, name=series.name, dtype=object)
+    return mask, series
+
+
+class DataFrameValidator:
+    """
+    pandas DataFrame 向量化校验器，详见 pyparamvalidate.core.dataframe
+    """
+
+    def __init__(self):
+        self._columns = []
+
+    def column(self, name, rules: Rules):
+        """
+        声明一列的校验规则
+
+        :param name: 列名
+        :param rules: 校验规则(Rules)
+        """
+        if not isinstance(rules, Rules):
+            from pyparamvalidate.core.validator import CallValidateMethodError
+
+            raise CallValidateMethodError(f'{rules} must be a instance of Rules, not {type(rules)}')
+        self._columns.append((name, rules))
+        return self
+
+    def validate(self, frame) -> FrameValidation:
+        """
+        校验 DataFrame，返回 FrameValidation(mask, failures)
+        """
+        import numpy
+        import pandas
+
+        passed = numpy.ones(len(frame), dtype=bool)
+        failures = []
+        for name, rules in self._columns:
+            if name not in frame.columns:
+                passed[:] = False
+                failures.append(ColumnFailure(name, 'missing_column', len(frame), []))
+                continue
+
+            series = frame[name]
+            # 该列到目前为止全部通过的行，每行只统计到第一条不通过的规则上
+            remaining = numpy.ones(len(frame), dtype=bool)
+            for method_name, vargs, vkwargs in rules._validators:
+                rule_mask, series = _rule_mask(series, method_name, vargs, vkwargs)
+                rule_mask = numpy.broadcast_to(rule_mask, remaining.shape)
+                failed = remaining & ~rule_mask
+                count = int(failed.sum())
+                if count:
+                    examples = frame.index[numpy.flatnonzero(failed)[:MAX_EXAMPLES]].tolist()
+                    failures.append(ColumnFailure(name, method_name, count, examples))
+                    remaining &= rule_mask
+            passed &= remaining
+
+        return FrameValidation(pandas.Series(passed, index=frame.index), failures)
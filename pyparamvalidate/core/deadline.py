@@ -0,0 +1,211 @@
+from _thread import allocate_lock
+from time import monotonic
+
+'''
+校验超时(deadline)
+
+is_file / is_dir 访问挂起的网络文件系统、customize 访问外部服务时，校验可能长时间阻塞调用线程。
+可以为整个参数的校验或单条校验规则设置超时时间(秒)：
+
+    @ParameterValidator("path", deadline=0.5).is_string().is_file()
+    @ParameterValidator("user_id").is_int().customize(user_exists).with_deadline(0.2, on_timeout="skip")
+    def example_function(path, user_id):
+        ...
+
+- 所有超时校验共用一个线程池(最多 DEADLINE_POOL_WORKERS 个线程，第一次使用时创建)，调用线程最多等待超时时间；
+  每条校验规则(或每个参数)同时占用的线程不超过 DEADLINE_WORKERS 个，挂起的规则不会占满线程池、影响其他规则；
+- 参数的超时时间作用于该参数的全部校验规则，包括纯校验规则，设置了超时时间的参数不使用快速校验(见 pyparamvalidate.core.fastpath)；
+- 超时之后的处理方式(on_timeout)：
+    - 'fail'：抛出 ValidationTimeoutError(ValueError 的子类)
+    - 'pass'：视为校验通过
+    - 'skip'：视为校验通过，并发出 ValidationTimeoutWarning 警告，可以通过 warnings / logging.captureWarnings 收集
+- 超时的校验规则无法被中断，会继续占用线程池中的线程直到返回；该规则可用的线程全部被挂起的校验占满时，新的校验排队等待，
+  超时时间内没有开始执行的校验抛出 ValidationNotStartedError(ValueError 的子类)，不受 on_timeout 影响：
+  没有执行的校验不会被视为通过；
+- 被装饰函数是 async 函数时，wrapper 也是 async 函数，参数校验在 await 时执行：校验在共用的线程池中执行，
+  使用 asyncio.wait 等待参数的超时时间，不阻塞事件循环。
+'''
+
+ON_TIMEOUT = ('fail', 'pass', 'skip')
+
+# 共用线程池的最大线程数量
+DEADLINE_POOL_WORKERS = 32
+
+# 每条规则(或每个参数)同时占用的最大线程数量
+DEADLINE_WORKERS = 4
+
+# 共用线程池，第一次使用超时时间时创建
+_executor = None
+_executor_lock = allocate_lock()
+
+
+class ValidationTimeoutError(ValueError):
+    pass
+
+
+class ValidationNotStartedError(ValueError):
+    """
+    线程池中的线程都在执行超时的校验，校验在超时时间内没有开始执行
+    """
+    pass
+
+
+class ValidationTimeoutWarning(RuntimeWarning):
+    pass
+
+
+def check_deadline(seconds, on_timeout):
+    if seconds is None or seconds <= 0:
+        from pyparamvalidate.core.validator import CallValidateMethodError
+
+        raise CallValidateMethodError(f'deadline must be a positive number of seconds, not {seconds}')
+    if on_timeout not in ON_TIMEOUT:
+        from pyparamvalidate.core.validator import CallValidateMethodError
+
+        raise CallValidateMethodError(f'on_timeout must be one of {ON_TIMEOUT}, not {on_timeout!r}')
+
+
+def _submit(fn, *args):
+    """
+    在共用线程池中执行 fn，返回 concurrent.futures.Future
+    """
+    global _executor
+    if _executor is None:
+        # concurrent.futures 会导入 threading，延迟到第一次使用超时时间时再导入
+        from concurrent.futures import ThreadPoolExecutor
+
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(DEADLINE_POOL_WORKERS, thread_name_prefix='pyparamvalidate-deadline')
+    return _executor.submit(fn, *args)
+
+
+def rule_slots(workers=DEADLINE_WORKERS):
+    """
+    返回一条规则(或一个参数)的线程配额：同时提交到共用线程池、还没有执行完成的校验不超过 workers 个
+    """
+    import threading
+
+    return threading.BoundedSemaphore(workers)
+
+
+def submit_admitted(slots, fn, *args):
+    """
+    已经取得 slots 中的一个配额后，在共用线程池中执行 fn，fn 执行完成(或被取消)时归还配额
+    """
+    try:
+        future = _submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda future: slots.release())
+    return future
+
+
+def not_started(field, description, seconds):
+    return ValidationNotStartedError(f'{field} error: {description} did not start within {seconds}s, '
+                                     f'all deadline workers are busy')
+
+
+def handle_timeout(field, description, seconds, on_timeout):
+    """
+    按 on_timeout 处理超时：'fail' 时抛出 ValidationTimeoutError，'skip' 时发出警告，'pass' 时不做处理
+    """
+    prompt = f'{field} error: {description} timed out after {seconds}s'
+    if on_timeout == 'fail':
+        raise ValidationTimeoutError(prompt)
+    if on_timeout == 'skip':
+        import warnings
+
+        warnings.warn(prompt, ValidationTimeoutWarning, stacklevel=2)
+
+
+def handle_expired(future, field, description, seconds, on_timeout):
+    """
+    等待超时之后处理线程池中的 future：
+    - 还没有开始执行：取消，并抛出 ValidationNotStartedError；
+    - 在超时之后、取消之前执行完成：返回执行结果(不通过时抛出校验的异常)；
+    - 正在执行：按 on_timeout 处理超时，返回 None
+    """
+    if future.cancel():
+        raise not_started(field, description, seconds)
+    if future.done():
+        return future.result()
+    handle_timeout(field, description, seconds, on_timeout)
+
+
+def _run_rules(validator, rules):
+    for validate_method, vargs, vkwargs in rules:
+        validate_method(validator, *vargs, **vkwargs)
+
+
+def timed_rule(rules, seconds, on_timeout, description):
+    """
+    将校验规则包装为一条在共用线程池中执行、最多等待 seconds 秒的规则，返回与校验方法调用方式相同的函数 timed(validator)
+
+    :param rules: 校验规则，元素为 (校验方法, 位置参数, 关键字参数)
+    :param description: 超时提示中的描述，如 "is_file" 或 "validation"
+    """
+    from concurrent.futures import TimeoutError
+
+    slots = rule_slots()
+
+    def timed(validator):
+        # 等待配额的时间也计入超时时间
+        deadline = monotonic() + seconds
+        if not slots.acquire(timeout=seconds):
+            raise not_started(validator._field, description, seconds)
+        future = submit_admitted(slots, _run_rules, validator, rules)
+        try:
+            future.result(timeout=max(deadline - monotonic(), 0))
+        except TimeoutError:
+            handle_expired(future, validator._field, description, seconds, on_timeout)
+        return validator
+
+    # 名称不是校验方法名，不会被当作纯校验规则去重、合并或生成快速校验函数
+    timed.__name__ = f'deadline({description})'
+    timed.rules = rules
+    return timed
+
+
+def async_check(check, field, seconds=None, on_timeout='fail', flight=None, key=None):
+    """
+    将校验函数 check(args, kwargs, scope) -> args 包装为 async 校验函数，在线程池中执行，最多等待 seconds 秒
+
+    :param seconds: 超时时间，为 None 时不限制(单条规则的超时时间仍然生效)，在事件循环的默认线程池中执行；
+                    否则在共用的线程池中执行
+    :param flight: AsyncSingleFlight 实例，key(args, kwargs) 相同的并发校验只执行一次(见 pyparamvalidate.core.single_flight)，
+                   为 None 时不合并
+    """
+    import asyncio
+
+    slots = rule_slots() if seconds is not None else None
+
+    async def run(args, kwargs, scope):
+        if slots is None:
+            return await asyncio.get_running_loop().run_in_executor(None, check, args, kwargs, scope)
+
+        deadline = monotonic() + seconds
+        # 配额被占满时，在默认线程池中等待配额，不阻塞事件循环
+        if not slots.acquire(blocking=False) and not await asyncio.get_running_loop().run_in_executor(
+                None, slots.acquire, True, seconds):
+            raise not_started(field, 'validation', seconds)
+        future = submit_admitted(slots, check, args, kwargs, scope)
+        call = asyncio.wrap_future(future)
+        # asyncio.wait 超时时不取消 call，由 handle_expired 判断校验是否已经开始执行
+        done, _ = await asyncio.wait((call,), timeout=max(deadline - monotonic(), 0))
+        if done:
+            return call.result()
+        # 超时之后仍在执行的校验，完成时取走结果，避免 "Future exception was never retrieved" 警告
+        call.add_done_callback(lambda call: call.cancelled() or call.exception())
+        result = handle_expired(future, field, 'validation', seconds, on_timeout)
+        return args if result is None else result
+
+    if flight is None:
+        return run
+
+    async def checked(args, kwargs, scope=None):
+        await flight.do(key(args, kwargs), lambda: run(args, kwargs, scope))
+        return args
+
+    return checked
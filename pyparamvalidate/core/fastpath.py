@@ -0,0 +1,193 @@
+from pyparamvalidate.core.code_cache import compile_source
+from pyparamvalidate.core.memoize import is_pure_rule
+
+'''
+快速校验路径(fast path)
+
+ParameterValidator 的常规校验流程是：实例化 Validator，依次反射调用校验方法，每个校验方法都经过 raise_exception 包装。
+对于绝大多数校验通过的调用，这些开销是不必要的。
+
+编译校验计划时，如果全部校验规则都是纯校验规则(见 pyparamvalidate.core.memoize)，则将校验规则生成为一个 Python 函数：
+
+    def make_fast_check(c0):
+        def fast_check(value):
+            if not (isinstance(value, str)):
+                return FAILED
+            if not (len(value) <= c0):
+                return FAILED
+            return value
+        return fast_check
+
+- fast_check 返回校验之后的参数值(与常规流程中的 validator.value 相同)，说明参数值校验通过，直接执行原函数；
+- fast_check 返回 FAILED 或抛出异常，回退到常规校验流程，由常规流程抛出与原来完全一致的异常信息；
+- 校验方法的参数(如 max_length 的 10、is_allowed_value 的列表)作为闭包常量 c0, c1 ... 传入，
+  因此生成的源码只与校验规则的 "形状" 有关，大量装饰器可以共用同一份编译结果(见 pyparamvalidate.core.code_cache)。
+'''
+
+'''
+校验方法对应的表达式模板：(表达式, 表达式中使用的校验方法参数名)
+
+- 表达式必须与 Validator 中对应校验方法的返回值完全等价；
+- 表达式中的 value 为待校验的参数值，{0}、{1} 依次对应参数名列表中的参数值。
+'''
+_TEMPLATES = {
+    'is_string': ('isinstance(value, str)', ()),
+    'is_int': ('isinstance(value, int)', ()),
+    'is_positive': ('value > 0', ()),
+    'is_float': ('isinstance(value, float)', ()),
+    'is_number': ('isinstance(value, (int, float)) and not isinstance(value, bool)', ()),
+    'is_list': ('isinstance(value, list)', ()),
+    'is_dict': ('isinstance(value, dict)', ()),
+    'is_set': ('isinstance(value, set)', ()),
+    'is_tuple': ('isinstance(value, tuple)', ()),
+    'is_not_none': ('value is not None', ()),
+    'is_not_empty': ('value', ()),
+    'is_allowed_value': ('value in {0}', ('allowed_values',)),
+    'is_specific_value': ('value == {0}', ('specific_value',)),
+    'max_length': ('len(value) <= {0}', ('max_length',)),
+    'min_length': ('len(value) >= {0}', ('min_length',)),
+    'is_substring': ('value in {0}', ('super_string',)),
+    'is_subset': ('value.issubset({0})', ('superset',)),
+    'is_sublist': ('set(value).issubset(set({0}))', ('superlist',)),
+    'contains_substring': ('{0} in value', ('substring',)),
+    'contains_subset': ('{0}.issubset(value)', ('subset',)),
+    'contains_sublist': ('set({0}).issubset(set(value))', ('sublist',)),
+    'is_file_suffix': ('value.endswith({0})', ('file_suffix',)),
+    'is_method': ('callable(value)', ()),
+    'customize': ('{0}(value, *{1}, **{2})', ('validate_method', 'args', 'kwargs')),
+}
+
+
+class _Failed:
+    def __repr__(self):
+        return 'FAILED'
+
+
+# fast_check 校验不通过时的返回值
+FAILED = _Failed()
+
+# 校验方法的签名缓存：{校验方法: inspect.Signature}
+_signatures = {}
+
+# 快速校验函数的工厂函数缓存：{源码: make_fast_check}
+_factories = {}
+
+
+def _bind_rule_arguments(validate_method, vargs, vkwargs):
+    """
+    将校验规则的参数绑定为 {参数名: 参数值}，包括默认值，参数不合法时返回 None
+    """
+    signature = _signatures.get(validate_method)
+    if signature is None:
+        import inspect
+
+        signature = _signatures[validate_method] = inspect.signature(validate_method.__wrapped__)
+
+    try:
+        bound = signature.bind(None, *vargs, **vkwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def supports_fast_check(rule):
+    """
+    判断单条校验规则是否可能生成快速校验函数(不检查规则的参数能否绑定)
+    """
+    validate_method, vargs, _ = rule
+    method_name = getattr(validate_method, '__name__', None)
+    return method_name in _TEMPLATES and is_pure_rule(method_name, vargs)
+
+
+def generate_check_lines(rules, constant, indent='        ', fail='return FAILED', value='value'):
+    """
+    根据校验规则生成校验变量 value 的语句，不通过时执行 fail 语句
+
+    :param rules: 校验规则，元素为 (校验方法, 位置参数, 关键字参数)，与 ValidationPlan.rules 相同
+    :param constant: 函数 constant(参数值) -> 闭包常量名，登记校验方法的参数
+    :param indent: 语句的缩进
+    :param value: 待校验的变量名
+    :return: 源码行列表，校验规则不支持快速校验时返回 None
+    """
+    lines = []
+    # 上一条规则为 min_length / max_length 时为 (校验方法名, 闭包常量名)
+    previous = None
+    for validate_method, vargs, vkwargs in rules:
+        method_name = validate_method.__name__
+        if method_name not in _TEMPLATES or not is_pure_rule(method_name, vargs):
+            return None
+
+        arguments = _bind_rule_arguments(validate_method, vargs, vkwargs)
+        if arguments is None:
+            return None
+
+        # is_not_empty 在 stripped 为 True 时会去除字符串前后空格，并影响后续的校验规则
+        if method_name == 'is_not_empty' and arguments['stripped']:
+            lines.append(f'{indent}if isinstance({value}, str):')
+            lines.append(f'{indent}    {value} = {value}.strip()')
+
+        template, param_names = _TEMPLATES[method_name]
+        if value != 'value':
+            import re
+
+            template = re.sub(r'\bvalue\b', value, template)
+        names = [constant(arguments[name]) for name in param_names]
+
+        # 相邻的 min_length、max_length 合并为一次 len() 调用，如 c0 <= len(value) <= c1
+        if previous is not None and {previous[0], method_name} == {'min_length', 'max_length'}:
+            bounds = {previous[0]: previous[1], method_name: names[0]}
+            lines[-2] = f'{indent}if not ({bounds["min_length"]} <= len({value}) <= {bounds["max_length"]}):'
+            previous = None
+            continue
+
+        expression = template.format(*names)
+        lines.append(f'{indent}if not ({expression}):')
+        lines.append(f'{indent}    {fail}')
+        previous = (method_name, names[0]) if method_name in ('min_length', 'max_length') else None
+    return lines
+
+
+def generate_source(rules):
+    """
+    根据校验规则生成快速校验函数的源码
+
+    :param rules: 校验规则，元素为 (校验方法, 位置参数, 关键字参数)，与 ValidationPlan.rules 相同
+    :return: (源码, 闭包常量列表)，校验规则不支持快速校验时返回 None
+    """
+    constants = []
+
+    def constant(value):
+        constants.append(value)
+        return f'c{len(constants) - 1}'
+
+    lines = generate_check_lines(rules, constant)
+    if lines is None:
+        return None
+
+    source = '\n'.join([
+        f'def make_fast_check({", ".join(f"c{i}" for i in range(len(constants)))}):',
+        '    def fast_check(value):',
+        *lines,
+        '        return value',
+        '    return fast_check',
+        '',
+    ])
+    return source, constants
+
+
+def build_fast_check(rules):
+    """
+    编译快速校验函数，校验规则不支持快速校验时返回 None
+    """
+    generated = generate_source(rules)
+    if generated is None:
+        return None
+
+    source, constants = generated
+    factory = _factories.get(source)
+    if factory is None:
+        namespace = {'FAILED': FAILED}
+        exec(compile_source(source, '<pyparamvalidate fast_check>'), namespace)
+        factory = _factories[source] = namespace['make_fast_check']
+    return factory(*constants)
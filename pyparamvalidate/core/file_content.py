@@ -0,0 +1,188 @@
+import stat
+
+from pyparamvalidate.core import buffer
+
+'''
+文件内容校验
+
+is_file、is_file_suffix 只校验路径，文件内容校验规则只读取校验需要的字节，而不是读取整个文件：
+
+    @ParameterValidator("path").is_file().file_size(max_size=100 * 1024 * 1024).file_magic(b'PK\\x03\\x04')
+    @ParameterValidator("csv_path").is_file().is_utf8_file().max_file_lines(100000).has_csv_header(['id', 'name'])
+    def example_function(path, csv_path):
+        ...
+
+- 同一个 Validator 的校验链中，所有文件校验规则(包括 is_file、is_dir)共用一次 os.stat 的结果和已读取的文件头；
+- file_magic、has_csv_header、is_json_file 只读取文件头(最多 HEAD_READ_SIZE 字节)；
+- is_utf8_file、max_file_lines 使用 mmap 访问文件内容，由操作系统按需加载，max_file_lines 超过行数限制时立即停止；
+- 文件不存在或无法读取时，校验不通过。
+'''
+
+# 读取文件头的最大字节数
+HEAD_READ_SIZE = 1 << 16
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+class FileProbe:
+    """
+    文件探针：缓存文件的 os.stat 结果和已读取的文件头
+    """
+
+    __slots__ = ('path', '_stat', '_head')
+
+    def __init__(self, path):
+        self.path = path
+        self._stat = None
+        self._head = None
+
+    @property
+    def stat(self):
+        """
+        os.stat 的结果，文件不存在或无法访问时为 None；path 类型错误(如 None)时与 os.path.isfile 不同，抛出 TypeError
+        """
+        if self._stat is None:
+            import os
+
+            try:
+                self._stat = os.stat(self.path)
+            except (OSError, ValueError):
+                self._stat = False
+        return self._stat or None
+
+    def is_regular_file(self):
+        return self.stat is not None and stat.S_ISREG(self.stat.st_mode)
+
+    def head(self, size=HEAD_READ_SIZE):
+        """
+        读取文件的前 size 个字节，多次读取时复用已读取的内容，文件不存在或无法读取时返回 None
+        """
+        head = self._head
+        if head is not None and (len(head) >= size or len(head) >= self.stat.st_size):
+            return head[:size]
+
+        if not self.is_regular_file():
+            return None
+        try:
+            with open(self.path, 'rb') as file:
+                head = self._head = file.read(size)
+        except OSError:
+            return None
+        return head
+
+    def mmap(self):
+        """
+        以只读方式映射整个文件，返回上下文管理器，空文件返回 b''，文件不存在或无法读取时返回 None
+        """
+        if not self.is_regular_file():
+            return None
+        if self.stat.st_size == 0:
+            return memoryview(b'')
+
+        import mmap
+
+        try:
+            with open(self.path, 'rb') as file:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+
+def file_probe(validator) -> FileProbe:
+    """
+    返回 Validator 当前参数值对应的文件探针，同一个 Validator 的多个文件校验规则共用一个文件探针
+    """
+    probe = validator._file_probe
+    if probe is None or probe.path is not validator.value:
+        probe = validator._file_probe = FileProbe(validator.value)
+    return probe
+
+
+def is_utf8_file(probe: FileProbe):
+    mapped = probe.mmap()
+    if mapped is None:
+        return False
+    with mapped:
+        return buffer.is_valid_utf8(mapped)
+
+
+def count_lines(probe: FileProbe, limit=None):
+    """
+    统计文件行数，行数超过 limit 时立即停止并返回 limit + 1，文件不存在或无法读取时返回 None
+    """
+    mapped = probe.mmap()
+    if mapped is None:
+        return None
+
+    with mapped:
+        size = len(mapped)
+        if size == 0:
+            return 0
+
+        find = mapped.find
+        lines = 0
+        position = find(b'\n')
+        while position != -1:
+            lines += 1
+            if limit is not None and lines > limit:
+                return lines
+            position = find(b'\n', position + 1)
+
+        # 最后一行没有换行符
+        if mapped[size - 1:size] != b'\n':
+            lines += 1
+        return lines
+
+
+def read_header_line(probe: FileProbe, encoding='utf-8'):
+    """
+    读取文件的第一行(不包括换行符)，第一行超过 HEAD_READ_SIZE 字节或无法解码时返回 None
+    """
+    head = probe.head()
+    if head is None:
+        return None
+
+    end = head.find(b'\n')
+    if end == -1:
+        if len(head) < probe.stat.st_size:
+            return None
+        end = len(head)
+
+    line = head[:end].rstrip(b'\r')
+    if line.startswith(_UTF8_BOM):
+        line = line[len(_UTF8_BOM):]
+    try:
+        return line.decode(encoding)
+    except (UnicodeDecodeError, LookupError):
+        return None
+
+
+def has_csv_header(probe: FileProbe, columns, delimiter=',', exact=False, encoding='utf-8'):
+    line = read_header_line(probe, encoding)
+    if line is None:
+        return False
+
+    import csv
+
+    header = next(csv.reader([line], delimiter=delimiter), [])
+    if exact:
+        return header == list(columns)
+    return set(columns).issubset(header)
+
+
+def json_root(probe: FileProbe):
+    """
+    返回 JSON 文件的根节点类型('object' 或 'array')，不是 JSON 对象或数组时返回 None
+    """
+    head = probe.head()
+    if head is None:
+        return None
+
+    if head.startswith(_UTF8_BOM):
+        head = head[len(_UTF8_BOM):]
+    first = head.lstrip()[:1]
+    if first == b'{':
+        return 'object'
+    if first == b'[':
+        return 'array'
+    return None
@@ -0,0 +1,106 @@
+from pyparamvalidate.core.adaptive import rule_kind
+from pyparamvalidate.core.fastpath import FAILED, build_fast_check, supports_fast_check
+
+'''
+校验规则链的规范化
+
+由公共函数拼接出来的校验规则链经常包含重复或可以合并的规则，如 is_string() 出现两次、min_length(3).max_length(10)、
+is_int().is_positive()。编译校验计划时，对校验规则链做两步规范化：
+
+1. 去重：删除完全相同(校验方法、参数、exception_msg 都相同)的纯校验规则，只保留第一条；
+   去重不会越过非纯校验规则和修改参数值的规则(如 is_not_empty)，因为它们之后的参数值可能不同；
+2. 合并：将连续的、支持快速校验的纯校验规则合并为一条规则，使用一个生成的函数判断(见 pyparamvalidate.core.fastpath)，
+   如 min_length(3).max_length(10) 合并为 3 <= len(value) <= 10，is_int().is_positive() 合并为 isinstance(value, int) and value > 0。
+   合并后的规则不通过时，按原顺序执行被合并的规则，由原规则抛出异常，因此异常信息与不合并时完全一致；
+   全部规则都支持快速校验时，校验计划在常规校验流程之前已经执行过整条规则链的快速校验函数，
+   常规校验流程只会在它不通过时执行，因此不再合并，直接执行原规则，避免重复执行同一个判断。
+'''
+
+
+def _same_rule(rule, other):
+    try:
+        return rule[0] is other[0] and rule[1] == other[1] and rule[2] == other[2]
+    except Exception:
+        # 参数不支持比较(如 numpy 数组)时，视为不同的规则
+        return False
+
+
+def dedupe_rules(rules):
+    """
+    删除重复的纯校验规则
+
+    :param rules: 校验规则，元素为 (校验方法, 位置参数, 关键字参数)
+    """
+    result = []
+    seen = []
+    for rule in rules:
+        validate_method, vargs, _ = rule
+        if rule_kind(validate_method.__name__, vargs) == 'barrier':
+            # 非纯校验规则、修改参数值的规则之后，参数值可能不同，不再与之前的规则比较
+            seen.clear()
+            result.append(rule)
+            continue
+
+        if any(_same_rule(rule, other) for other in seen):
+            continue
+        seen.append(rule)
+        result.append(rule)
+    return tuple(result)
+
+
+def _fused_rule(rules, fast_check):
+    """
+    将多条校验规则合并为一条规则，返回与校验方法调用方式相同的函数 fused(validator)
+    """
+
+    def fused(validator):
+        try:
+            value = fast_check(validator.value)
+        except Exception:
+            value = FAILED
+
+        if value is FAILED:
+            # 按原顺序执行被合并的规则，由原规则抛出与不合并时一致的异常
+            for validate_method, vargs, vkwargs in rules:
+                validate_method(validator, *vargs, **vkwargs)
+        else:
+            validator.value = value
+        return validator
+
+    fused.__name__ = f'fused({", ".join(validate_method.__name__ for validate_method, _, _ in rules)})'
+    fused.rules = rules
+    return fused
+
+
+def fuse_rules(rules, fast_check=None):
+    """
+    将连续的、支持快速校验的纯校验规则合并为一条规则
+
+    :param rules: 校验规则，元素为 (校验方法, 位置参数, 关键字参数)
+    :param fast_check: rules 的快速校验函数，调用者在常规校验流程之前已经执行过它，不为 None 时不合并，直接返回 rules
+    :return: 合并之后的校验规则，格式与 rules 相同
+    """
+    if fast_check is not None:
+        # 常规校验流程只在 fast_check 不通过时执行，合并之后的规则会再次执行同一个判断
+        return tuple(rules)
+
+    result = []
+    run = []
+
+    def flush():
+        check = build_fast_check(run) if len(run) > 1 else None
+        if check is not None:
+            result.append((_fused_rule(tuple(run), check), (), {}))
+        else:
+            # 规则的参数不能绑定(如参数个数错误)时不合并，由常规校验流程报错
+            result.extend(run)
+        run.clear()
+
+    for rule in rules:
+        if not supports_fast_check(rule):
+            flush()
+            result.append(rule)
+        else:
+            run.append(rule)
+    flush()
+    return tuple(result)
@@ -0,0 +1,306 @@
+from pyparamvalidate.core.memoize import LRUCache
+from pyparamvalidate.core.path import format_path
+
+'''
+JSON Schema 校验
+
+将 JSON Schema 文档编译为嵌套的校验函数，编译结果按 schema 对象缓存，校验时不再计算内容的哈希值；
+不同对象但内容相同的 schema 按内容的哈希值去重，只编译一次：
+
+    user_schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "minLength": 1, "maxLength": 32},
+            "age": {"type": "integer", "minimum": 0, "maximum": 120},
+            "tags": {"type": "array", "items": {"type": "string", "enum": ["a", "b"]}, "maxItems": 10},
+        },
+        "required": ["name"],
+        "additionalProperties": False,
+    }
+
+    @ParameterValidator("user").json_schema_validate(user_schema)
+    def example_function(user):
+        ...
+
+支持的关键字：type、properties、required、enum、const、pattern、minimum、maximum、exclusiveMinimum、exclusiveMaximum、
+minLength、maxLength、minItems、maxItems、items、additionalProperties，以及 title、description 等注释关键字；
+schema 中包含其他关键字(如 $ref、oneOf)时，编译时抛出 CallValidateMethodError，避免这些规则被静默忽略。
+
+- 与 JSON Schema 一致，数值、长度、pattern 等关键字只对对应类型的值生效，如 minLength 不校验数字；
+- 与 JSON Schema 一致，bool 不是 integer / number；array 可以是 list 或 tuple；
+- 校验不通过时，异常信息中包含不通过的字段路径，如 "user.tags.1 error: ..."；
+- schema 对象第一次使用之后不应再修改，修改之后需要使用新的对象。
+'''
+
+# 编译结果缓存：{schema 哈希值: 校验函数}
+_compiled = LRUCache(256)
+
+# 按 schema 对象缓存：{id(schema): (schema, 校验函数)}，保存 schema 的引用，保证 id 不会被其他对象复用
+_by_identity = LRUCache(256)
+
+_TYPES = {
+    'string': (str,),
+    'integer': (int,),
+    'number': (int, float),
+    'boolean': (bool,),
+    'object': (dict,),
+    'array': (list, tuple),
+    'null': (type(None),),
+}
+
+_ANNOTATIONS = frozenset({'$schema', '$id', '$comment', 'title', 'description', 'default', 'examples', 'format'})
+
+_KEYWORDS = frozenset({
+    'type', 'properties', 'required', 'enum', 'const', 'pattern', 'minimum', 'maximum', 'exclusiveMinimum',
+    'exclusiveMaximum', 'minLength', 'maxLength', 'minItems', 'maxItems', 'items', 'additionalProperties',
+})
+
+
+class SchemaError(ValueError):
+    """
+    校验不通过，path 为不通过的字段路径(元组)，message 为不通过的原因
+    """
+
+    def __init__(self, value, path, message):
+        super().__init__(message)
+        self.value = value
+        self.path = path
+        self.message = message
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _type_check(names):
+    names = [names] if isinstance(names, str) else list(names)
+    unknown = [name for name in names if name not in _TYPES]
+    if unknown:
+        from pyparamvalidate.core.validator import CallValidateMethodError
+
+        raise CallValidateMethodError(f'unsupported JSON Schema type: {", ".join(unknown)}')
+
+    types = tuple(t for name in names for t in _TYPES[name])
+    # bool 是 int 的子类，但在 JSON Schema 中不是 integer / number
+    allow_bool = 'boolean' in names
+    message = f'type must be {" or ".join(names)}'
+
+    def check(value, path):
+        if not isinstance(value, types) or (isinstance(value, bool) and not allow_bool):
+            raise SchemaError(value, path, message)
+
+    return check
+
+
+def _compile_node(schema):
+    """
+    将一个 schema 节点编译为校验函数 check(value, path)，不通过时抛出 SchemaError
+    """
+    from pyparamvalidate.core.validator import CallValidateMethodError
+
+    if schema is True or schema == {}:
+        return None
+    if schema is False:
+        def reject(value, path):
+            raise SchemaError(value, path, 'no value is allowed')
+
+        return reject
+    if not isinstance(schema, dict):
+        raise CallValidateMethodError(f'JSON Schema node must be a dict or bool, not {type(schema)}')
+
+    unsupported = set(schema) - _KEYWORDS - _ANNOTATIONS
+    if unsupported:
+        raise CallValidateMethodError(f'unsupported JSON Schema keywords: {", ".join(sorted(unsupported))}')
+
+    checks = []
+    if 'type' in schema:
+        checks.append(_type_check(schema['type']))
+
+    if 'enum' in schema:
+        enum = list(schema['enum'])
+        message = f'must be one of {enum}'
+
+        def check_enum(value, path):
+            if value not in enum:
+                raise SchemaError(value, path, message)
+
+        checks.append(check_enum)
+
+    if 'const' in schema:
+        const = schema['const']
+
+        def check_const(value, path):
+            if value != const:
+                raise SchemaError(value, path, f'must be {const!r}')
+
+        checks.append(check_const)
+
+    # 数值范围：(关键字, 不通过的条件, 错误提示)
+    bounds = [
+        ('minimum', lambda value, bound: value < bound, 'must be >= {}'),
+        ('maximum', lambda value, bound: value > bound, 'must be <= {}'),
+        ('exclusiveMinimum', lambda value, bound: value <= bound, 'must be > {}'),
+        ('exclusiveMaximum', lambda value, bound: value >= bound, 'must be < {}'),
+    ]
+    for keyword, failed, template in bounds:
+        if keyword in schema:
+            checks.append(_bound_check(_is_number, lambda value: value, failed, schema[keyword],
+                                       template.format(schema[keyword])))
+
+    # 长度范围
+    is_string = lambda value: isinstance(value, str)
+    is_array = lambda value: isinstance(value, (list, tuple))
+    lengths = [
+        ('minLength', is_string, lambda length, bound: length < bound, 'length must be >= {}'),
+        ('maxLength', is_string, lambda length, bound: length > bound, 'length must be <= {}'),
+        ('minItems', is_array, lambda length, bound: length < bound, 'must have at least {} items'),
+        ('maxItems', is_array, lambda length, bound: length > bound, 'must have at most {} items'),
+    ]
+    for keyword, applies, failed, template in lengths:
+        if keyword in schema:
+            checks.append(_bound_check(applies, len, failed, schema[keyword], template.format(schema[keyword])))
+
+    if 'pattern' in schema:
+        import re
+
+        pattern = re.compile(schema['pattern'])
+        message = f'does not match pattern {schema["pattern"]!r}'
+
+        def check_pattern(value, path):
+            if isinstance(value, str) and pattern.search(value) is None:
+                raise SchemaError(value, path, message)
+
+        checks.append(check_pattern)
+
+    if 'items' in schema:
+        checks.append(_items_check(schema['items']))
+
+    if any(keyword in schema for keyword in ('properties', 'required', 'additionalProperties')):
+        checks.append(_object_check(schema.get('properties', {}), schema.get('required', ()),
+                                    schema.get('additionalProperties', True)))
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    checks = tuple(checks)
+
+    def check_all(value, path):
+        for check in checks:
+            check(value, path)
+
+    return check_all
+
+
+def _bound_check(applies, measure, failed, bound, message):
+    def check(value, path):
+        if applies(value) and failed(measure(value), bound):
+            raise SchemaError(value, path, message)
+
+    return check
+
+
+def _items_check(items):
+    if isinstance(items, list):
+        # 元组校验：每个位置使用各自的 schema
+        item_checks = tuple(_compile_node(item) for item in items)
+
+        def check_tuple_items(value, path):
+            if isinstance(value, (list, tuple)):
+                for index, (item, item_check) in enumerate(zip(value, item_checks)):
+                    if item_check is not None:
+                        item_check(item, path + (index,))
+
+        return check_tuple_items
+
+    item_check = _compile_node(items)
+
+    def check_items(value, path):
+        if item_check is not None and isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                item_check(item, path + (index,))
+
+    return check_items
+
+
+def _object_check(properties, required, additional):
+    property_checks = {name: _compile_node(node) for name, node in properties.items()}
+    property_checks = {name: check for name, check in property_checks.items() if check is not None}
+    required = tuple(required)
+    known = frozenset(properties)
+    additional_check = _compile_node(additional) if isinstance(additional, dict) else None
+
+    def check(value, path):
+        if not isinstance(value, dict):
+            return
+
+        for name in required:
+            if name not in value:
+                raise SchemaError(None, path + (name,), 'is a required property')
+
+        for name, property_check in property_checks.items():
+            if name in value:
+                property_check(value[name], path + (name,))
+
+        if additional is False:
+            if not value.keys() <= known:
+                name = next(name for name in value if name not in known)
+                raise SchemaError(value[name], path + (name,), 'additional property is not allowed')
+        elif additional_check is not None:
+            for name in value:
+                if name not in known:
+                    additional_check(value[name], path + (name,))
+
+    return check
+
+
+def schema_hash(schema):
+    """
+    计算 schema 内容的哈希值，内容相同(与 key 的顺序无关)的 schema 哈希值相同
+    """
+    import hashlib
+    import json
+
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+def compile_json_schema(schema):
+    """
+    编译 JSON Schema，返回校验函数 validate(value, field=None, exception_msg=None)，不通过时抛出 ValueError；
+    编译结果按 schema 对象缓存，同一个 schema 对象只在第一次使用时计算内容的哈希值
+    """
+    entry = _by_identity.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    validate = _compile_by_content(schema)
+    _by_identity.add(id(schema), (schema, validate))
+    return validate
+
+
+def _compile_by_content(schema):
+    """
+    编译 JSON Schema，编译结果按 schema 内容的哈希值缓存
+    """
+    key = schema_hash(schema)
+    validate = _compiled.get(key, None)
+    if validate is not None:
+        return validate
+
+    from pyparamvalidate.core.validator import _error_prompt
+
+    check = _compile_node(schema)
+
+    def validate(value, field=None, exception_msg=None):
+        if check is None:
+            return True
+        try:
+            check(value, ())
+        except SchemaError as e:
+            keys = ((field,) if field else ()) + e.path
+            raise ValueError(_error_prompt(e.value, exception_msg or e.message, None, format_path(keys))) from None
+        return True
+
+    _compiled.add(key, validate)
+    return validate
@@ -0,0 +1,144 @@
+from _thread import allocate_lock
+from collections import OrderedDict, namedtuple
+
+'''
+校验结果缓存(memoization)
+
+- 对于同一个装饰器(同一份校验规则)，如果相同的参数值已经校验通过，则再次校验时直接命中缓存，跳过所有校验方法；
+- 只有 "纯" 校验方法(结果只依赖于参数值本身) 才能参与缓存：
+    - 内置校验方法中，除 is_file / is_dir (依赖文件系统状态)、schema_validate (schema.Use 可执行任意函数) 、customize 之外，都是纯校验方法；
+    - customize 使用的自定义函数，需要通过 register_pure_rule 注册后，才被视为纯校验方法；
+- 只缓存 "校验通过" 的结果(以及校验后的参数值，如 is_not_empty 去除空格之后的字符串)，校验失败时每次都重新执行，保证异常信息与未开启缓存时完全一致；
+- 参数值不可哈希或为可变对象(如 list、dict、自定义类的实例)时，自动跳过缓存。
+'''
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# 内置的纯校验方法
+PURE_RULES = frozenset({
+    'is_string', 'is_int', 'is_positive', 'is_float', 'is_number', 'is_list', 'is_dict', 'is_set', 'is_tuple',
+    'is_not_none', 'is_not_empty', 'is_allowed_value', 'is_specific_value', 'max_length', 'min_length',
+    'is_substring', 'is_subset', 'is_sublist', 'contains_substring', 'contains_subset', 'contains_sublist',
+    'is_file_suffix', 'is_method', 'is_bytes', 'is_utf8', 'has_magic', 'byte_size', 'is_aligned',
+    'json_schema_validate',
+})
+
+# 通过 register_pure_rule 注册的纯自定义校验函数
+_pure_functions = set()
+
+# 可以直接作为缓存 key 的不可变类型(使用精确类型匹配，子类可能是可变的)
+_ATOMIC_TYPES = frozenset({str, bytes, int, float, complex, bool, type(None)})
+
+
+def register_pure_rule(func):
+    """
+    将自定义校验函数注册为纯函数，使其在 customize 中使用时可以参与结果缓存。
+
+    纯函数是指：返回结果只依赖于传入的参数，且没有副作用，如格式校验、校验和计算等。
+
+    既可以直接调用，也可以作为装饰器使用：
+
+        @register_pure_rule
+        def is_valid_checksum(value):
+            ...
+
+        @ParameterValidator("card_no", memoize=True).customize(is_valid_checksum)
+        def example_function(card_no):
+            ...
+    """
+    _pure_functions.add(func)
+    return func
+
+
+def is_pure_rule(method_name, args):
+    """
+    判断一条校验规则是否为纯校验规则
+
+    :param method_name: 校验方法名
+    :param args: 校验方法的位置参数，customize 的第一个位置参数为自定义校验函数
+    """
+    if method_name == 'customize':
+        return bool(args) and args[0] in _pure_functions
+    return method_name in PURE_RULES
+
+
+def memo_key(value):
+    """
+    生成参数值的缓存 key，参数值为可变对象或不可哈希时返回 None。
+
+    key 中包含了参数值的类型，避免 1、1.0、True 这些相等且哈希值相同的值共用一个缓存结果。
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value_type, value
+
+    if value_type is tuple or value_type is frozenset:
+        keys = []
+        for item in value:
+            key = memo_key(item)
+            if key is None:
+                return None
+            keys.append(key)
+        return value_type, value_type(keys)
+
+    return None
+
+
+class LRUCache:
+    """
+    带命中统计的线程安全 LRU 缓存
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        :param maxsize: 缓存的最大条目数，超出后淘汰最久未使用的条目
+        """
+        if maxsize <= 0:
+            raise ValueError(f'maxsize must be a positive integer, not {maxsize}')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._data = OrderedDict()
+        # 等价于 threading.Lock()，避免导入 threading 模块
+        self._lock = allocate_lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def add(self, key, value=True):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
@@ -1,25 +1,215 @@
-import inspect
 import os
-from functools import wraps
-from typing import TypeVar, Callable
+from typing import TypeVar, Callable, TYPE_CHECKING, Union
 
-from schema import Schema
+from pyparamvalidate.core.fastpath import FAILED, build_fast_check
+from pyparamvalidate.core.memoize import LRUCache, is_pure_rule, memo_key
+from pyparamvalidate.core.path import compile_accessor, format_path, parse_path
+from pyparamvalidate.core.plan import PARAMETER_STAGE, ValidationPlan, build_wrapper, is_coroutine_function, signature_of
+from pyparamvalidate.core.validator import CallValidateMethodError, Validator
 
-from pyparamvalidate.core.validator import Validator
+if TYPE_CHECKING:
+    from schema import Schema
+
+    from pyparamvalidate.core.container import Rules
 
 Self = TypeVar('Self', bound='ParameterValidator')
 
+# ParameterValidator 自身的属性和方法，访问时不经过校验方法的收集逻辑
+_OWN_ATTRIBUTES = frozenset({
+    'param_name', 'param_rule_des', '_validators', '_cache', '_normalize', '_paths', '_compile', 'cache_info',
+    'cache_clear', '_adaptive', '_optimizer', '_frozen_order', 'rule_order', 'freeze_order', '_deadline',
+    '_rule_wrappers', 'with_deadline', '_async_checks', 'single_flight', '_async_flight', '_skip_missing', '_allow_none',
+})
+
+# 参数未传值
+_MISSING = object()
+
+
+def _variadic_extractor(signature, param_name):
+    """
+    根据函数签名预先计算 *args / **kwargs 参数的取值函数 extract(args, kwargs)，参数不是可变参数时返回 None
+
+    - *args：返回 args 中该参数对应的部分，*args 之前没有其他参数时直接返回 args，不复制
+    - **kwargs：返回 kwargs 中不属于其他命名参数的部分，kwargs 中没有其他命名参数时直接返回 kwargs，不复制
+    """
+    import inspect
+
+    parameters = list(signature.parameters.values())
+    parameter = signature.parameters.get(param_name)
+    if parameter is None:
+        return None
+
+    if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+        start = parameters.index(parameter)
+        if start == 0:
+            return lambda args, kwargs: args
+        return lambda args, kwargs: args[start:]
+
+    if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+        named = frozenset(p.name for p in parameters
+                          if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY))
+        if not named:
+            return lambda args, kwargs: kwargs
+
+        def extract(args, kwargs):
+            if named.isdisjoint(kwargs):
+                return kwargs
+            return {key: value for key, value in kwargs.items() if key not in named}
+
+        return extract
+
+    return None
+
+
+def _make_check(plan: ValidationPlan, param_name, param_rule_des, normalize, field=None, access=None, prefix=None,
+                prefix_access=None, optimizer=None, extract=None, skip_missing=False, allow_none=False) -> Callable:
+    """
+    根据校验计划生成校验函数：校验 param_name 参数，返回(可能被替换了参数值的) args，关键字参数直接在 kwargs 中替换
+
+    :param field: 嵌套字段的路径，如 "payload.user.address.zip"，不校验嵌套字段时为 None
+    :param access: 嵌套字段的访问函数，prefix 不为 None 时，从公共前缀对应的值开始访问
+    :param prefix: 与其他校验函数共享的公共前缀
+    :param prefix_access: 公共前缀的访问函数
+    :param optimizer: 校验规则顺序优化器(见 pyparamvalidate.core.adaptive)，开启 adaptive 时使用优化器中的规则顺序和快速校验函数
+    :param extract: *args / **kwargs 参数的取值函数(见 _variadic_extractor)，参数值不会被替换
+    :param skip_missing: 参数未传值(使用默认值)时是否不校验
+    :param allow_none: 参数值(嵌套字段的值)为 None 时是否不校验
+    """
+    signature, position, keyword, rules, cache, fast_check = plan
+
+    def check(args, kwargs, scope=None):
+        if extract is not None:
+            # *args / **kwargs 参数，使用预先计算的取值函数，不绑定函数签名
+            value = extract(args, kwargs)
+        elif param_name in kwargs:
+            # 如果函数被装饰，且以关键字参数传值，则从 kwargs 中取参数值
+            value = kwargs[param_name]
+        elif position is not None and position < len(args):
+            # 如果函数被装饰，且以位置参数传值，则根据预先计算的参数位置从 args 中取参数值
+            value = args[position]
+        else:
+            # 其他情况(未传值、*args、**kwargs)，使用函数签名绑定参数，未传值时为 None
+            value = signature.bind(*args, **kwargs).arguments.get(param_name, _MISSING)
+            if value is _MISSING:
+                if skip_missing:
+                    return args
+                value = None
+
+        if access is not None:
+            if prefix is not None:
+                # 公共前缀在同一次调用中只访问一次
+                if prefix in scope:
+                    value = scope[prefix]
+                else:
+                    value = scope[prefix] = prefix_access(value)
+            value = access(value)
+
+        if allow_none and value is None:
+            return args
+
+        # 命中缓存，说明该参数值已经校验通过，直接使用缓存的校验结果
+        key = memo_key(value) if cache is not None else None
+        normalized = cache.get(key, FAILED) if key is not None else FAILED
+
+        if normalized is FAILED:
+            # 快速校验不通过时，回退到常规校验流程，由常规流程抛出异常
+            current_fast_check = optimizer.fast_check if optimizer is not None else fast_check
+            if current_fast_check is not None:
+                try:
+                    normalized = current_fast_check(value)
+                except Exception:
+                    pass
+
+            if normalized is FAILED:
+                # 实例化 Validator 对象
+                validator = Validator(value, field=field or param_name, rule_des=param_rule_des)
+
+                if optimizer is not None:
+                    optimizer.validate(validator)
+                else:
+                    # 遍历所有校验器(注意：这里使用 vargs, vkwargs，避免覆盖原函数的 args, kwargs)
+                    for validate_method, vargs, vkwargs in rules:
+                        # 执行校验函数
+                        validate_method(validator, *vargs, **vkwargs)
+
+                normalized = validator.value
+
+            if key is not None:
+                cache.add(key, normalized)
+
+        # 将校验之后的参数值(如 is_not_empty 去除空格、schema_validate 转换之后的值)传给原函数，只在参数值发生变化时重建参数
+        # 嵌套字段不替换，避免修改调用者传入的对象
+        if normalize and access is None and extract is None and normalized is not value:
+            if param_name in kwargs:
+                kwargs[param_name] = normalized
+            elif position is not None and position < len(args):
+                args = (*args[:position], normalized, *args[position + 1:])
+            elif keyword:
+                kwargs[param_name] = normalized
+
+        return args
+
+    return check
+
+
+def _value_key(signature, position, param_name, access=None, extract=None):
+    """
+    返回函数 key(args, kwargs)：参数值的缓存 key(见 memo_key)，用于合并 async 函数的并发相同校验
+    """
+
+    def key(args, kwargs):
+        if extract is not None:
+            value = extract(args, kwargs)
+        elif param_name in kwargs:
+            value = kwargs[param_name]
+        elif position is not None and position < len(args):
+            value = args[position]
+        else:
+            value = signature.bind(*args, **kwargs).arguments.get(param_name)
+        return memo_key(access(value) if access is not None else value)
+
+    return key
+
 
 class ParameterValidator:
-    def __init__(self, param_name: str, param_rule_des=None):
+    def __init__(self, param_name: Union[str, list, tuple], param_rule_des=None, memoize=False, memoize_maxsize=1024,
+                 normalize=False, adaptive=False, adaptive_window=1000, deadline=None, on_timeout='fail',
+                 skip_missing=False, allow_none=False):
         """
-        :param param_name: 参数名
+        :param param_name: 参数名，也可以是嵌套字段的路径，如 "payload.user.address.zip" 或 ["payload", "user", "address", "zip"]，
+                           详见 pyparamvalidate.core.path
         :param param_rule_des: 该参数的规则描述
+        :param memoize: 是否缓存校验通过的参数值，仅对纯校验规则和不可变参数值生效，详见 pyparamvalidate.core.memoize
+        :param memoize_maxsize: 缓存的最大条目数
+        :param normalize: 是否将校验之后的参数值传给被装饰函数，如 is_not_empty 去除前后空格之后的字符串、schema_validate 转换之后的值，
+                          对嵌套字段不生效
+        :param adaptive: 是否根据统计的耗时和不通过率调整纯校验规则的执行顺序，详见 pyparamvalidate.core.adaptive
+        :param adaptive_window: 调整顺序之前统计的常规校验次数
+        :param deadline: 该参数全部校验规则的超时时间(秒)，为 None 时不限制，详见 pyparamvalidate.core.deadline
+        :param on_timeout: 超时之后的处理方式：'fail'、'pass' 或 'skip'
+        :param skip_missing: 参数未传值(使用默认值)时不校验，默认将未传值的参数视为 None 校验
+        :param allow_none: 参数值为 None 时不校验，如 "x: int = None" 允许传入 None，其他值仍然校验
         """
+        if deadline is not None:
+            from pyparamvalidate.core.deadline import check_deadline
+
+            check_deadline(deadline, on_timeout)
+
         self.param_name = param_name
         self.param_rule_des = param_rule_des
 
         self._validators = []
+        self._cache = LRUCache(memoize_maxsize) if memoize else None
+        self._normalize = normalize
+        self._adaptive = adaptive_window if adaptive else None
+        self._optimizer = None
+        self._frozen_order = None
+        self._deadline = (deadline, on_timeout) if deadline is not None else None
+        # 单条校验规则的包装(超时时间、合并并发校验)：[(规则的声明下标, 包装函数 wrap(rules, 规则名))]，按声明顺序包装
+        self._rule_wrappers = []
+        self._async_flight = None
+        self._skip_missing = skip_missing
+        self._allow_none = allow_none
 
     def __getattribute__(self, name: str):
         """
@@ -29,10 +219,10 @@ class ParameterValidator:
         """
 
         '''
-        如果获取到的属性名为 param_name 、param_rule_des 、 _validators , 则使用 object.__getattribute__(self, name) 直接获取对象的属性值。
+        如果获取到的属性名为 param_name 、param_rule_des 、 _validators 等自身属性(见 _OWN_ATTRIBUTES), 则使用 object.__getattribute__(self, name) 直接获取对象的属性值。
         不对 self.param_name 、 self.param_rule_des 、 self._validators 做改变
         '''
-        if name in ['param_name', 'param_rule_des', '_validators']:
+        if name in _OWN_ATTRIBUTES:
             return object.__getattribute__(self, name)
 
         '''
@@ -56,33 +246,207 @@ class ParameterValidator:
         return validator_method
 
     def __call__(self, func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # 获取函数的参数和参数值
-            bound_args = inspect.signature(func).bind(*args, **kwargs).arguments
-
-            if self.param_name in kwargs:
-                # 如果函数被装饰，且以关键字参数传值，则从 kwargs 中取参数值
-                value = kwargs[self.param_name]
+        """
+        装饰函数时只生成 wrapper，校验计划在第一次调用时编译(或通过 pyparamvalidate.warmup() 提前编译)，
+        降低大量函数被装饰时的 import 耗时；多个校验装饰器叠加使用时，合并为一个 wrapper，详见 pyparamvalidate.core.plan
+        """
+        return build_wrapper(func, self, PARAMETER_STAGE)
+
+    def with_deadline(self, seconds, on_timeout=None) -> Self:
+        """
+        为上一条校验规则设置超时时间，如 .customize(user_exists).with_deadline(0.2)
+
+        :param seconds: 超时时间(秒)
+        :param on_timeout: 超时之后的处理方式，为 None 时与参数的 on_timeout 相同
+        """
+        # 超时时间、合并并发校验、自适应顺序只在使用时导入对应的模块，降低 import pyparamvalidate 的耗时
+        from pyparamvalidate.core.deadline import check_deadline, timed_rule
+
+        if not self._validators:
+            raise CallValidateMethodError('with_deadline must follow a validate method')
+        on_timeout = on_timeout or (self._deadline[1] if self._deadline is not None else 'fail')
+        check_deadline(seconds, on_timeout)
+        self._rule_wrappers.append((len(self._validators) - 1,
+                                    lambda rules, name: timed_rule(rules, seconds, on_timeout, name)))
+        return self
+
+    def single_flight(self, max_concurrency=None) -> Self:
+        """
+        合并上一条校验规则的并发相同校验，并限制同时执行的次数，详见 pyparamvalidate.core.single_flight
+
+        :param max_concurrency: 该规则同时执行的最大次数，为 None 时不限制
+        """
+        from pyparamvalidate.core.single_flight import AsyncSingleFlight, SingleFlight, shared_rule
+
+        if not self._validators:
+            raise CallValidateMethodError('single_flight must follow a validate method')
+        if max_concurrency is not None and max_concurrency < 1:
+            raise CallValidateMethodError(f'max_concurrency must be a positive integer, not {max_concurrency}')
+        # 一个 ParameterValidator 的所有被装饰函数共用合并状态和并发数限制
+        flight = SingleFlight(max_concurrency)
+        self._rule_wrappers.append((len(self._validators) - 1, lambda rules, name: shared_rule(rules, flight, name)))
+        if self._async_flight is None:
+            self._async_flight = AsyncSingleFlight()
+        return self
+
+    def _async_checks(self):
+        """
+        设置了超时时间或合并并发校验时，async 函数使用 async wrapper，校验不阻塞事件循环
+        """
+        return self._deadline is not None or bool(self._rule_wrappers)
+
+    def _paths(self):
+        """
+        返回校验的嵌套字段路径列表，不校验嵌套字段时返回空列表
+        """
+        path = parse_path(self.param_name)
+        return [path] if len(path) > 1 else []
+
+    def _compile(self, func: Callable, prefixes=None) -> Callable:
+        """
+        编译校验计划，返回校验函数 check(args, kwargs, scope) -> args
+
+        :param prefixes: 同一个被装饰函数上所有嵌套字段路径的公共前缀，见 pyparamvalidate.core.path.shared_prefixes
+        """
+        # inspect 的导入耗时较长，延迟到编译校验计划时再导入，降低 import pyparamvalidate 的耗时
+        import inspect
+
+        from pyparamvalidate.core.adaptive import RuleOptimizer
+        from pyparamvalidate.core.deadline import async_check, timed_rule
+        from pyparamvalidate.core.fusion import dedupe_rules, fuse_rules
+
+        signature = signature_of(func)
+        path = parse_path(self.param_name)
+        param_name = path[0]
+
+        # 预先计算参数的位置，调用时不再使用 signature.bind 绑定全部参数
+        parameter = signature.parameters.get(param_name)
+        kind = parameter.kind if parameter is not None else None
+        positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        position = list(signature.parameters).index(param_name) if kind in positional else None
+        keyword = kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        extract = _variadic_extractor(signature, param_name)
+
+        # 通过 函数名 反射获取校验函数对象
+        rules = tuple((getattr(Validator, name), vargs, vkwargs) for name, vargs, vkwargs in self._validators)
+        names = [(name, vargs) for name, vargs, _ in self._validators]
+
+        # 设置了超时时间、合并并发校验的规则，包装为一条新的(非纯校验)规则，
+        # 详见 pyparamvalidate.core.deadline 和 pyparamvalidate.core.single_flight
+        if self._rule_wrappers:
+            rules = list(rules)
+            for index, wrap in self._rule_wrappers:
+                rules[index] = (wrap((rules[index],), self._validators[index][0]), (), {})
+                names[index] = (rules[index][0].__name__, ())
+            rules = tuple(rules)
+
+        # 未开启 adaptive 时，按 freeze_order 指定的顺序执行(开启 adaptive 时由优化器管理顺序)
+        if self._frozen_order is not None and self._adaptive is None:
+            if len(self._frozen_order) != len(rules):
+                raise CallValidateMethodError(f'rule order {self._frozen_order} does not match the {len(rules)} rules '
+                                              f'of "{self.param_name}"')
+            rules = tuple(rules[index] for index in self._frozen_order)
+            names = [names[index] for index in self._frozen_order]
+
+        # 只有全部校验规则都是纯校验规则时，才启用缓存；超时之后视为通过的参数值不能缓存
+        cache = self._cache
+        if cache is not None and (self._deadline is not None
+                                  or not all(is_pure_rule(name, vargs) for name, vargs in names)):
+            cache = None
+
+        # lazy_each 将参数值替换为校验迭代器，总是需要将校验之后的参数值传给被装饰函数
+        lazy = any(name == 'lazy_each' for name, _, _ in self._validators)
+        if lazy and len(path) > 1:
+            raise CallValidateMethodError(f'lazy_each can not be used on nested field "{format_path(path)}"')
+        if lazy and extract is not None:
+            raise CallValidateMethodError(f'lazy_each can not be used on variadic parameter "{param_name}"')
+
+        # 开启 adaptive 时，所有被装饰函数共用一个优化器，统计结果和学习到的顺序也是共用的
+        optimizer = None
+        if self._adaptive is not None:
+            if self._optimizer is None:
+                self._optimizer = RuleOptimizer(rules, names, self._adaptive, self._frozen_order)
+            optimizer = self._optimizer
+
+        # 规范化校验规则链：删除重复的规则，合并连续的纯校验规则，详见 pyparamvalidate.core.fusion
+        # 开启 adaptive 时，规则顺序由优化器按声明下标管理，不做规范化
+        if optimizer is None:
+            rules = dedupe_rules(rules)
+            fast_check = build_fast_check(rules)
+            rules = fuse_rules(rules, fast_check)
+        else:
+            fast_check = None
+
+        # 参数的超时时间：同步函数将全部校验规则包装为一条规则；async 函数在 async 校验函数中等待，见下文
+        asynchronous = self._async_checks() and is_coroutine_function(func)
+        if self._deadline is not None and not asynchronous:
+            if optimizer is not None:
+                raise CallValidateMethodError('deadline can not be used with adaptive, use with_deadline on slow rules instead')
+            seconds, on_timeout = self._deadline
+            # 快速校验在调用线程中执行，不受超时时间限制(纯校验规则也可能很慢，如 register_pure_rule 登记的函数)，因此不使用
+            fast_check = None
+            rules = ((timed_rule(rules, seconds, on_timeout, 'validation'), (), {}),)
+
+        plan = ValidationPlan(signature, position, keyword, rules, cache, fast_check)
+        skip = {'skip_missing': self._skip_missing, 'allow_none': self._allow_none}
+        if len(path) == 1:
+            check = _make_check(plan, param_name, self.param_rule_des, self._normalize or lazy, optimizer=optimizer,
+                                extract=extract, **skip)
+        else:
+            # 嵌套字段：将路径编译为访问函数，有公共前缀时拆分为 "公共前缀" 和 "剩余路径" 两个访问函数
+            prefix = (prefixes or {}).get(path)
+            if prefix is None:
+                check = _make_check(plan, param_name, self.param_rule_des, self._normalize, format_path(path),
+                                    compile_accessor(path[1:]), optimizer=optimizer, extract=extract, **skip)
             else:
-                # 如果函数被装饰，且以位置参数传值，则从 bound_args 中取参数值
-                value = bound_args.get(self.param_name)
+                check = _make_check(plan, param_name, self.param_rule_des, self._normalize, format_path(path),
+                                    compile_accessor(path[len(prefix):]), prefix, compile_accessor(prefix[1:]),
+                                    optimizer, extract, **skip)
+
+        if asynchronous:
+            # async 函数：校验在线程池中执行，使用 asyncio.wait 等待参数的超时时间
+            seconds, on_timeout = self._deadline or (None, 'fail')
+            # 同一个事件循环中参数值相同的并发校验只提交一次，需要替换参数值时不合并(每次调用的 args 不同)
+            flight = self._async_flight if not (self._normalize or lazy) else None
+            key = _value_key(signature, position, param_name, compile_accessor(path[1:]) if len(path) > 1 else None,
+                             extract)
+            return async_check(check, format_path(path), seconds, on_timeout, flight, key)
+        return check
+
+    def cache_info(self):
+        """
+        返回缓存的统计信息 CacheInfo(hits, misses, maxsize, currsize)，未开启 memoize 时返回 None
+        """
+        return self._cache.info() if self._cache is not None else None
 
-            # 实例化 Validator 对象
-            validator = Validator(value, field=self.param_name, rule_des=self.param_rule_des)
+    def cache_clear(self):
+        if self._cache is not None:
+            self._cache.clear()
 
-            # 遍历所有校验器(注意：这里使用 vargs, vkwargs，避免覆盖原函数的 args, kwargs)
-            for method_name, vargs, vkwargs in self._validators:
-                # 通过 函数名 反射获取校验函数对象
-                validate_method = getattr(validator, method_name)
+    def rule_order(self):
+        """
+        返回校验规则的执行顺序(声明下标元组)，如 (1, 0) 表示先执行第二条规则
+        """
+        if self._optimizer is not None:
+            return self._optimizer.order
+        return self._frozen_order or tuple(range(len(self._validators)))
 
-                # 执行校验函数
-                validate_method(*vargs, **vkwargs)
+    def freeze_order(self, order=None):
+        """
+        停止学习，固定校验规则的执行顺序；未开启 adaptive 时，编译校验计划时按该顺序执行
 
-            # 执行原函数
-            return func(*args, **kwargs)
+        :param order: 执行顺序(rule_order() 的返回值)，为 None 时固定当前顺序
+        :raise ValueError: 执行顺序移动了类型校验规则之后的规则或非纯校验规则
+        """
+        if self._optimizer is not None:
+            self._optimizer.freeze(order)
+        else:
+            from pyparamvalidate.core.adaptive import check_order, rule_kind
 
-        return wrapper
+            order = tuple(order) if order is not None else self.rule_order()
+            if not check_order(tuple(rule_kind(name, vargs) for name, vargs, _ in self._validators), order):
+                raise ValueError(f'invalid rule order {order}, type guards and impure rules can not be moved')
+            self._frozen_order = order
 
     '''
     ==============================分隔符===============================
@@ -104,7 +468,7 @@ class ParameterValidator:
     - 方便链式调用，如： @ParameterValidator("param").is_string().is_not_empty()
     '''
 
-    def schema_validate(self, schema: Schema) -> Self:
+    def schema_validate(self, schema: 'Schema') -> Self:
         """
         schema 官方参考文档： https://pypi.org/project/schema/
 
@@ -146,6 +510,16 @@ class ParameterValidator:
         """
         ...
 
+    def json_schema_validate(self, json_schema: dict, exception_msg=None) -> Self:
+        """
+        使用 JSON Schema 校验：
+
+            @ParameterValidator("user").json_schema_validate({"type": "object", "required": ["name"]})
+            def example_function(user):
+                ...
+        """
+        ...
+
     def customize(self, validate_method, *args, exception_msg=None, **kwargs) -> Self:
         """
         注意事项：请参考示例 3
@@ -194,6 +568,10 @@ class ParameterValidator:
     def is_float(self, exception_msg=None):
         return isinstance(self.value, float)
 
+    def is_number(self, exception_msg=None):
+        # int 或 float，不包括 bool，与类型注解 float 一致(PEP 484：注解为 float 时也接受 int)
+        return isinstance(self.value, (int, float)) and not isinstance(self.value, bool)
+
     def is_list(self, exception_msg=None):
         return isinstance(self.value, list)
 
@@ -253,3 +631,67 @@ class ParameterValidator:
 
     def is_method(self, exception_msg=None):
         return callable(self.value)
+
+    def file_size(self, min_size=None, max_size=None, exception_msg=None) -> Self:
+        ...
+
+    def file_magic(self, magic, offset=0, exception_msg=None) -> Self:
+        ...
+
+    def is_utf8_file(self, exception_msg=None) -> Self:
+        ...
+
+    def max_file_lines(self, max_lines, exception_msg=None) -> Self:
+        ...
+
+    def has_csv_header(self, columns, delimiter=',', exact=False, encoding='utf-8', exception_msg=None) -> Self:
+        ...
+
+    def is_json_file(self, root=None, exception_msg=None) -> Self:
+        ...
+
+    def is_bytes(self, exception_msg=None) -> Self:
+        ...
+
+    def is_utf8(self, exception_msg=None) -> Self:
+        ...
+
+    def has_magic(self, magic, offset=0, exception_msg=None) -> Self:
+        ...
+
+    def byte_size(self, min_size=None, max_size=None, exception_msg=None) -> Self:
+        ...
+
+    def is_aligned(self, alignment=None, itemsize=None, exception_msg=None) -> Self:
+        ...
+
+    def each(self, rules: 'Rules', exception_msg=None, sample=None, seed=None, confidence=None, tolerance=0.01,
+             edge=10) -> Self:
+        """
+        校验容器中的每个元素，超大容器可以使用抽样校验：
+
+            @ParameterValidator("ids").is_list().each(Rules().is_int().is_positive())
+            @ParameterValidator("rows").is_list().each(Rules().is_dict(), sample=1000, seed=0)
+            def example_function(ids, rows):
+                ...
+        """
+        ...
+
+    def keys(self, rules: 'Rules', exception_msg=None) -> Self:
+        ...
+
+    def values(self, rules: 'Rules', exception_msg=None) -> Self:
+        ...
+
+    def values_matching(self, pattern, rules: 'Rules', exception_msg=None) -> Self:
+        ...
+
+    def lazy_each(self, rules: 'Rules' = None, max_count=None, exception_msg=None) -> Self:
+        """
+        将参数值替换为校验迭代器，在被装饰函数迭代时逐个校验元素：
+
+            @ParameterValidator("rows").lazy_each(Rules().is_dict(), max_count=100000)
+            def example_function(rows):
+                ...
+        """
+        ...
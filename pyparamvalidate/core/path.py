@@ -0,0 +1,108 @@
+from functools import lru_cache
+
+'''
+嵌套字段路径
+
+ParameterValidator 和 Validator 可以只校验参数中的某个嵌套字段，而不是整个参数：
+
+    @ParameterValidator("payload.user.address.zip").is_string().max_length(6)
+    @ParameterValidator(["payload", "items", 0, "id"]).is_int()
+    def example_function(payload):
+        ...
+
+- 路径可以是以 "." 分隔的字符串，也可以是列表 / 元组，第一个元素为参数名；
+- 字符串路径中的纯数字片段视为整数下标(如 "items.0.id")，如果需要使用数字字符串作为 key，请使用列表形式的路径；
+- 每一层优先使用下标访问(obj[key])，对象不支持下标访问时使用属性访问(getattr(obj, key))；
+- 路径中任意一层不存在(KeyError、IndexError、AttributeError)时，字段值为 None，与参数未传值时一致；
+- 路径在编译校验计划时解析为访问函数，同一个被装饰函数上的多个路径共享公共前缀，每次调用时公共前缀只访问一次。
+'''
+
+
+def parse_path(path):
+    """
+    解析路径，返回元组，如 "payload.items.0.id" -> ("payload", "items", 0, "id")
+    """
+    if isinstance(path, (list, tuple)):
+        return tuple(path)
+    return tuple(int(key) if key.isdigit() else key for key in path.split('.'))
+
+
+def format_path(keys):
+    return '.'.join(str(key) for key in keys)
+
+
+def _slow_access(obj, keys):
+    for key in keys:
+        try:
+            obj = obj[key]
+        except (KeyError, IndexError):
+            return None
+        except TypeError:
+            # 对象不支持下标访问(或 key 类型不匹配)时，使用属性访问
+            if not isinstance(key, str):
+                return None
+            obj = getattr(obj, key, None)
+        if obj is None:
+            return None
+    return obj
+
+
+def compile_accessor(keys):
+    """
+    将路径编译为访问函数 access(obj) -> value
+
+    :param keys: 路径(不包括参数名)
+    """
+    keys = tuple(keys)
+    if not keys:
+        return lambda obj: obj
+
+    def access(obj):
+        # 绝大多数情况下每一层都是 dict / list，直接使用下标访问，出现异常时再逐层判断
+        value = obj
+        try:
+            for key in keys:
+                value = value[key]
+            return value
+        except (KeyError, IndexError):
+            return None
+        except TypeError:
+            return _slow_access(obj, keys)
+
+    return access
+
+
+@lru_cache(maxsize=1024)
+def _cached_accessor(keys):
+    return compile_accessor(keys)
+
+
+def resolve_path(obj, path):
+    """
+    获取 obj 中 path 对应的值，path 为字符串或列表，编译结果会被缓存
+    """
+    return _cached_accessor(parse_path(path))(obj)
+
+
+def shared_prefixes(paths):
+    """
+    计算多个路径的公共前缀
+
+    :param paths: 路径列表，每个路径的第一个元素为参数名
+    :return: {路径: 公共前缀}，公共前缀至少包括参数名和一层 key，没有公共前缀的路径不出现在结果中
+    """
+    result = {}
+    for index, path in enumerate(paths):
+        best = 0
+        for other_index, other in enumerate(paths):
+            if other_index == index:
+                continue
+            length = 0
+            for a, b in zip(path, other):
+                if a != b:
+                    break
+                length += 1
+            best = max(best, length)
+        if best >= 2:
+            result[path] = path[:best]
+    return result
@@ -0,0 +1,212 @@
+import gc
+from collections import namedtuple
+from functools import wraps
+from weakref import WeakKeyDictionary, WeakSet
+
+from pyparamvalidate.core.path import shared_prefixes
+
+'''
+校验计划(validation plan)
+
+- ParameterValidator 装饰函数时只做最少的工作：收集校验规则、生成 wrapper，并将编译函数登记到 _registry 中；
+- 多个校验装饰器叠加使用时，合并为一个 wrapper：只有一层函数调用，先执行所有参数校验，再执行跨参数校验(见 CrossParameterValidator)；
+- 被装饰函数第一次调用时，才会编译校验计划：解析函数签名和参数位置、通过函数名解析校验方法、判断能否启用缓存；
+- 对于 gunicorn / uWSGI 等预派生(prefork)服务，可以在主进程 fork 之前调用 warmup() 提前编译所有校验计划，
+  避免每个 worker 在第一次调用时重复编译。
+
+校验计划使用 namedtuple / tuple 保存，编译完成后不再修改，配合 warmup(freeze=True) 调用 gc.freeze()，
+可以避免 fork 之后垃圾回收扫描这些对象而触发 copy-on-write。
+'''
+
+'''
+- signature: 被装饰函数的签名(inspect.Signature)
+- position: 参数的位置下标，参数不能以位置参数传值(如仅限关键字参数、*args、**kwargs)时为 None
+- keyword: 参数能否以关键字参数传值
+- rules: 校验规则，元素为 (校验方法, 位置参数, 关键字参数)，校验方法为 Validator 类中的函数，调用时第一个参数传入 Validator 实例
+- cache: 校验结果缓存(LRUCache)，不能启用缓存时为 None
+- fast_check: 快速校验函数(见 pyparamvalidate.core.fastpath)，不支持快速校验时为 None
+'''
+ValidationPlan = namedtuple('ValidationPlan', ['signature', 'position', 'keyword', 'rules', 'cache', 'fast_check'])
+
+# 校验阶段：同一个被装饰函数上的校验装饰器，先按阶段排序，同一阶段内外层装饰器先执行
+PARAMETER_STAGE = 0
+CROSS_PARAMETER_STAGE = 1
+# 返回值校验在被装饰函数执行之后，校验函数为 check(result) -> result
+RETURN_STAGE = 2
+
+# 代码对象的 co_flags 中表示 async 函数的标记位(inspect.CO_COROUTINE)
+_CO_COROUTINE = 0x80
+
+# 被装饰函数的签名缓存，同一个函数上的多个校验装饰器只解析一次签名
+_signatures = WeakKeyDictionary()
+
+# 所有被装饰函数的编译函数，使用弱引用，不影响被装饰函数的回收
+_registry = WeakSet()
+
+# build_wrapper 生成的所有 wrapper：第三方装饰器使用 functools.wraps 时会复制 __pyparamvalidate__ 属性，
+# 只有这里登记的 wrapper 才能合并，否则夹在中间的装饰器会被跳过
+_wrappers = WeakSet()
+
+
+def register_plan(compile_plan):
+    """
+    登记一个校验计划的编译函数，compile_plan 无参数，返回编译好的校验计划(重复调用时返回同一个对象)
+    """
+    _registry.add(compile_plan)
+
+
+def validation_stack(func):
+    """
+    func 是 build_wrapper 生成的 wrapper 时，返回 (被装饰函数, 校验装饰器)，否则返回 None
+    """
+    try:
+        built = func in _wrappers
+    except TypeError:
+        # 不支持弱引用的对象
+        return None
+    return func.__pyparamvalidate__ if built else None
+
+
+def is_coroutine_function(func):
+    """
+    判断 func 是否为 async 函数，不导入 inspect
+    """
+    code = getattr(func, '__code__', None)
+    return code is not None and bool(code.co_flags & _CO_COROUTINE)
+
+
+def signature_of(func):
+    """
+    返回 func 的签名(inspect.Signature)，结果按函数对象缓存
+    """
+    signature = _signatures.get(func)
+    if signature is None:
+        import inspect
+
+        signature = _signatures[func] = inspect.signature(func)
+    return signature
+
+
+def build_wrapper(func, decorator, stage):
+    """
+    生成被装饰函数的 wrapper
+
+    :param func: 被装饰函数，如果是 build_wrapper 生成的 wrapper(多个校验装饰器叠加使用)，则与其合并为一个 wrapper；
+                 如果是 classmethod / staticmethod 对象，则包装其中的函数，并返回同类型的对象
+    :param decorator: 校验装饰器，需要实现：
+                      - _paths()：返回校验的嵌套字段路径列表
+                      - _compile(func, prefixes)：返回校验函数 check(args, kwargs, scope) -> args，prefixes 为 shared_prefixes 的返回值
+                      - _async_checks()(可选)：是否需要 async wrapper，为 True 且 func 是 async 函数时，
+                        wrapper 是 async 函数，check 可以返回 awaitable(见 pyparamvalidate.core.deadline)
+    :param stage: 校验阶段，PARAMETER_STAGE、CROSS_PARAMETER_STAGE 或 RETURN_STAGE(此时 _compile 返回 check(result) -> result)
+    """
+    if isinstance(func, (classmethod, staticmethod)):
+        # classmethod 的 cls 与实例方法的 self 一样，调用时位于 args[0]，参数位置按完整签名计算即可
+        return type(func)(build_wrapper(func.__func__, decorator, stage))
+
+    decorators = ((stage, decorator),)
+    stack = validation_stack(func)
+    if stack is not None:
+        func, inner_decorators = stack
+        # sorted 是稳定排序，同一阶段内保持外层装饰器在前
+        decorators = tuple(sorted(decorators + inner_decorators, key=lambda item: item[0]))
+
+    plan = None
+
+    def compile_plan():
+        nonlocal plan
+        if plan is None:
+            # 同一个被装饰函数上的所有嵌套字段路径，计算公共前缀，每次调用时公共前缀只访问一次
+            prefixes = shared_prefixes([path for _, decorator in decorators for path in decorator._paths()])
+            checks = tuple(decorator._compile(func, prefixes) for stage, decorator in decorators
+                           if stage != RETURN_STAGE)
+            result_checks = tuple(decorator._compile(func, prefixes) for stage, decorator in decorators
+                                  if stage == RETURN_STAGE)
+            plan = (checks, bool(prefixes), result_checks)
+        return plan
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        checks, scoped, result_checks = plan or compile_plan()
+
+        # scope 用于在同一次调用的多个校验函数之间共享嵌套字段公共前缀的访问结果
+        scope = {} if scoped else None
+        for check in checks:
+            args = check(args, kwargs, scope)
+
+        # 执行原函数
+        result = func(*args, **kwargs)
+
+        for check in result_checks:
+            result = check(result)
+        return result
+
+    if is_coroutine_function(func) and any(getattr(decorator, '_async_checks', lambda: False)()
+                                           for _, decorator in decorators):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            checks, scoped, result_checks = plan or compile_plan()
+
+            scope = {} if scoped else None
+            for check in checks:
+                args = check(args, kwargs, scope)
+                # 同步校验函数总是返回 tuple，其他返回值是 async 校验函数返回的 awaitable
+                if type(args) is not tuple:
+                    args = await args
+
+            result = func(*args, **kwargs)
+
+            for check in result_checks:
+                result = check(result)
+            return await result
+
+        wrapper = async_wrapper
+
+    wrapper.__pyparamvalidate__ = (func, decorators)
+    wrapper.__pyparamvalidate_compile__ = compile_plan
+    _wrappers.add(wrapper)
+    register_plan(compile_plan)
+    return wrapper
+
+
+def compile_wrapper(wrapper):
+    """
+    立即编译 build_wrapper 生成的 wrapper 的校验计划，wrapper 可以是 classmethod / staticmethod 对象
+    """
+    if isinstance(wrapper, (classmethod, staticmethod)):
+        wrapper = wrapper.__func__
+    wrapper.__pyparamvalidate_compile__()
+
+
+def compile_all():
+    """
+    编译所有已登记的校验计划，返回编译的数量
+    """
+    compile_plans = list(_registry)
+    for compile_plan in compile_plans:
+        compile_plan()
+    return len(compile_plans)
+
+
+def warmup(freeze=False):
+    """
+    预热：在 prefork 服务的主进程中，fork worker 之前调用，提前编译所有校验计划。
+
+    :param freeze: 是否在编译完成后调用 gc.freeze()，将当前所有对象移入永久代，
+                   fork 之后垃圾回收不会再扫描(写入)这些对象，避免触发 copy-on-write
+    :return: 编译的校验计划数量
+
+    示例(gunicorn 配置文件，需开启 preload_app，使应用在主进程中加载)：
+
+        import pyparamvalidate
+
+        preload_app = True
+
+        def when_ready(server):
+            pyparamvalidate.warmup(freeze=True)
+    """
+    count = compile_all()
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return count
@@ -0,0 +1,211 @@
+from pyparamvalidate.core.class_validator import annotation_rule
+from pyparamvalidate.core.code_cache import compile_source
+from pyparamvalidate.core.container import Rules, compile_rules
+from pyparamvalidate.core.fastpath import generate_check_lines
+
+'''
+生成带校验的 dataclass __init__
+
+大量创建的记录对象(如每批数百万条)，先创建 dataclass 再为每个字段实例化 Validator 校验，开销远大于创建对象本身。
+validated_dataclass 与 dataclasses 一样，根据字段声明生成 __init__ 的源码，并将字段的校验规则直接生成在 __init__ 中：
+
+    from dataclasses import field
+
+    @validated_dataclass(slots=True)
+    class Point:
+        x: int
+        y: int = 0
+        name: str = field(default="", metadata={"rules": Rules().max_length(32)})
+
+生成的 __init__ 类似于：
+
+    def __init__(self, x, y=__pv_d3, name=__pv_d4):
+        __pv_value = x
+        __pv_failed = True
+        try:
+            if not (isinstance(__pv_value, int)):
+                raise ValueError
+            __pv_failed = False
+        except Exception:
+            pass
+        if __pv_failed:
+            __pv_v2(x)
+        ...
+        self.x = x
+        self.y = y
+        self.name = name
+
+- 字段的校验规则由类型注解(见 pyparamvalidate.core.class_validator.annotation_rule)和 metadata["rules"] 组成，
+  默认值为 None 的字段允许传入 None(此时不校验)，其他值仍然校验；
+- 支持快速校验的规则(见 pyparamvalidate.core.fastpath)直接生成为表达式，不通过时(或其他规则)使用常规校验流程，
+  抛出与 Validator 一致的异常信息，字段名即异常信息中的参数名；
+- 其他参数(slots、frozen、kw_only 等)原样传给 dataclasses.dataclass，default_factory、init=False、__post_init__ 的处理与 dataclasses 相同；
+- 生成的源码中，内部使用的名称以 __pv_ 开头，避免与字段名冲突；
+- 生成的源码只与字段名和校验规则的 "形状" 有关，通过 pyparamvalidate.core.code_cache 编译缓存；
+- 不支持 InitVar 字段。
+'''
+
+# metadata 中校验规则的 key
+RULES_METADATA_KEY = 'rules'
+
+# __init__ 的工厂函数缓存：{源码: make_init}
+_factories = {}
+
+
+class _Factory:
+    def __repr__(self):
+        return '<factory>'
+
+
+# 使用 default_factory 的字段的参数默认值
+_FACTORY = _Factory()
+
+
+def _field_rules(field):
+    """
+    返回 (字段的校验规则 Rules, 是否允许 None)，没有校验规则时 Rules 为 None
+    """
+    rules = Rules()
+    rule = annotation_rule(field.type)
+    if rule is not None:
+        getattr(rules, rule)()
+
+    extra = field.metadata.get(RULES_METADATA_KEY)
+    if extra is not None:
+        if not isinstance(extra, Rules):
+            from pyparamvalidate.core.validator import CallValidateMethodError
+
+            raise CallValidateMethodError(f'metadata["{RULES_METADATA_KEY}"] of field "{field.name}" must be a instance '
+                                          f'of Rules, not {type(extra)}')
+        rules._validators.extend(extra._validators)
+    # 与 class_validator 一致：默认值为 None 的字段允许传入 None
+    return (rules if rules._validators else None), rule is not None and field.default is None
+
+
+def _slow_validate(plan, name):
+    def validate(value):
+        plan.validate(value, name, None)
+
+    return validate
+
+
+def generate_init(cls, fields, frozen):
+    """
+    生成 __init__ 的源码
+
+    :return: (源码, 闭包常量 {名称: 值})
+    """
+    import dataclasses
+
+    constants = {'__pv_FACTORY': _FACTORY, '__pv_setattr': object.__setattr__}
+
+    def constant(value, prefix='c'):
+        name = f'__pv_{prefix}{len(constants)}'
+        constants[name] = value
+        return name
+
+    positional = []
+    keyword_only = []
+    body = []
+    assignments = []
+    for field in fields:
+        has_default = field.default is not dataclasses.MISSING
+        has_factory = field.default_factory is not dataclasses.MISSING
+
+        if not field.init:
+            # init=False 的字段，与 dataclasses 一样只设置默认值
+            if has_default:
+                assignments.append((field.name, constant(field.default, 'd')))
+            elif has_factory:
+                assignments.append((field.name, f'{constant(field.default_factory, "f")}()'))
+            continue
+
+        parameter = field.name
+        if has_default:
+            parameter = f'{field.name}={constant(field.default, "d")}'
+        elif has_factory:
+            parameter = f'{field.name}=__pv_FACTORY'
+            body.append(f'        if {field.name} is __pv_FACTORY:')
+            body.append(f'            {field.name} = {constant(field.default_factory, "f")}()')
+        (keyword_only if getattr(field, 'kw_only', False) is True else positional).append(parameter)
+
+        rules, allow_none = _field_rules(field)
+        if rules is not None:
+            plan = compile_rules(rules)
+            validate = constant(_slow_validate(plan, field.name), 'v')
+            indent = '        '
+            if allow_none:
+                body.append(f'        if {field.name} is not None:')
+                indent += '    '
+            lines = generate_check_lines(plan.rules, constant, indent + '    ', 'raise ValueError', '__pv_value')
+            if lines:
+                # 快速校验不通过或抛出异常时，使用常规校验流程，由常规流程抛出异常；
+                # 常规校验在 except 之外执行，异常不会带上快速校验的 ValueError 作为上下文(__context__)
+                body.append(f'{indent}__pv_value = {field.name}')
+                body.append(f'{indent}__pv_failed = True')
+                body.append(f'{indent}try:')
+                body.extend(lines)
+                body.append(f'{indent}    __pv_failed = False')
+                body.append(f'{indent}except Exception:')
+                body.append(f'{indent}    pass')
+                body.append(f'{indent}if __pv_failed:')
+                body.append(f'{indent}    {validate}({field.name})')
+            else:
+                body.append(f'{indent}{validate}({field.name})')
+
+        assignments.append((field.name, field.name))
+
+    for name, expression in assignments:
+        if frozen:
+            body.append(f'        __pv_setattr(self, {name!r}, {expression})')
+        else:
+            body.append(f'        self.{name} = {expression}')
+    if hasattr(cls, '__post_init__'):
+        body.append('        self.__post_init__()')
+
+    parameters = ['self', *positional, *(['*', *keyword_only] if keyword_only else [])]
+    source = '\n'.join([
+        f'def make_init({", ".join(constants)}):',
+        f'    def __init__({", ".join(parameters)}):',
+        *(body or ['        pass']),
+        '    return __init__',
+        '',
+    ])
+    return source, constants
+
+
+def validated_dataclass(cls=None, **dataclass_options):
+    """
+    类装饰器：创建 dataclass，并生成带字段校验的 __init__，详见 pyparamvalidate.core.record
+
+    可以直接使用 @validated_dataclass，也可以指定 dataclasses.dataclass 的参数，如 @validated_dataclass(slots=True, frozen=True)
+    """
+    if cls is None:
+        return lambda cls: validated_dataclass(cls, **dataclass_options)
+
+    import dataclasses
+
+    from pyparamvalidate.core.validator import CallValidateMethodError
+
+    cls = dataclasses.dataclass(cls, **dataclass_options)
+    fields = dataclasses.fields(cls)
+
+    # dataclasses.fields 不包含 InitVar 字段
+    names = {field.name for field in fields}
+    for name, field in cls.__dataclass_fields__.items():
+        if name not in names and (isinstance(field.type, dataclasses.InitVar)
+                                  or (isinstance(field.type, str) and 'InitVar' in field.type)):
+            raise CallValidateMethodError(f'InitVar field "{name}" is not supported by validated_dataclass')
+
+    source, constants = generate_init(cls, fields, dataclass_options.get('frozen', False))
+    factory = _factories.get(source)
+    if factory is None:
+        namespace = {}
+        exec(compile_source(source, f'<pyparamvalidate {cls.__qualname__}.__init__>'), namespace)
+        factory = _factories[source] = namespace['make_init']
+
+    init = factory(*constants.values())
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    init.__module__ = cls.__module__
+    cls.__init__ = init
+    return cls
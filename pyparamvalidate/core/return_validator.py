@@ -0,0 +1,150 @@
+from typing import TypeVar, Callable
+
+from pyparamvalidate.core.fastpath import FAILED, build_fast_check
+from pyparamvalidate.core.fusion import dedupe_rules, fuse_rules
+from pyparamvalidate.core.plan import RETURN_STAGE, build_wrapper
+from pyparamvalidate.core.validator import CallValidateMethodError, Validator
+
+'''
+返回值校验
+
+ReturnValidator 使用与 ParameterValidator 相同的校验方法，校验被装饰函数的返回值：
+
+    @ReturnValidator().is_list().each(Rules().is_dict())
+    @ParameterValidator("user_id").is_int()
+    def example_function(user_id):
+        ...
+
+- 与 ParameterValidator、CrossParameterValidator 叠加使用时合并为一个 wrapper，被装饰函数执行之后校验返回值；
+- 校验规则与参数校验一样编译：删除重复规则、合并连续的纯校验规则、优先使用快速校验函数，不通过时回退到常规校验流程；
+- async 函数：校验 await 之后的结果；生成器函数：校验每一个 yield 的元素(异常信息中的字段为 yield[下标])，
+  生成器的 send / throw / close 会转发给原生成器；async 生成器只转发迭代，不转发 asend / athrow；
+- sample_rate 小于 1 时按比例抽样校验(生成器按调用抽样，抽中时校验全部元素)，用于在生产环境中长期开启返回值校验。
+'''
+
+Self = TypeVar('Self', bound='ReturnValidator')
+
+
+class ReturnValidator:
+    """
+    返回值校验器，详见 pyparamvalidate.core.return_validator
+    """
+
+    def __init__(self, rule_des=None, sample_rate=1.0, seed=None):
+        """
+        :param rule_des: 返回值的规则描述
+        :param sample_rate: 抽样校验的比例，取值范围 (0, 1]，为 1 时每次调用都校验
+        :param seed: 抽样使用的随机数种子
+        """
+        if not 0 < sample_rate <= 1:
+            raise CallValidateMethodError(f'sample_rate must be in (0, 1], not {sample_rate}')
+
+        self.rule_des = rule_des
+        self.sample_rate = sample_rate
+        self.seed = seed
+        self._validators = []
+
+    def __getattr__(self, name):
+        # 只有不存在的属性才会进入 __getattr__，与 Rules 一样收集校验方法
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def validator_method(*args, **kwargs):
+            self._validators.append((name, args, kwargs))
+            return self
+
+        return validator_method
+
+    def __call__(self, func: Callable) -> Callable:
+        return build_wrapper(func, self, RETURN_STAGE)
+
+    def _paths(self):
+        return ()
+
+    def _compile(self, func: Callable, prefixes=None) -> Callable:
+        """
+        编译校验计划，返回校验函数 check(result) -> result
+        """
+        import inspect
+
+        rules = dedupe_rules(tuple((getattr(Validator, name), vargs, vkwargs)
+                                   for name, vargs, vkwargs in self._validators))
+        fast_check = build_fast_check(rules)
+        rules = fuse_rules(rules, fast_check)
+        rule_des = self.rule_des
+
+        def validate(value, field):
+            if fast_check is not None:
+                try:
+                    if fast_check(value) is not FAILED:
+                        return
+                except Exception:
+                    pass
+
+            validator = Validator(value, field=field, rule_des=rule_des)
+            for validate_method, vargs, vkwargs in rules:
+                validate_method(validator, *vargs, **vkwargs)
+
+        if inspect.isasyncgenfunction(func):
+            validate_result = lambda result: _checked_async_items(result, validate)
+        elif inspect.isgeneratorfunction(func):
+            validate_result = lambda result: _checked_items(result, validate)
+        elif inspect.iscoroutinefunction(func):
+            validate_result = lambda result: _checked_coroutine(result, validate)
+        else:
+            def validate_result(result):
+                validate(result, 'return')
+                return result
+
+        if self.sample_rate >= 1:
+            return validate_result
+
+        import random
+
+        sample_rate = self.sample_rate
+        sampled = random.Random(self.seed).random
+
+        def check(result):
+            return validate_result(result) if sampled() < sample_rate else result
+
+        return check
+
+
+async def _checked_coroutine(coroutine, validate):
+    result = await coroutine
+    validate(result, 'return')
+    return result
+
+
+def _checked_items(generator, validate):
+    """
+    包装生成器，校验每一个 yield 的元素，send / throw / close 转发给原生成器，返回原生成器的返回值
+    """
+    index = 0
+    sent = None
+    thrown = None
+    while True:
+        try:
+            item = generator.send(sent) if thrown is None else generator.throw(thrown)
+        except StopIteration as e:
+            return e.value
+
+        validate(item, f'yield[{index}]')
+        index += 1
+
+        thrown = None
+        try:
+            sent = yield item
+        except GeneratorExit:
+            generator.close()
+            raise
+        except BaseException as e:
+            thrown = e
+
+
+async def _checked_async_items(generator, validate):
+    index = 0
+    async for item in generator:
+        validate(item, f'yield[{index}]')
+        index += 1
+        yield item
@@ -0,0 +1,204 @@
+from _thread import allocate_lock
+from weakref import WeakKeyDictionary
+
+from pyparamvalidate.core.memoize import memo_key
+
+'''
+合并并发的相同校验(single-flight)与并发数限制
+
+大量并发请求使用耗时的 customize 规则校验同一个值时(如 "用户 ID 是否存在"、"文件是否存在")，
+每个请求都会单独访问一次后端服务。single_flight 为上一条校验规则开启合并：
+
+    @ParameterValidator("user_id").is_int().customize(user_exists).single_flight(max_concurrency=8)
+    def example_function(user_id):
+        ...
+
+- 同一条规则、相同参数值(见 pyparamvalidate.core.memoize.memo_key，参数值为可变对象时不合并)的并发校验只执行一次，
+  其他线程等待并共用它的结果：校验通过时使用相同的校验结果，不通过时抛出相同异常的副本；
+- max_concurrency 限制该规则同时执行的次数(信号量)，突发流量时不会压垮后端服务，超出的校验排队等待；
+- 被装饰函数是 async 函数时，wrapper 也是 async 函数(见 pyparamvalidate.core.deadline)：
+  同一个事件循环中参数值相同的并发校验先在事件循环中合并(AsyncSingleFlight)，只提交一次到线程池，
+  线程池中再按规则合并(SingleFlight)；执行校验的协程被取消时，等待它的协程不会被取消，其中一个重新执行校验；
+- 只合并同时进行的校验，校验完成后不缓存结果，需要缓存时使用 memoize。
+'''
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = allocate_lock()
+        self.done.acquire()
+        self.result = None
+        self.error = None
+
+
+class _Abandoned(Exception):
+    """
+    执行调用的协程被取消，等待者需要重新执行
+    """
+    pass
+
+
+def _copy_error(error):
+    """
+    返回异常的副本(不调用 __init__)，保留原异常的 traceback
+    """
+    copied = type(error).__new__(type(error), *error.args)
+    copied.args = error.args
+    copied.__dict__.update(getattr(error, '__dict__', {}))
+    copied.__cause__ = error.__cause__
+    copied.__context__ = error.__context__
+    copied.__suppress_context__ = error.__suppress_context__
+    return copied.with_traceback(error.__traceback__)
+
+
+class SingleFlight:
+    """
+    线程版本：合并 key 相同的并发调用，并限制同时执行的调用数量
+    """
+
+    def __init__(self, max_concurrency=None):
+        """
+        :param max_concurrency: 同时执行的最大调用数量，为 None 时不限制
+        """
+        self._lock = allocate_lock()
+        self._calls = {}
+        self._semaphore = None
+        if max_concurrency is not None:
+            # threading 的导入耗时较长，只在限制并发数时导入
+            from threading import BoundedSemaphore
+
+            self._semaphore = BoundedSemaphore(max_concurrency)
+        # 统计信息：[执行次数, 共用结果的次数]
+        self.stats = [0, 0]
+
+    def do(self, key, func):
+        """
+        执行 func()，key 相同的调用正在执行时，等待并返回它的结果(或抛出它的异常)；key 为 None 时不合并
+        """
+        if key is None:
+            return self._run(func)
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.stats[1] += 1
+            with call.done:
+                pass
+            if call.error is not None:
+                # 每个等待者抛出异常的副本：多个线程同时抛出同一个异常对象，会并发修改它的 __traceback__
+                raise _copy_error(call.error)
+            return call.result
+
+        try:
+            call.result = self._run(func)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.release()
+        return call.result
+
+    def _run(self, func):
+        self.stats[0] += 1
+        if self._semaphore is None:
+            return func()
+        with self._semaphore:
+            return func()
+
+
+class AsyncSingleFlight:
+    """
+    asyncio 版本：合并同一个事件循环中 key 相同的并发调用，并限制同时执行的调用数量
+    """
+
+    def __init__(self, max_concurrency=None):
+        self._max_concurrency = max_concurrency
+        # 每个事件循环的状态：{事件循环: (正在执行的调用 {key: Future}, 信号量)}，asyncio.Semaphore 不能跨事件循环使用
+        self._states = WeakKeyDictionary()
+        self.stats = [0, 0]
+
+    async def do(self, key, coroutine_function):
+        """
+        执行 await coroutine_function()，key 相同的调用正在执行时，等待并返回它的结果(或抛出它的异常)；key 为 None 时不合并
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency) if self._max_concurrency is not None else None
+            state = self._states[loop] = ({}, semaphore)
+        calls, semaphore = state
+
+        future = None
+        if key is not None:
+            future = calls.get(key)
+            while future is not None:
+                self.stats[1] += 1
+                try:
+                    # shield：等待者被取消时，不取消正在执行的调用
+                    return await asyncio.shield(future)
+                except _Abandoned:
+                    # 执行调用的协程被取消，第一个被唤醒的等待者重新执行，其他等待者等待它的结果
+                    self.stats[1] -= 1
+                    future = calls.get(key)
+            future = calls[key] = loop.create_future()
+
+        self.stats[0] += 1
+        try:
+            if semaphore is None:
+                result = await coroutine_function()
+            else:
+                async with semaphore:
+                    result = await coroutine_function()
+        except asyncio.CancelledError:
+            if future is not None:
+                # 不取消 future：等待者没有被取消，需要重新执行
+                future.set_exception(_Abandoned())
+                future.exception()
+            raise
+        except BaseException as e:
+            if future is not None:
+                future.set_exception(e)
+                # 没有等待者时，避免 "Future exception was never retrieved" 警告
+                future.exception()
+            raise
+        else:
+            if future is not None:
+                future.set_result(result)
+        finally:
+            if future is not None:
+                del calls[key]
+        return result
+
+
+def shared_rule(rules, flight, description):
+    """
+    将校验规则包装为合并并发相同校验的规则，返回与校验方法调用方式相同的函数 shared(validator)
+
+    :param rules: 校验规则，元素为 (校验方法, 位置参数, 关键字参数)
+    :param flight: SingleFlight 实例
+    """
+
+    def run(validator):
+        for validate_method, vargs, vkwargs in rules:
+            validate_method(validator, *vargs, **vkwargs)
+        return validator.value
+
+    def shared(validator):
+        validator.value = flight.do(memo_key(validator.value), lambda: run(validator))
+        return validator
+
+    # 名称不是校验方法名，不会被当作纯校验规则去重、合并或生成快速校验函数
+    shared.__name__ = f'single_flight({description})'
+    shared.rules = rules
+    shared.flight = flight
+    return shared
@@ -1,12 +1,20 @@
 import functools
-import inspect
-import os
-import logging
-from typing import TypeVar
+import stat
+import types
+from typing import TypeVar, TYPE_CHECKING
 
-from schema import Schema
+from pyparamvalidate.core.path import format_path, parse_path, resolve_path
 
-logger = logging.getLogger(__name__)
+'''
+schema 仅在调用 schema_validate 时才需要，为了降低 import pyparamvalidate 的耗时(如命令行工具、serverless 函数的冷启动)，
+在 schema_validate 中延迟导入，这里只在类型检查时导入；
+同理，容器元素校验(container)、JSON Schema(json_schema)、二进制数据(buffer)和文件内容(file_content)的实现模块，
+在第一次调用对应的校验方法时才导入
+'''
+if TYPE_CHECKING:
+    from schema import Schema
+
+    from pyparamvalidate.core.container import Rules
 
 
 def _error_prompt(value, exception_msg=None, rule_des=None, field=None):
@@ -17,17 +25,30 @@ def _error_prompt(value, exception_msg=None, rule_des=None, field=None):
     return prompt
 
 
+def _positional_index(func, arg_name):
+    """
+    返回参数 arg_name 在 func 的位置参数中的下标(不包括 self)，如果 arg_name 不能以位置参数传值，返回 None
+    """
+    code = func.__code__
+    arg_names = code.co_varnames[:code.co_argcount]
+    return arg_names.index(arg_name) - 1 if arg_name in arg_names else None
+
+
 def raise_exception(func):
+    # 在装饰时确定 exception_msg 的位置，避免每次调用时都使用 inspect.signature 绑定参数
+    exception_msg_index = _positional_index(func, 'exception_msg')
+
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        bound_args = inspect.signature(func).bind(self, *args, **kwargs).arguments
-
-        exception_msg = kwargs.get('exception_msg', None) or bound_args.get('exception_msg', None)
-        error_prompt = _error_prompt(self.value, exception_msg, self._rule_des, self._field)
+        exception_msg = kwargs.get('exception_msg', None)
+        if not exception_msg and exception_msg_index is not None and len(args) > exception_msg_index:
+            exception_msg = args[exception_msg_index]
+        # 错误提示使用校验前的值，但只在校验不通过时才格式化，避免每次校验都格式化很大的值(如包含上万个元素的列表)
+        value = self.value
 
         result = func(self, *args, **kwargs)
         if not result:
-            raise ValueError(error_prompt)
+            raise ValueError(_error_prompt(value, exception_msg, self._rule_des, self._field))
 
         return self
 
@@ -44,7 +65,7 @@ class RaiseExceptionMeta(type):
             if isinstance(value, classmethod):
                 dct[key] = classmethod(raise_exception(value.__func__))
 
-            if inspect.isfunction(value) and not key.startswith("__"):
+            if isinstance(value, types.FunctionType) and not key.startswith("__"):
                 dct[key] = raise_exception(value)
 
         return super().__new__(cls, name, bases, dct)
@@ -64,12 +85,24 @@ Self = TypeVar('Self', bound='Validator')
 
 class Validator(metaclass=RaiseExceptionMeta):
 
-    def __init__(self, value, field=None, rule_des=None):
+    def __init__(self, value, field=None, rule_des=None, path=None):
+        """
+        :param value: 待校验的值
+        :param field: 字段名，用于错误提示
+        :param rule_des: 规则描述
+        :param path: 只校验 value 中的嵌套字段，如 "user.address.zip" 或 ["user", "address", "zip"]，详见 pyparamvalidate.core.path
+        """
+        if path is not None:
+            value = resolve_path(value, path)
+            field = field or format_path(parse_path(path))
+
         self.value = value
         self._field = field
         self._rule_des = rule_des
+        # 文件校验规则共用的文件探针，详见 pyparamvalidate.core.file_content
+        self._file_probe = None
 
-    def schema_validate(self, schema: Schema) -> Self:
+    def schema_validate(self, schema: 'Schema') -> Self:
         """
         schema 官方参考文档： https://pypi.org/project/schema/
 
@@ -143,6 +176,8 @@ class Validator(metaclass=RaiseExceptionMeta):
             Validator(valid_data).schema_validate(user_schema)
 
         """
+        from schema import Schema
+
         if not isinstance(schema, Schema):
             raise CallValidateMethodError(f'{schema} must be a instance of Schema, not {type(schema)}, '
                                           f'Please use "schema.Schema()" to initialize the schema.'
@@ -152,6 +187,18 @@ class Validator(metaclass=RaiseExceptionMeta):
         self.value = schema.validate(self.value)
         return self
 
+    def json_schema_validate(self, json_schema: dict, exception_msg=None) -> Self:
+        """
+        使用 JSON Schema 校验，schema 只编译一次(按 schema 对象缓存)，支持的关键字详见 pyparamvalidate.core.json_schema：
+
+            Validator(user).json_schema_validate({"type": "object", "required": ["name"]})
+
+        校验不通过时，异常信息中包含不通过的字段路径，如 "user.tags.1 error: ..."
+        """
+        from pyparamvalidate.core.json_schema import compile_json_schema
+
+        return compile_json_schema(json_schema)(self.value, self._field, exception_msg or self._rule_des)
+
     def customize(self, validate_method, *args, exception_msg=None, **kwargs) -> Self:
         """
         注意事项：请参考示例 3
@@ -228,6 +275,10 @@ class Validator(metaclass=RaiseExceptionMeta):
     def is_float(self, exception_msg=None):
         return isinstance(self.value, float)
 
+    def is_number(self, exception_msg=None):
+        # int 或 float，不包括 bool，与类型注解 float 一致(PEP 484：注解为 float 时也接受 int)
+        return isinstance(self.value, (int, float)) and not isinstance(self.value, bool)
+
     def is_list(self, exception_msg=None):
         return isinstance(self.value, list)
 
@@ -244,6 +295,7 @@ class Validator(metaclass=RaiseExceptionMeta):
         return self.value is not None
 
     def is_not_empty(self, exception_msg=None, stripped=True):
+        # 只去除字符串的前后空格，bytes、bytearray、memoryview 等二进制数据不去除空格，避免复制整个数据
         if stripped:
             if isinstance(self.value, str):
                 self.value = self.value.strip()
@@ -280,13 +332,217 @@ class Validator(metaclass=RaiseExceptionMeta):
         return set(sublist).issubset(set(self.value))
 
     def is_file(self, exception_msg=None):
-        return os.path.isfile(self.value)
+        from pyparamvalidate.core import file_content
+
+        return file_content.file_probe(self).is_regular_file()
 
     def is_dir(self, exception_msg=None):
-        return os.path.isdir(self.value)
+        from pyparamvalidate.core import file_content
+
+        probe = file_content.file_probe(self)
+        return probe.stat is not None and stat.S_ISDIR(probe.stat.st_mode)
 
     def is_file_suffix(self, file_suffix, exception_msg=None):
         return self.value.endswith(file_suffix)
 
     def is_method(self, exception_msg=None):
         return callable(self.value)
+
+    def file_size(self, min_size=None, max_size=None, exception_msg=None):
+        """
+        文件大小(字节数)是否在 [min_size, max_size] 之间，与其他文件校验规则共用一次 os.stat 的结果
+        """
+        from pyparamvalidate.core import file_content
+
+        probe = file_content.file_probe(self)
+        if not probe.is_regular_file():
+            return False
+        size = probe.stat.st_size
+        return (min_size is None or size >= min_size) and (max_size is None or size <= max_size)
+
+    def file_magic(self, magic, offset=0, exception_msg=None):
+        """
+        文件从 offset 开始是否为 magic(文件头魔数)，magic 为元组时匹配其中任意一个，只读取文件头
+        """
+        from pyparamvalidate.core import buffer, file_content
+
+        magics = magic if isinstance(magic, tuple) else (magic,)
+        head = file_content.file_probe(self).head(offset + max(map(len, magics)))
+        return head is not None and buffer.has_magic(head, magics, offset)
+
+    def is_utf8_file(self, exception_msg=None):
+        """
+        文件内容是否为合法的 UTF-8 编码，使用 mmap 分块解码
+        """
+        from pyparamvalidate.core import file_content
+
+        return file_content.is_utf8_file(file_content.file_probe(self))
+
+    def max_file_lines(self, max_lines, exception_msg=None):
+        """
+        文件行数是否不超过 max_lines，超过时立即停止统计
+        """
+        from pyparamvalidate.core import file_content
+
+        lines = file_content.count_lines(file_content.file_probe(self), max_lines)
+        return lines is not None and lines <= max_lines
+
+    def has_csv_header(self, columns, delimiter=',', exact=False, encoding='utf-8', exception_msg=None):
+        """
+        CSV 文件的表头是否包含 columns 中的所有列，exact 为 True 时表头必须与 columns 完全一致(包括顺序)，只读取文件头
+        """
+        from pyparamvalidate.core import file_content
+
+        return file_content.has_csv_header(file_content.file_probe(self), columns, delimiter, exact, encoding)
+
+    def is_json_file(self, root=None, exception_msg=None):
+        """
+        文件内容是否以 JSON 对象或数组开头，只读取文件头，不解析整个文件
+
+        :param root: 根节点类型，'object' 或 'array'，为 None 时两者均可
+        """
+        from pyparamvalidate.core import file_content
+
+        kind = file_content.json_root(file_content.file_probe(self))
+        return kind is not None and (root is None or kind == root)
+
+    def is_bytes(self, exception_msg=None):
+        return isinstance(self.value, (bytes, bytearray, memoryview))
+
+    def is_utf8(self, exception_msg=None):
+        """
+        二进制数据是否为合法的 UTF-8 编码，分块解码，不复制整个数据
+        """
+        from pyparamvalidate.core import buffer
+
+        return buffer.is_valid_utf8(self.value)
+
+    def has_magic(self, magic, offset=0, exception_msg=None):
+        """
+        二进制数据从 offset 开始是否为 magic(文件头魔数)，magic 为元组时匹配其中任意一个：
+
+            Validator(body).has_magic((b'\\x89PNG\\r\\n\\x1a\\n', b'\\xff\\xd8\\xff'))
+        """
+        from pyparamvalidate.core import buffer
+
+        return buffer.has_magic(self.value, magic, offset)
+
+    def byte_size(self, min_size=None, max_size=None, exception_msg=None):
+        """
+        二进制数据的字节数是否在 [min_size, max_size] 之间，与 max_length 不同，memoryview 按字节数(nbytes)而不是元素数量计算
+        """
+        from pyparamvalidate.core import buffer
+
+        size = buffer.byte_size(self.value)
+        return size is not None and (min_size is None or size >= min_size) and (max_size is None or size <= max_size)
+
+    def is_aligned(self, alignment=None, itemsize=None, exception_msg=None):
+        """
+        二进制数据的字节数是否为 alignment 的整数倍，元素大小是否为 itemsize，如 Validator(memoryview(data)).is_aligned(8, itemsize=8)
+        """
+        from pyparamvalidate.core import buffer
+
+        return buffer.is_aligned(self.value, alignment, itemsize)
+
+    def each(self, rules: 'Rules', exception_msg=None, sample=None, seed=None, confidence=None, tolerance=0.01,
+             edge=10) -> Self:
+        """
+        校验容器中的每个元素，不通过时的异常信息中包含不通过的元素下标
+
+            Validator([1, 2, 3]).each(Rules().is_int().is_positive())
+            Validator(huge_list).each(Rules().is_int(), sample=1000, seed=0)
+
+        :param rules: 元素校验规则，详见 pyparamvalidate.core.container
+        :param exception_msg: 元素校验规则未指定 exception_msg 时使用的错误提示
+        :param sample: 抽样校验的随机元素数量，为 None 时校验全部元素；抽样时还会校验首尾各 edge 个元素
+        :param seed: 抽样的随机数种子，指定时每次抽取相同的元素
+        :param confidence: 抽样置信度，sample 为 None 时，根据 confidence 和 tolerance 计算抽样数量，详见 sample_size
+        :param tolerance: 可以容忍(漏检)的不通过元素占比
+        :param edge: 抽样校验时首尾各校验的元素数量(与 pyparamvalidate.core.container.DEFAULT_EDGE 相同)
+        """
+        from pyparamvalidate.core.container import sample_elements, sample_size, validate_elements
+
+        value = self.value
+        if not hasattr(value, '__len__'):
+            # 迭代器(如生成器)只能遍历一次，校验之后被装饰函数拿到的是已经耗尽的迭代器
+            if iter(value) is value:
+                raise CallValidateMethodError(f'each can not validate iterator "{self._field}" without consuming it, '
+                                              f'use lazy_each instead')
+            value = tuple(value)
+        rule_des = exception_msg or self._rule_des
+
+        if sample is None and confidence is not None:
+            sample = sample_size(confidence, tolerance)
+        sampled = sample_elements(value, sample, seed, edge) if sample is not None else None
+        if sampled is not None:
+            elements, indices = sampled
+            return validate_elements(rules, elements, indices, field=self._field, rule_des=rule_des, total=len(value))
+
+        return validate_elements(rules, value, field=self._field, rule_des=rule_des)
+
+    def keys(self, rules: 'Rules', exception_msg=None) -> Self:
+        """
+        校验字典中的每个 key
+
+            Validator({'a': 1}).keys(Rules().is_string())
+        """
+        from pyparamvalidate.core.container import validate_elements
+
+        return validate_elements(rules, self.value.keys(), self.value.keys(), '{field} key {label}',
+                                 self._field, exception_msg or self._rule_des)
+
+    def values(self, rules: 'Rules', exception_msg=None) -> Self:
+        """
+        校验字典中的每个 value
+
+            Validator({'a': 1}).values(Rules().is_int())
+        """
+        from pyparamvalidate.core.container import validate_elements
+
+        return validate_elements(rules, self.value.values(), self.value.keys(), '{field}[{label}]',
+                                 self._field, exception_msg or self._rule_des)
+
+    def values_matching(self, pattern, rules: 'Rules', exception_msg=None) -> Self:
+        """
+        校验字典中 key 与正则表达式 pattern 完全匹配的 value，适用于 **kwargs 参数
+
+            @ParameterValidator("options").values_matching(r"timeout_.*", Rules().is_int().is_positive())
+            def example_function(**options):
+                ...
+
+        - key 不是字符串时不匹配；
+        - 只校验单个 key 时，可以使用嵌套字段路径，如 ParameterValidator("options.timeout")
+        """
+        import re
+
+        from pyparamvalidate.core.container import validate_elements
+
+        match = re.compile(pattern).fullmatch
+        keys = [key for key in self.value if isinstance(key, str) and match(key)]
+        return validate_elements(rules, [self.value[key] for key in keys], keys, '{field}[{label}]',
+                                 self._field, exception_msg or self._rule_des)
+
+    def lazy_each(self, rules: 'Rules' = None, max_count=None, exception_msg=None) -> Self:
+        """
+        将参数值替换为校验迭代器 ValidatingIterator，在迭代时逐个校验元素，不会预先读取全部元素，适用于生成器、数据库游标等
+
+            @ParameterValidator("rows").lazy_each(Rules().is_dict(), max_count=100000)
+            def example_function(rows):
+                for row in rows:
+                    ...
+
+        - 在 ParameterValidator 中使用时，总是将校验迭代器传给被装饰函数，不需要指定 normalize=True；
+        - 应作为最后一个校验规则，之后的校验规则会消耗迭代器中的元素。
+
+        :param rules: 元素校验规则，为 None 时只校验元素数量
+        :param max_count: 最大元素数量，迭代到第 max_count + 1 个元素时抛出 ValueError
+        :param exception_msg: 元素数量超过 max_count 时的错误提示
+        """
+        from pyparamvalidate.core.container import ValidatingIterator
+
+        try:
+            self.value = ValidatingIterator(self.value, rules, max_count, self._field, self._rule_des, exception_msg)
+        except TypeError:
+            # 参数值不可迭代
+            return False
+        return True
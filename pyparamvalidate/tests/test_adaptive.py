@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from pyparamvalidate.core.adaptive import check_order, plan_order
+from pyparamvalidate.core.memoize import register_pure_rule
+from pyparamvalidate.core.param_validator import ParameterValidator
+
+
+@register_pure_rule
+def slow_check(value):
+    time.sleep(0.001)
+    return True
+
+
+def test_plan_order():
+    kinds = ('movable', 'guard', 'movable', 'barrier', 'movable', 'movable')
+    scores = (5, 9, 1, 0, 3, 2)
+    # 类型校验规则可以提前，但之后声明的规则不会越过它，固定位置的规则不移动
+    assert plan_order(kinds, scores) == (0, 1, 2, 3, 5, 4)
+    assert plan_order(('movable', 'guard'), (5, 1)) == (1, 0)
+
+    assert check_order(kinds, (1, 0, 2, 3, 4, 5))
+    assert not check_order(kinds, (2, 1, 0, 3, 4, 5))
+    assert not check_order(kinds, (0, 1, 2, 4, 3, 5))
+    assert not check_order(kinds, (0, 1, 2))
+
+
+def test_adaptive_order():
+    validator = ParameterValidator("name", adaptive=True, adaptive_window=20).customize(slow_check).is_string()
+
+    @validator
+    def example_function(name):
+        return name
+
+    for index in range(20):
+        with pytest.raises(ValueError):
+            example_function(index)
+
+    # 学习结束后，耗时短、不通过率高的 is_string 先执行
+    assert validator.rule_order() == (1, 0)
+    assert example_function("a") == "a"
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(1)
+    assert "name error" in str(exc_info.value)
+
+
+def test_freeze_order():
+    validator = ParameterValidator("name", adaptive=True).customize(slow_check).is_string().max_length(3)
+    validator.freeze_order((1, 0, 2))
+
+    @validator
+    def example_function(name):
+        return name
+
+    assert example_function("abc") == "abc"
+    assert validator.rule_order() == (1, 0, 2)
+
+    with pytest.raises(ValueError):
+        validator.freeze_order((2, 1, 0))
+
+
+def test_freeze_order_without_adaptive():
+    calls = []
+
+    @register_pure_rule
+    def first(value):
+        calls.append("first")
+        return True
+
+    @register_pure_rule
+    def second(value):
+        calls.append("second")
+        return True
+
+    validator = ParameterValidator("name").customize(first).customize(second)
+    validator.freeze_order((1, 0))
+
+    @validator
+    def example_function(name):
+        return name
+
+    assert example_function("abc") == "abc"
+    assert validator.rule_order() == (1, 0)
+    assert calls == ["second", "first"]
+
+
+def test_impure_rules_are_not_moved():
+    validator = ParameterValidator("name").customize(lambda value: True).is_string()
+    with pytest.raises(ValueError):
+        validator.freeze_order((1, 0))
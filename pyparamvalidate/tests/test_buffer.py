@@ -0,0 +1,64 @@
+from array import array
+
+import pytest
+
+from pyparamvalidate.core import buffer
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import Validator
+
+
+def test_is_utf8():
+    text = ('你好, world ' * 10000).encode()
+    assert Validator(text).is_utf8()
+    assert Validator(bytearray(text)).is_utf8()
+    assert Validator(memoryview(text)[6:]).is_utf8()
+
+    # 多字节字符跨越分块边界
+    assert buffer.is_valid_utf8('你好'.encode(), chunk_size=1)
+    assert not buffer.is_valid_utf8('你好'.encode()[:-1], chunk_size=1)
+    # 非 C 连续的 memoryview 校验不通过
+    assert not buffer.is_valid_utf8(memoryview(b'abcd')[::2])
+    assert not buffer.has_magic(memoryview(b'abcd')[::2], b'ac')
+
+    with pytest.raises(ValueError):
+        Validator(b'\xff\xfe').is_utf8()
+    with pytest.raises(ValueError):
+        Validator('text').is_utf8()
+
+
+def test_has_magic():
+    png = b'\x89PNG\r\n\x1a\n' + bytes(100)
+    assert Validator(png).has_magic(b'\x89PNG')
+    assert Validator(memoryview(png)).has_magic((b'%PDF-', b'\x89PNG'))
+    assert Validator(png).has_magic(b'PNG', offset=1)
+
+    with pytest.raises(ValueError):
+        Validator(png).has_magic(b'%PDF-')
+    with pytest.raises(ValueError):
+        Validator(b'\x89').has_magic(b'\x89PNG')
+
+
+def test_byte_size_and_alignment():
+    data = array('q', range(10))
+    assert Validator(memoryview(data)).byte_size(min_size=80, max_size=80)
+    assert Validator(data).is_aligned(8, itemsize=8)
+
+    with pytest.raises(ValueError):
+        Validator(bytes(10)).byte_size(max_size=9)
+    with pytest.raises(ValueError):
+        Validator(bytes(10)).is_aligned(8)
+    with pytest.raises(ValueError):
+        Validator([1, 2]).byte_size(max_size=9)
+
+
+def test_is_bytes_with_parameter_validator():
+    @ParameterValidator("body", normalize=True).is_bytes().is_not_empty().byte_size(max_size=1 << 20).is_utf8()
+    def example_function(body):
+        return body
+
+    body = bytearray(b'  {"a": 1}  ')
+    # 二进制数据不去除空格，原样传给被装饰函数
+    assert example_function(body) is body
+
+    with pytest.raises(ValueError):
+        example_function('text')
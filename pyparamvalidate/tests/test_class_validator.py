@@ -0,0 +1,156 @@
+import pytest
+
+from pyparamvalidate.core.class_validator import annotation_validators, validate_methods
+from pyparamvalidate.core.param_validator import ParameterValidator
+
+
+@validate_methods
+class Account:
+    def __init__(self, owner: str):
+        self.owner = owner
+        self.balance = 0
+
+    @ParameterValidator("amount").is_positive()
+    def deposit(self, amount: int, note: str = None):
+        self.balance += amount
+        return self.balance
+
+    def withdraw(self, amount: int, note: str = ""):
+        self.balance -= amount
+        return self.balance
+
+    @classmethod
+    def open(cls, owner: str, *tags: str):
+        return cls(owner), tags
+
+    @staticmethod
+    def parse(raw: bytes, **options: int):
+        return raw, options
+
+    def scale(self, factor: float):
+        return self.balance * factor
+
+    def _internal(self, value: int):
+        return value
+
+    def __eq__(self, other: int):
+        return False
+
+
+def test_instance_method_and_init():
+    account = Account("alice")
+    assert account.deposit(10) == 10
+    assert account.deposit(5, note=None) == 15
+
+    with pytest.raises(ValueError) as exc_info:
+        Account(1)
+    assert "owner error" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        account.deposit("10")
+    assert "amount error" in str(exc_info.value)
+
+    # 显式声明的规则与类型注解生成的规则合并
+    with pytest.raises(ValueError):
+        account.deposit(-1)
+
+
+def test_float_annotation_accepts_int():
+    account = Account("alice")
+    account.deposit(10)
+    # 与 PEP 484 一致，float 注解也接受 int，但不接受 bool
+    assert account.scale(2) == 20
+    assert account.scale(0.5) == 5.0
+    for factor in (True, "2"):
+        with pytest.raises(ValueError) as exc_info:
+            account.scale(factor)
+        assert "factor error" in str(exc_info.value)
+
+
+def test_defaults():
+    account = Account("alice")
+    # 未传值的参数使用默认值，不校验
+    assert account.withdraw(5) == -5
+    assert account.withdraw(5, "rent") == -10
+    with pytest.raises(ValueError) as exc_info:
+        account.withdraw(5, None)
+    assert "note error" in str(exc_info.value)
+
+    # 默认值为 None 的参数允许传入 None，其他值仍然校验
+    with pytest.raises(ValueError) as exc_info:
+        account.deposit(5, "abc".encode())
+    assert "note error" in str(exc_info.value)
+    with pytest.raises(ValueError):
+        account.deposit(5, note=1)
+
+
+def test_none_default_is_type_checked():
+    @validate_methods
+    class Example:
+        def scale(self, x: int = None):
+            return x
+
+    assert Example().scale() is None
+    assert Example().scale(None) is None
+    assert Example().scale(2) == 2
+    with pytest.raises(ValueError) as exc_info:
+        Example().scale("abc")
+    assert "x error" in str(exc_info.value)
+
+
+def test_classmethod_and_staticmethod():
+    account, tags = Account.open("bob", "a", "b")
+    assert account.owner == "bob" and tags == ("a", "b")
+    assert Account.parse(b"x", retries=3) == (b"x", {"retries": 3})
+
+    with pytest.raises(ValueError) as exc_info:
+        Account.open("bob", "a", 1)
+    assert "tags[1] error" in str(exc_info.value)
+
+    with pytest.raises(ValueError):
+        Account.parse("x")
+    with pytest.raises(ValueError):
+        Account("c").parse(b"x", retries="3")
+
+
+def test_private_and_dunder_methods_are_skipped():
+    account = Account("alice")
+    assert account._internal("1") == "1"
+    assert (account == "x") is False
+
+    @validate_methods(private=True)
+    class Private:
+        def _internal(self, value: int):
+            return value
+
+    with pytest.raises(ValueError):
+        Private()._internal("1")
+
+
+def test_string_annotations():
+    def example_function(value: "int", other: "Optional[int]"):
+        return value
+
+    validators = annotation_validators(example_function)
+    assert [validator.param_name for validator in validators] == ["value"]
+
+
+def test_parameter_validator_on_classmethod_and_staticmethod():
+    class Example:
+        @ParameterValidator("value").is_int()
+        @classmethod
+        def create(cls, value):
+            return cls, value
+
+        @ParameterValidator("value").is_string()
+        @staticmethod
+        def parse(value):
+            return value
+
+    assert Example.create(1) == (Example, 1)
+    assert Example().parse("a") == "a"
+
+    with pytest.raises(ValueError):
+        Example.create("1")
+    with pytest.raises(ValueError):
+        Example.parse(1)
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from pyparamvalidate.core import code_cache
+
+SOURCE = 'def answer():\n    return 42\n'
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    code_cache.set_cache_dir(str(tmp_path))
+    code_cache.clear_memory_cache()
+    yield tmp_path
+    code_cache.set_cache_dir(None)
+    code_cache.clear_memory_cache()
+
+
+def _run(code):
+    namespace = {}
+    exec(code, namespace)
+    return namespace['answer']()
+
+
+def test_compile_source_memory_cache():
+    assert code_cache.compile_source(SOURCE) is code_cache.compile_source(SOURCE)
+
+
+def test_compile_source_disk_cache(cache_dir):
+    code = code_cache.compile_source(SOURCE)
+    assert _run(code) == 42
+    files = os.listdir(cache_dir)
+    assert len(files) == 1 and files[0].endswith('.bin')
+
+    # 模拟 worker 重新启动：清空进程内缓存后，从磁盘加载
+    code_cache.clear_memory_cache()
+    assert _run(code_cache.compile_source(SOURCE)) == 42
+    assert os.listdir(cache_dir) == files
+
+
+def test_compile_source_corrupted_cache(cache_dir):
+    code_cache.compile_source(SOURCE)
+    path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    with open(path, 'wb') as f:
+        f.write(b'corrupted')
+
+    code_cache.clear_memory_cache()
+    assert _run(code_cache.compile_source(SOURCE)) == 42
+
+
+def test_cache_key_includes_version(cache_dir, monkeypatch):
+    import pyparamvalidate
+
+    path = code_cache._cache_path(str(cache_dir), SOURCE)
+    monkeypatch.setattr(pyparamvalidate, '__version__', '0.0.0')
+    assert code_cache._cache_path(str(cache_dir), SOURCE) != path
+
+
+def test_cache_dir_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv(code_cache.CACHE_DIR_ENV, str(tmp_path / 'plans'))
+    monkeypatch.setattr(code_cache, '_cache_dir', None)
+    assert code_cache.get_cache_dir() == str(tmp_path / 'plans')
+    assert os.path.isdir(tmp_path / 'plans')
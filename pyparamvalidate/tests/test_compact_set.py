@@ -0,0 +1,117 @@
+import gc
+import tracemalloc
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.utils.compact_set import BloomFilter, SortedIntSet, SortedStrSet, compact_allowlist
+
+
+def test_sorted_int_set():
+    allowed = compact_allowlist([5, 3, 3, 1, -(1 << 63)])
+    assert isinstance(allowed, SortedIntSet)
+    assert len(allowed) == 4
+    assert list(allowed) == [-(1 << 63), 1, 3, 5]
+
+    for value in (1, 3, 5, 3.0, True, -(1 << 63)):
+        assert value in allowed
+    for value in (2, 3.5, "3", None, 1 << 64, False):
+        assert value not in allowed
+
+
+def test_sorted_int_set_equal_numbers():
+    allowed = compact_allowlist([1, 3, 5])
+
+    class Index:
+        def __index__(self):
+            return 3
+
+    for value in (Decimal(3), Fraction(3, 1), Index()):
+        assert value in allowed
+    for value in (Decimal("3.5"), Decimal("NaN"), Decimal("Infinity"), Fraction(7, 2)):
+        assert value not in allowed
+
+    numpy = pytest.importorskip("numpy")
+    assert numpy.int64(3) in allowed
+    assert numpy.uint8(5) in allowed
+    assert numpy.float64(3.0) in allowed
+    assert numpy.int64(4) not in allowed
+
+
+def test_sorted_str_set():
+    allowed = compact_allowlist(["zh", "en", "en", "fr"])
+    assert isinstance(allowed, SortedStrSet)
+    assert list(allowed) == ["en", "fr", "zh"]
+    assert "en" in allowed
+    assert "de" not in allowed
+    assert 1 not in allowed
+
+    # 非 ASCII 字符和单独的代理字符
+    values = ["é", "z", "中文", "\ud800", ""]
+    allowed = SortedStrSet(values)
+    assert list(allowed) == sorted(values)
+    assert all(value in allowed for value in values)
+    assert "e" not in allowed
+
+
+def _retained_memory(factory):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = factory()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+def test_sorted_str_set_memory():
+    count = 100_000
+    compact_size, compact = _retained_memory(lambda: SortedStrSet(f"user-{i:08d}" for i in range(count)))
+    set_size, plain = _retained_memory(lambda: {f"user-{i:08d}" for i in range(count)})
+    assert len(compact) == len(plain) == count
+    # 不为每个字符串保留 Python 对象，内存占用不到 set 的一半
+    assert compact_size < set_size / 2
+
+
+def test_sorted_str_set_with_bloom():
+    values = [f"user-{i}" for i in range(10_000)]
+    allowed = compact_allowlist(values, bloom=True)
+    assert all(value in allowed for value in values)
+
+    misses = [f"other-{i}" for i in range(10_000)]
+    assert not any(value in allowed for value in misses)
+
+    bloom = BloomFilter(values, error_rate=0.01)
+    false_positives = sum(value in bloom for value in misses)
+    assert false_positives < 300
+
+
+def test_compact_allowlist_shared():
+    first = compact_allowlist([3, 2, 1])
+    assert compact_allowlist((1, 2, 3, 3)) is first
+    assert compact_allowlist(first) is first
+    assert compact_allowlist([1, 2]) is not first
+    assert compact_allowlist(["a", "b"]) is compact_allowlist({"b", "a"})
+    assert compact_allowlist(["a", "b"]) is not compact_allowlist(["a", "b"], bloom=True)
+
+
+def test_compact_allowlist_fallback():
+    assert compact_allowlist([1, "a"]) == frozenset([1, "a"])
+    assert compact_allowlist([]) == frozenset()
+    assert compact_allowlist([[1], [2]]) == [[1], [2]]
+
+
+def test_is_allowed_value_with_compact_allowlist():
+    @ParameterValidator("user_id").is_allowed_value(compact_allowlist(range(1000)), "Unknown user id")
+    def example_function(user_id):
+        return user_id
+
+    assert example_function(999) == 999
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(1000)
+    assert "Unknown user id" in str(exc_info.value)
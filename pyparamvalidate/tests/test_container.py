@@ -0,0 +1,189 @@
+from array import array
+
+import pytest
+
+from pyparamvalidate.core.container import (ElementStats, Rules, ValidatingIterator, compile_rules, sample_elements,
+                                            sample_size)
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import CallValidateMethodError, Validator
+
+
+def test_each():
+    assert Validator([1, 2, 3]).each(Rules().is_int().is_positive())
+    assert Validator([]).each(Rules().is_int())
+    assert Validator(array('q', range(1, 1000))).each(Rules().is_int().is_positive())
+    assert Validator(['a', 'bc']).each(Rules().is_string().max_length(2).is_allowed_value(['a', 'bc']))
+
+    with pytest.raises(ValueError) as exc_info:
+        Validator([1, -2, 3, -4], field='ids').each(Rules().is_int().is_positive("must be positive"))
+    assert "ids[1] error: \"-2\" is invalid. due to: must be positive" in str(exc_info.value)
+    assert "failed elements: 1, 3" in str(exc_info.value)
+
+
+def test_each_vector_checks():
+    assert compile_rules(Rules().is_int().is_positive()).vector_checks is not None
+    assert compile_rules(Rules().is_int().customize(lambda value: True)).vector_checks is None
+
+    # bool 是 int 的子类，与 Validator(True).is_int() 一致
+    assert Validator([True, 1]).each(Rules().is_int())
+
+    with pytest.raises(ValueError):
+        Validator([1, 'a']).each(Rules().is_int())
+
+
+def test_each_reports_limited_failures():
+    with pytest.raises(ValueError) as exc_info:
+        Validator([-1] * 100).each(Rules().is_positive())
+    assert "failed elements: 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ..." in str(exc_info.value)
+
+
+def test_keys_and_values():
+    options = {'a': 1, 'b': None}
+    assert Validator(options).keys(Rules().is_string())
+
+    with pytest.raises(ValueError) as exc_info:
+        Validator(options, field='options').values(Rules().is_not_none())
+    assert "options['b'] error" in str(exc_info.value)
+    assert "failed elements: 'b'" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        Validator({1: 'a'}, field='options').keys(Rules().is_string())
+    assert "options key 1 error" in str(exc_info.value)
+
+
+def test_each_with_parameter_validator():
+    @ParameterValidator("ids").is_list().each(Rules().is_int().is_positive("id must be positive"))
+    def example_function(ids):
+        return ids
+
+    assert example_function([1, 2, 3]) == [1, 2, 3]
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function([1, 0])
+    assert "ids[1] error: \"0\" is invalid. due to: id must be positive" in str(exc_info.value)
+
+
+def test_each_rejects_iterators():
+    @ParameterValidator("ids").each(Rules().is_int())
+    def example_function(ids):
+        return list(ids)
+
+    # 迭代器校验之后会被耗尽，需要使用 lazy_each
+    with pytest.raises(CallValidateMethodError, match="use lazy_each instead"):
+        example_function(i for i in range(3))
+    with pytest.raises(CallValidateMethodError):
+        Validator(iter([1, 2])).each(Rules().is_int())
+
+    # 可以重复遍历的对象(即使没有 __len__)仍然支持
+    class Numbers:
+        def __iter__(self):
+            return iter([1, 2])
+
+    assert example_function(range(3)) == [0, 1, 2]
+    assert example_function(Numbers()) == [1, 2]
+
+
+def test_each_requires_rules():
+    with pytest.raises(CallValidateMethodError):
+        Validator([1]).each(Validator)
+
+
+def test_each_is_positive_with_nan():
+    nan = float('nan')
+    for values in ([1.0, nan], [nan, 1.0]):
+        with pytest.raises(ValueError) as exc_info:
+            Validator(values).each(Rules().is_positive())
+        assert f"failed elements: {values.index(nan)}" in str(exc_info.value)
+
+
+def test_sample_size():
+    assert sample_size(0.99, 0.01) == 459
+    with pytest.raises(ValueError):
+        sample_size(1, 0.01)
+
+
+def test_each_sampled():
+    rules = Rules().is_int()
+    values = list(range(100_000))
+    assert Validator(values).each(rules, sample=100, seed=0)
+    assert rules.stats() == ElementStats(1, 1, 120, 100_000 - 120)
+
+    # 元素数量不超过抽样数量时校验全部元素
+    assert Validator([1, 2, 3]).each(rules, sample=100)
+    assert rules.stats() == ElementStats(2, 1, 123, 100_000 - 120)
+
+    # 首尾的元素总是被校验
+    with pytest.raises(ValueError) as exc_info:
+        Validator(values + ['a'], field='ids').each(rules, sample=100, seed=0)
+    assert "failed elements: 100000" in str(exc_info.value)
+
+    # 相同的 seed 抽取相同的元素
+    assert sample_elements(values, 5, seed=1) == sample_elements(values, 5, seed=1)
+
+
+def test_each_sampled_dict_and_set():
+    rules = Rules().is_int()
+    mapping = dict.fromkeys(range(10_000))
+    assert Validator(mapping).each(rules, sample=100, seed=0)
+    assert Validator(set(range(10_000))).each(rules, sample=100, seed=0)
+    assert rules.stats() == ElementStats(2, 2, 240, 2 * (10_000 - 120))
+
+    # 按迭代顺序计算下标
+    elements, indices = sample_elements(mapping, 5, seed=1, edge=2)
+    assert elements == indices
+
+    with pytest.raises(ValueError) as exc_info:
+        Validator({**mapping, 'a': 1}).each(rules, sample=100, seed=0)
+    assert "failed elements: 10000" in str(exc_info.value)
+
+
+def test_each_sampled_with_confidence():
+    rules = Rules().is_int()
+    assert Validator(list(range(10_000))).each(rules, confidence=0.99, tolerance=0.01, edge=0)
+    assert rules.stats().checked_elements == 459
+
+
+def test_lazy_each():
+    consumed = []
+
+    def rows():
+        for row in [{'id': 1}, {'id': 2}, None]:
+            consumed.append(row)
+            yield row
+
+    @ParameterValidator("rows").lazy_each(Rules().is_dict("row must be a dict"), max_count=10)
+    def example_function(rows):
+        assert isinstance(rows, ValidatingIterator)
+        # 未迭代时不读取任何元素
+        assert consumed == []
+        return [row['id'] for row in rows]
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(rows())
+    assert "rows[2] error" in str(exc_info.value)
+    assert "row must be a dict" in str(exc_info.value)
+
+
+def test_lazy_each_max_count():
+    @ParameterValidator("rows").lazy_each(max_count=3)
+    def example_function(rows):
+        return sum(1 for _ in rows)
+
+    assert example_function(iter(range(3))) == 3
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(x for x in range(100))
+    assert "rows[3] error" in str(exc_info.value)
+    assert "more than 3 elements" in str(exc_info.value)
+
+    with pytest.raises(ValueError):
+        example_function(None)
+
+
+def test_lazy_each_nested_field():
+    def example_function(payload):
+        return payload
+
+    # 直接编译，不登记到校验计划注册表中，避免影响 compile_all
+    with pytest.raises(CallValidateMethodError):
+        ParameterValidator("payload.rows").lazy_each()._compile(example_function)
@@ -0,0 +1,81 @@
+import pytest
+
+from pyparamvalidate.core.cross_validator import CrossParameterValidator
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import CallValidateMethodError
+
+
+def test_cross_parameter_rule():
+    @CrossParameterValidator().rule(lambda start, end: start < end, exception_msg="start must be less than end")
+    def example_function(start, end):
+        return start, end
+
+    assert example_function(1, end=2) == (1, 2)
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(2, 1)
+    assert "start, end error" in str(exc_info.value)
+    assert "start must be less than end" in str(exc_info.value)
+
+
+def test_cross_parameter_rule_runs_after_parameter_rules():
+    calls = []
+
+    def same_length(ids, weights):
+        calls.append((ids, weights))
+        return len(ids) == len(weights)
+
+    # 跨参数校验器写在最外层，仍然在参数校验之后执行
+    @CrossParameterValidator("ids and weights must have the same length").rule(same_length)
+    @ParameterValidator("ids").is_list("ids must be a list")
+    @ParameterValidator("weights").is_list("weights must be a list")
+    def example_function(ids, weights):
+        return ids, weights
+
+    assert example_function([1, 2], [0.5, 0.5]) == ([1, 2], [0.5, 0.5])
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function([1, 2], [0.5])
+    assert "ids and weights must have the same length" in str(exc_info.value)
+
+    # 依赖的参数校验不通过时，不执行跨参数校验
+    calls.clear()
+    with pytest.raises(ValueError) as exc_info:
+        example_function((1, 2), [0.5, 0.5])
+    assert "ids must be a list" in str(exc_info.value)
+    assert calls == []
+
+
+def test_exactly_one_of():
+    @CrossParameterValidator().exactly_one_of("user_id", "email", exception_msg="specify user_id or email")
+    def example_function(user_id=None, email=None, **kwargs):
+        return user_id, email
+
+    assert example_function(user_id=1) == (1, None)
+    assert example_function(email="a@b.c") == (None, "a@b.c")
+
+    for kwargs in ({}, {"user_id": 1, "email": "a@b.c"}):
+        with pytest.raises(ValueError) as exc_info:
+            example_function(**kwargs)
+        assert "specify user_id or email" in str(exc_info.value)
+
+
+def test_cross_parameter_rule_with_var_keyword():
+    @CrossParameterValidator().rule(lambda low, high: low is None or low <= high, params=["low", "high"])
+    def example_function(high, **options):
+        return high, options
+
+    assert example_function(10, low=5) == (10, {"low": 5})
+    assert example_function(10) == (10, {})
+
+    with pytest.raises(ValueError):
+        example_function(10, low=20)
+
+
+def test_cross_parameter_rule_unknown_parameter():
+    @CrossParameterValidator().rule(lambda start, stop: start < stop)
+    def example_function(start, end):
+        return start, end
+
+    with pytest.raises(CallValidateMethodError):
+        example_function(1, 2)
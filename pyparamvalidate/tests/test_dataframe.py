@@ -0,0 +1,84 @@
+import pytest
+
+from pyparamvalidate.core.container import Rules
+from pyparamvalidate.core.dataframe import ColumnFailure, DataFrameValidator
+from pyparamvalidate.core.validator import CallValidateMethodError
+
+pandas = pytest.importorskip('pandas')
+
+
+@pytest.fixture
+def frame():
+    return pandas.DataFrame({
+        'id': [1, 2, -3, 4, 0],
+        'name': ['a', ' ', 'ccc', None, 'eeeeee'],
+        'status': ['active', 'inactive', 'active', 'deleted', 'active'],
+        'score': [1.5, 2.0, float('nan'), 3.0, 4.0],
+    })
+
+
+def test_validate_dataframe(frame):
+    validator = DataFrameValidator() \
+        .column('id', Rules().is_int().is_positive()) \
+        .column('name', Rules().is_string().is_not_empty().max_length(5)) \
+        .column('status', Rules().is_allowed_value(['active', 'inactive'])) \
+        .column('score', Rules().is_float())
+
+    result = validator.validate(frame)
+    assert result.mask.tolist() == [True, False, False, False, False]
+    assert result.failures == [
+        ColumnFailure('id', 'is_positive', 2, [2, 4]),
+        ColumnFailure('name', 'is_string', 1, [3]),
+        ColumnFailure('name', 'is_not_empty', 1, [1]),
+        ColumnFailure('name', 'max_length', 1, [4]),
+        ColumnFailure('status', 'is_allowed_value', 1, [3]),
+    ]
+
+
+def test_rules_match_validator(frame):
+    from pyparamvalidate.core.validator import Validator
+
+    rules = [('is_int', (), {}), ('is_string', (), {}), ('is_not_none', (), {}), ('min_length', (2,), {}),
+             ('is_specific_value', ('active',), {}), ('customize', (lambda value: value == 'a',), {})]
+    for column in frame.columns:
+        for name, vargs, vkwargs in rules:
+            expected = []
+            for value in frame[column]:
+                try:
+                    getattr(Validator(value), name)(*vargs, **vkwargs)
+                    expected.append(True)
+                except Exception:
+                    expected.append(False)
+
+            result = DataFrameValidator().column(column, getattr(Rules(), name)(*vargs, **vkwargs)).validate(frame)
+            assert result.mask.tolist() == expected, (column, name)
+
+
+def test_transformed_values_are_passed_to_later_rules():
+    from pyparamvalidate.core.validator import Validator
+
+    frame = pandas.DataFrame({'name': [' ab ', 'abcd', '   ', None, 5, b' ']})
+    rules = Rules().is_not_empty().max_length(3)
+    expected = []
+    for value in frame['name']:
+        try:
+            Validator(value).is_not_empty().max_length(3)
+            expected.append(True)
+        except Exception:
+            expected.append(False)
+
+    result = DataFrameValidator().column('name', rules).validate(frame)
+    assert result.mask.tolist() == expected == [True, False, False, False, False, True]
+    assert DataFrameValidator().column('name', Rules().is_string().is_not_empty().max_length(3)) \
+        .validate(frame).mask.tolist()[0]
+
+
+def test_missing_column(frame):
+    result = DataFrameValidator().column('email', Rules().is_string()).validate(frame)
+    assert not result.mask.any()
+    assert result.failures == [ColumnFailure('email', 'missing_column', 5, [])]
+
+
+def test_column_requires_rules():
+    with pytest.raises(CallValidateMethodError):
+        DataFrameValidator().column('id', 'is_int')
@@ -0,0 +1,178 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pyparamvalidate.core.deadline import (DEADLINE_POOL_WORKERS, DEADLINE_WORKERS, ValidationNotStartedError, ValidationTimeoutError,
+                                            ValidationTimeoutWarning)
+from pyparamvalidate.core.memoize import register_pure_rule
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import CallValidateMethodError
+
+
+def slow_check(value, delay=0.5):
+    time.sleep(delay)
+    return True
+
+
+def test_parameter_deadline_fail():
+    @ParameterValidator("value", deadline=0.05).customize(slow_check)
+    def example_function(value):
+        return value
+
+    start = time.perf_counter()
+    with pytest.raises(ValidationTimeoutError) as exc_info:
+        example_function(1)
+    assert time.perf_counter() - start < 0.4
+    assert "value error: validation timed out after 0.05s" in str(exc_info.value)
+
+
+def test_parameter_deadline_does_not_affect_fast_rules():
+    @ParameterValidator("value", deadline=0.05).is_int().customize(lambda value: value > 0)
+    def example_function(value):
+        return value
+
+    assert example_function(1) == 1
+    with pytest.raises(ValueError) as exc_info:
+        example_function(-1)
+    assert not isinstance(exc_info.value, ValidationTimeoutError)
+
+
+def test_parameter_deadline_covers_pure_rules():
+    calls = []
+
+    @register_pure_rule
+    def slow_pure_check(value):
+        calls.append(value)
+        time.sleep(0.5)
+        return value > 0
+
+    @ParameterValidator("value", deadline=0.05, on_timeout="pass").is_int().customize(slow_pure_check)
+    def example_function(value):
+        return value
+
+    # 纯校验规则也受超时时间限制，不会在调用线程中执行快速校验
+    start = time.perf_counter()
+    assert example_function(-1) == -1
+    assert time.perf_counter() - start < 0.4
+    assert calls == [-1]
+    time.sleep(0.5)
+
+
+def test_rule_deadline_pass_and_skip():
+    @ParameterValidator("value").customize(slow_check).with_deadline(0.05, on_timeout="pass")
+    def pass_function(value):
+        return value
+
+    assert pass_function(1) == 1
+
+    @ParameterValidator("value").customize(slow_check).with_deadline(0.05, on_timeout="skip").is_int()
+    def skip_function(value):
+        return value
+
+    with pytest.warns(ValidationTimeoutWarning, match="customize timed out"):
+        assert skip_function(1) == 1
+
+    # 超时的规则之后的规则仍然执行
+    with pytest.warns(ValidationTimeoutWarning):
+        with pytest.raises(ValueError):
+            skip_function("1")
+
+
+def test_hung_rule_does_not_starve_other_rules():
+    @ParameterValidator("value").customize(slow_check, 0.3).with_deadline(0.02, on_timeout="pass")
+    def hung_function(value):
+        return value
+
+    # 占满 hung_function 的线程配额
+    for _ in range(DEADLINE_WORKERS):
+        hung_function(1)
+
+    # 其他规则的配额不受影响，仍然执行
+    @ParameterValidator("value").customize(lambda value: value > 0).with_deadline(0.2, on_timeout="pass")
+    def cheap_function(value):
+        return value
+
+    with pytest.raises(ValueError) as exc_info:
+        cheap_function(-5)
+    assert not isinstance(exc_info.value, (ValidationTimeoutError, ValidationNotStartedError))
+
+    # 没有开始执行的校验不会被视为通过
+    with pytest.raises(ValidationNotStartedError) as exc_info:
+        hung_function(1)
+    assert "value error: customize did not start within 0.02s" in str(exc_info.value)
+    time.sleep(0.3)
+
+
+def test_deadline_functions_share_one_pool():
+    def deadline_threads():
+        return sum(thread.name.startswith('pyparamvalidate-deadline') for thread in threading.enumerate())
+
+    functions = []
+    for _ in range(3 * DEADLINE_POOL_WORKERS):
+        @ParameterValidator("value", deadline=1).is_int()
+        def example_function(value):
+            return value
+
+        functions.append(example_function)
+
+    assert [function(1) for function in functions] == [1] * len(functions)
+    # 每个被装饰函数不会创建自己的线程池
+    assert deadline_threads() <= DEADLINE_POOL_WORKERS
+
+
+def test_rule_deadline_requires_rule():
+    with pytest.raises(CallValidateMethodError):
+        ParameterValidator("value").with_deadline(1)
+    with pytest.raises(CallValidateMethodError):
+        ParameterValidator("value", deadline=1, on_timeout="retry")
+
+
+def test_async_deadline():
+    @ParameterValidator("value", deadline=0.05).customize(slow_check)
+    async def example_function(value):
+        return value
+
+    async def main():
+        with pytest.raises(ValidationTimeoutError):
+            await example_function(1)
+
+        # 校验在线程池中执行，不阻塞事件循环
+        ticks = []
+
+        async def tick():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        results = await asyncio.gather(example_function(1), tick(), return_exceptions=True)
+        assert isinstance(results[0], ValidationTimeoutError)
+        assert len(ticks) == 3
+
+    asyncio.run(main())
+
+
+def test_async_deadline_not_started():
+    @ParameterValidator("value", deadline=0.05, on_timeout="pass").customize(slow_check, 0.3)
+    async def example_function(value):
+        return value
+
+    async def main():
+        assert await asyncio.gather(*(example_function(i) for i in range(DEADLINE_WORKERS))) == \
+               list(range(DEADLINE_WORKERS))
+        with pytest.raises(ValidationNotStartedError):
+            await example_function(1)
+
+    asyncio.run(main())
+    time.sleep(0.3)
+
+
+def test_async_function_without_deadline_keeps_sync_wrapper():
+    @ParameterValidator("value").is_int()
+    async def example_function(value):
+        return value
+
+    # 没有设置超时时间时，参数校验在调用时执行
+    with pytest.raises(ValueError):
+        example_function("1")
@@ -0,0 +1,90 @@
+import sys
+from collections import namedtuple
+
+from pyparamvalidate.utils.dict_utils import DictShape, DictUtility
+
+
+def test_trim_dict():
+    nested_dict = {' key1 ': {'nested_key1': ' value1 ', 'nested_key2': {'nested_nested_key': ' nested_value '}}}
+    assert DictUtility().trim_dict(nested_dict) == {
+        'key1': {'nested_key1': 'value1', 'nested_key2': {'nested_nested_key': 'nested_value'}}}
+    # 原字典不变
+    assert ' key1 ' in nested_dict
+
+    assert DictUtility().trim_dict({' a ': ' b '}, trim_key=False) == {' a ': 'b'}
+    assert DictUtility().trim_dict({' a ': ' b '}, trim_value=False) == {'a': ' b '}
+
+
+def test_trim_dict_lists_and_tuples():
+    Point = namedtuple('Point', ['x', 'y'])
+    data = {'tags': [' a ', {' k ': ' v '}, 1], 'pair': (' x ', 'y'), 'point': Point(' 1 ', 2)}
+    assert DictUtility().trim_dict(data) == {'tags': ['a', {'k': 'v'}, 1], 'pair': ('x', 'y'), 'point': Point('1', 2)}
+
+
+def test_trim_dict_copy_on_write():
+    unchanged = {'a': [1, 'b', {'c': 'd'}]}
+    assert DictUtility().trim_dict(unchanged) is unchanged
+
+    data = {'a': {'b': 'c'}, 'd': ' e '}
+    result = DictUtility().trim_dict(data)
+    assert result is not data
+    # 没有变化的子字典被共用
+    assert result['a'] is data['a']
+
+
+def test_trim_dict_inplace():
+    inner = [' a ', ('b ',)]
+    data = {' k ': inner, 'v': ' x ', 'z': 1}
+    result = DictUtility().trim_dict(data, inplace=True)
+    assert result is data
+    assert data == {'k': ['a', ('b',)], 'v': 'x', 'z': 1}
+    assert list(data) == ['k', 'v', 'z']
+    assert data['k'] is inner
+
+
+def test_trim_dict_deeply_nested():
+    data = leaf = {}
+    for _ in range(sys.getrecursionlimit() * 2):
+        leaf['child'] = {}
+        leaf = leaf['child']
+    leaf[' key '] = ' value '
+
+    result = DictUtility().trim_dict(data)
+    while 'child' in result:
+        result = result['child']
+    assert result == {'key': 'value'}
+
+
+def test_trim_dict_cycle():
+    data = {' a ': []}
+    data[' a '].append(data)
+    result = DictUtility().trim_dict(data, inplace=True)
+    assert list(result) == ['a']
+    assert result['a'][0] is data
+
+
+def test_is_similar_dict():
+    template = {'name': 'a', 'age': 1, 'address': {'city': 'b'}}
+    assert DictUtility().is_similar_dict({' name ': 'x', 'age': 2, 'address': {'city ': 'y'}}, template)
+    assert not DictUtility().is_similar_dict({' name ': 'x', 'age': 2, 'address': {'city ': 'y'}}, template,
+                                             ignore_keys_whitespace=False)
+    assert not DictUtility().is_similar_dict({'name': 'x', 'age': '2', 'address': {'city': 'y'}}, template)
+    assert not DictUtility().is_similar_dict({'name': 'x', 'age': 2, 'address': {'town': 'y'}}, template)
+    assert not DictUtility().is_similar_dict({'name': 'x', 'age': 2}, template)
+
+    # 与原有规则一致：值是模板中对应值的类型的实例即可
+    assert DictUtility().is_similar_dict({'flag': True}, {'flag': 1})
+    assert not DictUtility().is_similar_dict({'flag': 1}, {'flag': True})
+
+
+def test_dict_shape():
+    shape = DictShape({'name': 'a', 'address': {'city': 'b'}})
+    assert DictUtility().is_similar_dict({'name': 'x', 'address': {'city': 'y'}}, shape)
+    assert shape == DictShape({' name': 'c', 'address': {'city': 'd'}})
+    assert shape.signature != DictShape({'name': 'c', 'address': {'city': 1}}).signature
+
+
+def test_group_by_shape():
+    dicts = [{'a': 1}, {'a': 'x'}, {' a ': 2}, {'a': {'b': 1}}, {'a': {'b': 2}}]
+    groups = DictUtility().group_by_shape(dicts)
+    assert list(groups.values()) == [[dicts[0], dicts[2]], [dicts[1]], [dicts[3], dicts[4]]]
@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+from pyparamvalidate.core.fastpath import FAILED, build_fast_check, generate_source
+from pyparamvalidate.core.memoize import register_pure_rule
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import Validator
+
+
+@register_pure_rule
+def is_even(value, offset=0):
+    return (value + offset) % 2 == 0
+
+
+RULES = [
+    ('is_string', (), {}),
+    ('is_int', (), {}),
+    ('is_positive', (), {}),
+    ('is_float', (), {}),
+    ('is_number', (), {}),
+    ('is_list', (), {}),
+    ('is_dict', (), {}),
+    ('is_set', (), {}),
+    ('is_tuple', (), {}),
+    ('is_not_none', (), {}),
+    ('is_not_empty', (), {}),
+    ('is_not_empty', (), {'stripped': False}),
+    ('is_allowed_value', (["a", 1],), {}),
+    ('is_specific_value', ("a",), {}),
+    ('max_length', (2, "msg"), {}),
+    ('min_length', (), {'min_length': 2}),
+    ('is_substring', ("abc",), {}),
+    ('is_subset', ({1, 2},), {}),
+    ('is_sublist', ([1, 2],), {}),
+    ('contains_substring', ("a",), {}),
+    ('contains_subset', ({1},), {}),
+    ('contains_sublist', ([1],), {}),
+    ('is_file_suffix', (".txt",), {}),
+    ('is_method', (), {}),
+    ('customize', (is_even, 1), {'exception_msg': 'msg'}),
+]
+
+VALUES = ["", " ", "a", "ab", " ab ", "abc", "a.txt", 0, 1, 2, -1, 1.5, True, None, [], [1], [1, 2, 3], {1}, {1, 2, 3},
+          (), (1,), {}, {"a": 1}, len]
+
+
+def _slow_check(rules, value):
+    validator = Validator(value)
+    try:
+        for method_name, vargs, vkwargs in rules:
+            getattr(validator, method_name)(*vargs, **vkwargs)
+    except Exception:
+        return False
+    return True
+
+
+def _fast_check(rules, value):
+    fast_check = build_fast_check([(getattr(Validator, name), vargs, vkwargs) for name, vargs, vkwargs in rules])
+    assert fast_check is not None
+    try:
+        return fast_check(value) is not FAILED
+    except Exception:
+        return False
+
+
+@pytest.mark.parametrize('rule', RULES, ids=lambda rule: rule[0])
+def test_fast_check_equivalent_to_validator(rule):
+    for value in VALUES:
+        assert _fast_check([rule], value) == _slow_check([rule], value), value
+
+
+def test_fast_check_stripped_value_used_by_following_rules():
+    rules = [('is_not_empty', (), {}), ('max_length', (2,), {})]
+    assert _fast_check(rules, " ab ") is True
+    assert _slow_check(rules, " ab ") is True
+
+    fast_check = build_fast_check([(getattr(Validator, name), vargs, vkwargs) for name, vargs, vkwargs in rules])
+    assert fast_check(" ab ") == "ab"
+    assert fast_check("    ") is FAILED
+
+
+def test_fast_check_not_generated():
+    def impure(value):
+        return True
+
+    for rules in ([('is_file', (), {})], [('customize', (impure,), {})], [('max_length', (), {})]):
+        assert generate_source([(getattr(Validator, name), vargs, vkwargs) for name, vargs, vkwargs in rules]) is None
+
+
+def test_fast_check_shared_source():
+    first = generate_source([(Validator.max_length, (10,), {})])
+    second = generate_source([(Validator.max_length, (20, "msg"), {})])
+    assert first[0] == second[0]
+    assert first[1] == [10] and second[1] == [20]
+
+
+def test_fast_check_fallback_error_message():
+    @ParameterValidator("param").is_int("Value must be an integer").is_positive("Value must be positive")
+    def example_function(param):
+        return param
+
+    assert example_function(5) == 5
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function("5")
+    assert "Value must be an integer" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(-5)
+    assert "Value must be positive" in str(exc_info.value)
+
+    @ParameterValidator("param").is_file("Value must be a valid file path")
+    def example_function(param):
+        return param
+
+    assert example_function(__file__) == __file__
+    with pytest.raises(ValueError):
+        example_function(os.path.dirname(__file__))
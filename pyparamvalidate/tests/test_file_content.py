@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from pyparamvalidate.core.file_content import FileProbe, count_lines
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import Validator
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / 'users.csv'
+    path.write_bytes('\ufeffid,name,"city"\r\n1,张三,北京\r\n2,李四,上海\r\n'.encode())
+    return str(path)
+
+
+def test_file_size(csv_file):
+    size = os.path.getsize(csv_file)
+    assert Validator(csv_file).is_file().file_size(min_size=size, max_size=size)
+
+    with pytest.raises(ValueError):
+        Validator(csv_file).file_size(max_size=size - 1)
+    with pytest.raises(ValueError):
+        Validator(os.path.dirname(csv_file)).file_size(max_size=size)
+    with pytest.raises(ValueError):
+        Validator(csv_file + '.missing').file_size(max_size=size)
+
+
+def test_rules_share_one_stat(csv_file, monkeypatch):
+    calls = []
+    stat = os.stat
+    monkeypatch.setattr(os, 'stat', lambda path: calls.append(path) or stat(path))
+
+    Validator(csv_file).is_file().file_size(max_size=1024).file_magic(b'\xef\xbb\xbf').has_csv_header(['id'])
+    assert calls == [csv_file]
+
+
+def test_file_magic(tmp_path):
+    path = tmp_path / 'archive.zip'
+    path.write_bytes(b'PK\x03\x04' + bytes(1 << 20))
+
+    assert Validator(str(path)).file_magic((b'%PDF-', b'PK\x03\x04'))
+    with pytest.raises(ValueError):
+        Validator(str(path)).file_magic(b'%PDF-')
+
+    # 只读取文件头
+    probe = FileProbe(str(path))
+    probe.head(4)
+    assert len(probe._head) == 4
+
+
+def test_utf8_and_lines(csv_file, tmp_path):
+    assert Validator(csv_file).is_utf8_file().max_file_lines(3)
+    with pytest.raises(ValueError):
+        Validator(csv_file).max_file_lines(2)
+
+    binary = tmp_path / 'binary.bin'
+    binary.write_bytes(b'\xff\xfe\x00')
+    with pytest.raises(ValueError):
+        Validator(str(binary)).is_utf8_file()
+
+    empty = tmp_path / 'empty.txt'
+    empty.write_bytes(b'')
+    assert Validator(str(empty)).is_utf8_file().max_file_lines(0)
+
+    no_newline = tmp_path / 'no_newline.txt'
+    no_newline.write_bytes(b'a\nb')
+    assert count_lines(FileProbe(str(no_newline))) == 2
+    assert count_lines(FileProbe(str(no_newline)), limit=0) == 1
+
+
+def test_csv_header(csv_file):
+    assert Validator(csv_file).has_csv_header(['name', 'id'])
+    assert Validator(csv_file).has_csv_header(['id', 'name', 'city'], exact=True)
+
+    with pytest.raises(ValueError):
+        Validator(csv_file).has_csv_header(['name', 'id'], exact=True)
+    with pytest.raises(ValueError):
+        Validator(csv_file).has_csv_header(['email'])
+
+
+def test_json_file(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('  \n[{"a": 1}]')
+
+    @ParameterValidator("path").is_file().is_json_file(root='array', exception_msg="must be a JSON array file")
+    def example_function(path):
+        return path
+
+    assert example_function(str(path)) == str(path)
+
+    path.write_text('a,b\n')
+    with pytest.raises(ValueError) as exc_info:
+        example_function(str(path))
+    assert "must be a JSON array file" in str(exc_info.value)
@@ -0,0 +1,79 @@
+import pytest
+
+from pyparamvalidate.core.fastpath import generate_source
+from pyparamvalidate.core.fusion import dedupe_rules, fuse_rules
+from pyparamvalidate.core.memoize import register_pure_rule
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import Validator
+
+
+def test_dedupe_rules():
+    rules = ((Validator.is_string, (), {}), (Validator.max_length, (10,), {}), (Validator.is_string, (), {}),
+             (Validator.max_length, (10,), {'exception_msg': 'too long'}))
+    assert dedupe_rules(rules) == (rules[0], rules[1], rules[3])
+
+    # 不越过修改参数值的规则
+    rules = ((Validator.min_length, (3,), {}), (Validator.is_not_empty, (), {}), (Validator.min_length, (3,), {}))
+    assert dedupe_rules(rules) == rules
+
+
+def test_fuse_rules():
+    def is_known(value):
+        return True
+
+    rules = ((Validator.is_string, (), {}), (Validator.min_length, (3,), {}), (Validator.max_length, (10,), {}),
+             (Validator.customize, (is_known,), {}), (Validator.is_string, (), {}))
+    fused = fuse_rules(rules)
+    assert len(fused) == 3
+    assert fused[0][0].rules == rules[:3]
+    assert fused[1:] == rules[3:]
+
+
+def test_length_range_uses_one_len_call():
+    source, constants = generate_source(((Validator.min_length, (3,), {}), (Validator.max_length, (10,), {})))
+    assert source.count('len(value)') == 1
+    assert 'c0 <= len(value) <= c1' in source
+    assert constants == [3, 10]
+
+
+@pytest.mark.parametrize('value, message', [
+    (1, 'must be a string'),
+    ('ab', 'too short'),
+    ('a' * 11, 'too long'),
+])
+def test_fused_rules_keep_error_messages(value, message):
+    def is_known(value):
+        return True
+
+    @ParameterValidator("name").is_string("must be a string").min_length(3, "too short") \
+        .max_length(10, "too long").is_string("must be a string").customize(is_known)
+    def example_function(name):
+        return name
+
+    assert example_function("abc") == "abc"
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(value)
+    assert message in str(exc_info.value)
+
+
+def test_failed_fast_check_runs_rules_once():
+    calls = []
+
+    @register_pure_rule
+    def is_known_name(value):
+        calls.append(value)
+        return value == "abc"
+
+    @ParameterValidator("name").is_string().customize(is_known_name)
+    def example_function(name):
+        return name
+
+    assert example_function("abc") == "abc"
+    assert len(calls) == 1
+
+    # 快速校验不通过之后，常规校验流程直接执行原规则，不再执行合并之后的规则
+    calls.clear()
+    with pytest.raises(ValueError):
+        example_function("xyz")
+    assert len(calls) == 2
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+
+# 参照：优化前 import pyparamvalidate 时导入的依赖模块(不包括 pyparamvalidate 自身的模块)，
+# 在同一次测试中测量，与 import pyparamvalidate 的耗时比较，不依赖机器的快慢
+BASELINE_DEPENDENCIES = ('functools', 'inspect', 'os', 'logging', 'typing', 'schema')
+
+# 测量次数，取最小值，减少其他进程的干扰
+IMPORT_TIME_RUNS = 5
+
+# import pyparamvalidate 时不应加载的重量级模块
+DEFERRED_MODULES = ('schema', 'inspect', 'logging', 'threading')
+
+# import pyparamvalidate 时不应加载的 pyparamvalidate 模块，在第一次使用对应的功能时才导入
+LAZY_MODULES = (
+    'pyparamvalidate.core.adaptive', 'pyparamvalidate.core.buffer', 'pyparamvalidate.core.class_validator',
+    'pyparamvalidate.core.container', 'pyparamvalidate.core.dataframe', 'pyparamvalidate.core.deadline',
+    'pyparamvalidate.core.file_content', 'pyparamvalidate.core.fusion', 'pyparamvalidate.core.json_schema',
+    'pyparamvalidate.core.record', 'pyparamvalidate.core.return_validator', 'pyparamvalidate.core.single_flight',
+    'pyparamvalidate.utils.compact_set',
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _import_time(statement, top_level=False):
+    """
+    使用 python -X importtime 在子进程中执行 statement，返回 {模块名: 累计耗时(微秒)}
+
+    :param top_level: 是否只返回直接导入(不是被其他模块导入)的模块
+    """
+    # 允许写入字节码缓存，参照模块和 pyparamvalidate 都不包含编译源码的耗时
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True, env=env)
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        if top_level and module.startswith('  '):
+            continue
+        timings[module.strip()] = int(cumulative)
+    return timings
+
+
+def _baseline_cost():
+    # 解释器启动时已经导入的模块(如 os)不会出现在输出中，耗时为 0
+    timings = _import_time(f'import {", ".join(BASELINE_DEPENDENCIES)}', top_level=True)
+    return sum(timings.get(module, 0) for module in BASELINE_DEPENDENCIES)
+
+
+def test_import_does_not_load_heavy_modules():
+    timings = _import_time('import pyparamvalidate')
+    for module in DEFERRED_MODULES + LAZY_MODULES:
+        assert module not in timings, f'"{module}" should not be imported by "import pyparamvalidate"'
+
+
+def test_lazy_names():
+    import pyparamvalidate
+    from pyparamvalidate.core.container import Rules
+
+    assert pyparamvalidate.Rules is Rules
+    assert {'Rules', 'DataFrameValidator', 'validate_methods', 'ParameterValidator'} <= set(dir(pyparamvalidate))
+
+
+def test_import_time_budget():
+    # 第一次执行写入字节码缓存
+    _import_time('import pyparamvalidate')
+    costs, baselines = [], []
+    for _ in range(IMPORT_TIME_RUNS):
+        costs.append(_import_time('import pyparamvalidate')['pyparamvalidate'])
+        baselines.append(_baseline_cost())
+    # 整个包的导入耗时低于优化前仅导入依赖模块的耗时
+    assert min(costs) < min(baselines)
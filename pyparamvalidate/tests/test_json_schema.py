@@ -0,0 +1,82 @@
+import pytest
+
+from pyparamvalidate.core.json_schema import compile_json_schema
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.validator import CallValidateMethodError, Validator
+
+USER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "maxLength": 8, "pattern": "^[a-z]+$"},
+        "age": {"type": "integer", "minimum": 0, "exclusiveMaximum": 150},
+        "tags": {"type": "array", "items": {"enum": ["a", "b"]}, "maxItems": 2},
+        "extra": {"type": ["string", "null"]},
+    },
+    "required": ["name"],
+    "additionalProperties": False,
+}
+
+
+def test_json_schema_validate():
+    assert Validator({"name": "tom", "age": 3, "tags": ["a"], "extra": None}).json_schema_validate(USER_SCHEMA)
+
+
+@pytest.mark.parametrize('value, message', [
+    ([], 'type must be object'),
+    ({}, 'user.name error: "None" is invalid. due to: is a required property'),
+    ({"name": "Tom"}, "user.name error"),
+    ({"name": ""}, "length must be >= 1"),
+    ({"name": "tom", "age": True}, "user.age error"),
+    ({"name": "tom", "age": 150}, "must be < 150"),
+    ({"name": "tom", "tags": ["a", "c"]}, "user.tags.1 error"),
+    ({"name": "tom", "tags": ["a", "a", "a"]}, "must have at most 2 items"),
+    ({"name": "tom", "email": "x"}, "user.email error"),
+])
+def test_json_schema_errors(value, message):
+    with pytest.raises(ValueError) as exc_info:
+        Validator(value, field="user").json_schema_validate(USER_SCHEMA)
+    assert message in str(exc_info.value)
+
+
+def test_compile_cache():
+    reordered = dict(reversed(list(USER_SCHEMA.items())))
+    assert compile_json_schema(USER_SCHEMA) is compile_json_schema(reordered)
+
+
+def test_compile_cache_by_identity(monkeypatch):
+    from pyparamvalidate.core import json_schema
+
+    calls = []
+    schema_hash = json_schema.schema_hash
+    monkeypatch.setattr(json_schema, "schema_hash", lambda schema: calls.append(schema) or schema_hash(schema))
+
+    schema = {"type": "object", "properties": {f"p{i}": {"type": "integer"} for i in range(300)}}
+    for _ in range(10):
+        assert Validator({"p1": 1}).json_schema_validate(schema)
+    # 同一个 schema 对象只在第一次校验时计算哈希值
+    assert len(calls) == 1
+
+
+def test_additional_properties_schema():
+    schema = {"type": "object", "properties": {"a": {}}, "additionalProperties": {"type": "integer"}}
+    assert Validator({"a": "x", "b": 1}).json_schema_validate(schema)
+    with pytest.raises(ValueError):
+        Validator({"a": "x", "b": "y"}).json_schema_validate(schema)
+
+
+def test_unsupported_keywords():
+    with pytest.raises(CallValidateMethodError):
+        compile_json_schema({"oneOf": [{"type": "string"}]})
+
+
+def test_json_schema_with_parameter_validator():
+    @ParameterValidator("user").json_schema_validate(USER_SCHEMA, "invalid user")
+    def example_function(user):
+        return user
+
+    assert example_function({"name": "tom"}) == {"name": "tom"}
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function({"name": 1})
+    assert "user.name error" in str(exc_info.value)
+    assert "invalid user" in str(exc_info.value)
@@ -0,0 +1,99 @@
+import pytest
+
+from pyparamvalidate.core.memoize import LRUCache, memo_key, register_pure_rule
+from pyparamvalidate.core.param_validator import ParameterValidator
+
+
+def test_memoize_builtin_rules():
+    validator = ParameterValidator("param", memoize=True).is_string().is_allowed_value(["zh", "en"])
+
+    @validator
+    def example_function(param):
+        return param
+
+    assert example_function("zh") == "zh"
+    assert example_function("zh") == "zh"
+    assert example_function(param="en") == "en"
+    assert validator.cache_info() == (1, 2, 1024, 2)
+
+    # 校验失败的值不缓存，每次都抛出相同的异常
+    for _ in range(2):
+        with pytest.raises(ValueError) as exc_info:
+            example_function("fr")
+        assert "invalid" in str(exc_info.value)
+    assert validator.cache_info().currsize == 2
+
+    validator.cache_clear()
+    assert validator.cache_info() == (0, 0, 1024, 0)
+
+
+def test_memoize_pure_custom_rule():
+    calls = []
+
+    @register_pure_rule
+    def is_even(value):
+        calls.append(value)
+        return value % 2 == 0
+
+    @ParameterValidator("param", memoize=True).customize(is_even, exception_msg="Value must be an even number")
+    def example_function(param):
+        return param
+
+    for _ in range(3):
+        assert example_function(4) == 4
+    assert calls == [4]
+
+
+def test_memoize_bypassed():
+    calls = []
+
+    def is_even(value):
+        calls.append(value)
+        return value % 2 == 0
+
+    # 未注册为纯函数的自定义校验函数，不启用缓存
+    validator = ParameterValidator("param", memoize=True).customize(is_even)
+
+    @validator
+    def example_function(param):
+        return param
+
+    example_function(4)
+    example_function(4)
+    assert calls == [4, 4]
+    assert validator.cache_info().currsize == 0
+
+    # 可变参数值，不启用缓存
+    validator = ParameterValidator("param", memoize=True).is_list()
+
+    @validator
+    def example_function(param):
+        return param
+
+    example_function([1, 2])
+    example_function([1, 2])
+    assert validator.cache_info() == (0, 0, 1024, 0)
+
+    # 未开启 memoize
+    assert ParameterValidator("param").is_string().cache_info() is None
+
+
+def test_memo_key():
+    assert memo_key(1) != memo_key(1.0) != memo_key(True)
+    assert memo_key((1, "a")) == memo_key((1, "a"))
+    assert memo_key((1, [2])) is None
+    assert memo_key({"a": 1}) is None
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.add("a")
+    cache.add("b")
+    assert "a" in cache
+    cache.add("c")
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.info() == (3, 1, 2, 2)
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
@@ -401,3 +401,153 @@ def test_custom_validator():
     with pytest.raises(ValueError) as exc_info:
         example_function(param=5)
     assert "Value must be an even number" in str(exc_info.value)
+
+
+def test_normalize_validator():
+    # 未开启 normalize 时，被装饰函数接收原始参数值
+    @ParameterValidator("param").is_not_empty()
+    def example_function(param):
+        return param
+
+    assert example_function("  test  ") == "  test  "
+
+    # 开启 normalize 时，被装饰函数接收校验之后的参数值，位置参数和关键字参数均可
+    @ParameterValidator("param", normalize=True).is_not_empty()
+    def example_function(other, param, *args, **kwargs):
+        return other, param, args, kwargs
+
+    assert example_function(" a ", "  test  ", 1, 2) == (" a ", "test", (1, 2), {})
+    assert example_function(" a ", param="  test  ", extra=1) == (" a ", "test", (), {"extra": 1})
+
+    # 参数值没有变化时，不重建参数
+    value = "test"
+    assert example_function(" a ", value)[1] is value
+
+
+def test_normalize_schema_validator():
+    import schema
+
+    @ParameterValidator("param", normalize=True).schema_validate(schema.Schema(schema.Use(int)))
+    def example_function(param):
+        return param
+
+    assert example_function("12") == 12
+
+
+def test_normalize_keyword_only_and_default():
+    import schema
+
+    @ParameterValidator("param", normalize=True).schema_validate(schema.Schema(schema.Or(None, str, schema.Use(str))))
+    def example_function(*, param=None):
+        return param
+
+    assert example_function(param=12) == "12"
+    assert example_function() is None
+
+
+def test_normalize_with_memoize():
+    validator = ParameterValidator("param", memoize=True, normalize=True).is_string().is_not_empty()
+
+    @validator
+    def example_function(param):
+        return param
+
+    assert example_function("  test  ") == "test"
+    assert example_function("  test  ") == "test"
+    assert validator.cache_info().hits == 1
+
+
+def test_missing_argument():
+    @ParameterValidator("param").is_string()
+    def example_function(param):
+        return param
+
+    with pytest.raises(TypeError):
+        example_function()
+
+
+def test_var_positional_each():
+    from pyparamvalidate.core.container import Rules
+
+    @ParameterValidator("items").each(Rules().is_int())
+    def only_items(*items):
+        return items
+
+    @ParameterValidator("items").max_length(2).each(Rules().is_int())
+    def with_prefix(prefix, *items):
+        return prefix, items
+
+    assert only_items(1, 2) == (1, 2)
+    assert with_prefix("a", 1, 2) == ("a", (1, 2))
+    assert with_prefix("a") == ("a", ())
+
+    with pytest.raises(ValueError) as exc_info:
+        only_items(1, "2")
+    assert 'items[1] error' in str(exc_info.value)
+
+    with pytest.raises(ValueError):
+        with_prefix(1, 2, 3, 4)
+
+
+def test_var_keyword_keys():
+    from pyparamvalidate.core.container import Rules
+
+    @ParameterValidator("options").keys(Rules().max_length(8))
+    def plugin(name=None, **options):
+        return options
+
+    # 命名参数 name 不属于 **options，也不会被当作 **options 参数的值
+    assert plugin(name="a", timeout=1) == {"timeout": 1}
+    assert plugin(options=1) == {"options": 1}
+
+    with pytest.raises(ValueError) as exc_info:
+        plugin(name="a", very_long_option=1)
+    assert "options key 'very_long_option' error" in str(exc_info.value)
+
+
+def test_var_keyword_values_matching():
+    from pyparamvalidate.core.container import Rules
+
+    @ParameterValidator("options.timeout").is_int()
+    @ParameterValidator("options").values_matching(r"retry_.*", Rules().is_int().is_positive())
+    def example_function(name, **options):
+        return name, options
+
+    assert example_function("a", timeout=1, retry_count=3, other="x") == \
+           ("a", {"timeout": 1, "retry_count": 3, "other": "x"})
+    # name 不属于 **options
+    assert example_function(name="a", timeout=1) == ("a", {"timeout": 1})
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function("a", timeout="1")
+    assert "options.timeout error" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function("a", timeout=1, retry_count=0, retry_delay=-1)
+    assert "options['retry_count'] error" in str(exc_info.value)
+    assert "failed elements: 'retry_count', 'retry_delay'" in str(exc_info.value)
+
+
+def test_var_keyword_without_named_parameters_is_not_copied():
+    seen = []
+
+    @ParameterValidator("options").customize(lambda options: seen.append(options) or True)
+    def example_function(**options):
+        return options
+
+    example_function(a=1)
+    assert seen == [{"a": 1}]
+
+
+def test_skip_missing_and_allow_none():
+    @ParameterValidator("limit", skip_missing=True).is_int()
+    @ParameterValidator("offset", allow_none=True).is_int()
+    def example_function(limit="all", offset=None):
+        return limit, offset
+
+    assert example_function() == ("all", None)
+    assert example_function(10, None) == (10, None)
+    with pytest.raises(ValueError):
+        example_function(limit="all")
+    with pytest.raises(ValueError):
+        example_function(offset="1")
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.path import compile_accessor, parse_path, resolve_path, shared_prefixes
+from pyparamvalidate.core.validator import Validator
+
+
+class CountingDict(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+def test_parse_path():
+    assert parse_path("payload.items.0.id") == ("payload", "items", 0, "id")
+    assert parse_path(["payload", "0"]) == ("payload", "0")
+    assert parse_path("param") == ("param",)
+
+
+def test_compile_accessor():
+    data = {"user": {"address": {"zip": "100000"}, "tags": ["a", "b"]}, "obj": SimpleNamespace(name="x")}
+    assert compile_accessor(("user", "address", "zip"))(data) == "100000"
+    assert compile_accessor(("user", "tags", 1))(data) == "b"
+    assert compile_accessor(("obj", "name"))(data) == "x"
+    assert compile_accessor(())(data) is data
+
+    # 路径不存在时返回 None
+    assert compile_accessor(("user", "phone"))(data) is None
+    assert compile_accessor(("user", "tags", 5))(data) is None
+    assert compile_accessor(("user", "address", "zip", "code"))(data) is None
+    assert compile_accessor(("obj", "age"))(data) is None
+    assert compile_accessor(("missing", "a", "b"))(data) is None
+
+
+def test_shared_prefixes():
+    paths = [("p", "user", "address", "zip"), ("p", "user", "address", "city"), ("p", "user", "name"), ("p", "id")]
+    assert shared_prefixes(paths) == {
+        ("p", "user", "address", "zip"): ("p", "user", "address"),
+        ("p", "user", "address", "city"): ("p", "user", "address"),
+        ("p", "user", "name"): ("p", "user"),
+    }
+
+
+def test_validator_path():
+    payload = {"user": {"address": {"zip": "100000"}}}
+    assert Validator(payload, path="user.address.zip").is_string().value == "100000"
+    assert resolve_path(payload, ["user", "address"]) == {"zip": "100000"}
+
+    with pytest.raises(ValueError) as exc_info:
+        Validator(payload, path="user.address.zip").is_int()
+    assert "user.address.zip error" in str(exc_info.value)
+
+
+def test_parameter_validator_path():
+    @ParameterValidator("payload.user.address.zip").is_string().max_length(6, "zip code is too long")
+    @ParameterValidator(["payload", "items", 0, "id"]).is_int()
+    def example_function(payload):
+        return payload
+
+    payload = {"user": {"address": {"zip": "100000"}}, "items": [{"id": 1}]}
+    assert example_function(payload) is payload
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function({"user": {"address": {"zip": "1000000"}}, "items": [{"id": 1}]})
+    assert "payload.user.address.zip error" in str(exc_info.value)
+    assert "zip code is too long" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(payload={"user": {"address": {"zip": "100000"}}, "items": []})
+    assert "payload.items.0.id error" in str(exc_info.value)
+
+
+def test_parameter_validator_shared_prefix():
+    @ParameterValidator("payload.user.address.zip").is_string()
+    @ParameterValidator("payload.user.address.city").is_string()
+    def example_function(payload):
+        return payload
+
+    user = CountingDict(address={"zip": "100000", "city": "Beijing"})
+    payload = CountingDict(user=user)
+    example_function(payload)
+
+    # 公共前缀 payload.user.address 只访问一次
+    assert payload.reads == 1
+    assert user.reads == 1
+
+
+def test_parameter_validator_path_not_normalized():
+    @ParameterValidator("payload.name", normalize=True).is_not_empty()
+    def example_function(payload):
+        return payload
+
+    payload = {"name": "  John  "}
+    assert example_function(payload) == {"name": "  John  "}
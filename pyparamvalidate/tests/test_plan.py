@@ -0,0 +1,106 @@
+import functools
+import gc
+import time
+
+import pytest
+
+from pyparamvalidate import compile_all, warmup
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.plan import _registry
+
+# 装饰 10000 个函数的耗时上限(秒)，留有足够余量，避免在较慢的机器上误报
+DECORATION_TIME_BUDGET = 2.0
+
+
+def _decorate(count):
+    functions = []
+    for _ in range(count):
+        @ParameterValidator("name").is_string().is_not_empty()
+        @ParameterValidator("age").is_int().is_positive()
+        def example_function(name, age):
+            return name, age
+
+        functions.append(example_function)
+    return functions
+
+
+def test_decoration_time_10k():
+    start = time.perf_counter()
+    functions = _decorate(10_000)
+    elapsed = time.perf_counter() - start
+    print(f'\ndecorate 10k functions: {elapsed * 1000:.1f} ms')
+    assert elapsed < DECORATION_TIME_BUDGET
+
+    start = time.perf_counter()
+    assert compile_all() >= 10_000
+    print(f'compile 10k validation plans: {(time.perf_counter() - start) * 1000:.1f} ms')
+
+    assert functions[0]("John", 25) == ("John", 25)
+
+
+def test_plan_registry_is_weak():
+    functions = _decorate(10)
+    count = len(_registry)
+    del functions
+    gc.collect()
+    assert len(_registry) == count - 10
+
+
+def test_stacked_decorators_merged():
+    @ParameterValidator("name").is_string()
+    @ParameterValidator("age").is_int()
+    def example_function(name, age):
+        return name, age
+
+    func, decorators = example_function.__pyparamvalidate__
+    assert func.__name__ == "example_function"
+    assert [decorator.param_name for _, decorator in decorators] == ["name", "age"]
+    assert example_function.__wrapped__ is func
+
+
+def test_third_party_decorator_between_validators_is_kept():
+    calls = []
+
+    def logged(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @ParameterValidator("a").is_int()
+    @logged
+    @ParameterValidator("b").is_string()
+    def example_function(a, b):
+        return a, b
+
+    assert example_function(1, "x") == (1, "x")
+    assert calls == [(1, "x")]
+    # 内层校验装饰器仍然生效
+    with pytest.raises(ValueError, match='b error'):
+        example_function(1, 2)
+    # 外层 wrapper 不与 logged 包装的 wrapper 合并
+    _, decorators = example_function.__pyparamvalidate__
+    assert [decorator.param_name for _, decorator in decorators] == ["a"]
+
+
+def test_warmup():
+    @ParameterValidator("param").is_string()
+    def example_function(param):
+        return param
+
+    assert warmup() >= 1
+    assert example_function("test") == "test"
+
+    with pytest.raises(ValueError):
+        example_function(123)
+
+
+def test_warmup_freeze():
+    try:
+        assert warmup(freeze=True) >= 0
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
@@ -0,0 +1,119 @@
+import dataclasses
+import sys
+from dataclasses import field
+
+import pytest
+
+from pyparamvalidate.core.container import Rules
+from pyparamvalidate.core.record import generate_init, validated_dataclass
+from pyparamvalidate.core.validator import CallValidateMethodError
+
+
+@validated_dataclass
+class Point:
+    x: int
+    y: int = 0
+    name: str = field(default="", metadata={"rules": Rules().max_length(8)})
+    tags: list = field(default_factory=list)
+    note: str = None
+
+
+def test_generated_init():
+    point = Point(1, 2, "a")
+    assert (point.x, point.y, point.name, point.tags, point.note) == (1, 2, "a", [], None)
+    assert Point(1).tags is not Point(1).tags
+    assert Point.__init__.__qualname__ == "Point.__init__"
+
+    with pytest.raises(ValueError) as exc_info:
+        Point("1")
+    assert 'x error: "1" is invalid' in str(exc_info.value)
+    # 异常不会带上快速校验内部的 ValueError
+    assert exc_info.value.__context__ is None
+
+    with pytest.raises(ValueError) as exc_info:
+        Point(1, name="too long name")
+    assert "name error" in str(exc_info.value)
+
+    with pytest.raises(ValueError):
+        Point(1, tags=())
+
+    # 默认值为 None 的字段允许传入 None，其他值仍然校验
+    assert Point(1, note=None).note is None
+    with pytest.raises(ValueError) as exc_info:
+        Point(1, note=1)
+    assert "note error" in str(exc_info.value)
+
+
+def test_float_field_accepts_int():
+    @validated_dataclass
+    class Price:
+        amount: float
+
+    assert Price(1).amount == 1
+    assert Price(1.5).amount == 1.5
+    for amount in (True, "1"):
+        with pytest.raises(ValueError) as exc_info:
+            Price(amount)
+        assert "amount error" in str(exc_info.value)
+
+
+def test_field_named_value_and_strip():
+    @validated_dataclass
+    class Item:
+        label: str = field(metadata={"rules": Rules().is_not_empty()})
+        value: int = 0
+
+    item = Item("  a  ", 3)
+    assert item.label == "  a  " and item.value == 3
+
+    with pytest.raises(ValueError):
+        Item("   ")
+
+
+def test_frozen_post_init_and_init_false():
+    @validated_dataclass(frozen=True)
+    class Frozen:
+        x: int
+        doubled: int = field(init=False, default=0)
+
+        def __post_init__(self):
+            object.__setattr__(self, "doubled", self.x * 2)
+
+    frozen = Frozen(2)
+    assert frozen.doubled == 4
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.x = 3
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots and kw_only require Python 3.10")
+def test_slots_and_kw_only():
+    @validated_dataclass(slots=True, kw_only=True)
+    class Record:
+        id: int
+        path: str = field(default="", metadata={"rules": Rules().is_file_suffix(".csv")})
+
+    record = Record(id=1, path="a.csv")
+    assert not hasattr(record, "__dict__")
+    assert record.path == "a.csv"
+
+    with pytest.raises(TypeError):
+        Record(1)
+    with pytest.raises(ValueError):
+        Record(id=1, path="a.txt")
+
+
+def test_generated_source_uses_fast_checks():
+    @dataclasses.dataclass
+    class Example:
+        x: int
+        y: str = field(default="", metadata={"rules": Rules().customize(lambda value: True)})
+
+    source, _ = generate_init(Example, dataclasses.fields(Example), False)
+    assert "isinstance(__pv_value, int)" in source
+
+
+def test_invalid_rules_metadata():
+    with pytest.raises(CallValidateMethodError):
+        @validated_dataclass
+        class Invalid:
+            x: int = field(default=0, metadata={"rules": "is_int"})
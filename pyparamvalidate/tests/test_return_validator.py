@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from pyparamvalidate.core.container import Rules
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.return_validator import ReturnValidator
+from pyparamvalidate.core.validator import CallValidateMethodError
+
+
+def test_return_value_rules():
+    @ReturnValidator("must return a positive int").is_int().is_positive()
+    def example_function(value):
+        return value
+
+    assert example_function(3) == 3
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(-1)
+    assert 'return error: "-1" is invalid' in str(exc_info.value)
+    assert "must return a positive int" in str(exc_info.value)
+
+
+def test_return_value_rules_run_after_parameter_rules():
+    calls = []
+
+    @ReturnValidator().is_list().each(Rules().is_string())
+    @ParameterValidator("count").is_int()
+    def example_function(count):
+        calls.append(count)
+        return [str(i) for i in range(count)] + ([None] if count > 2 else [])
+
+    assert example_function(2) == ["0", "1"]
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function("2")
+    assert "count error" in str(exc_info.value)
+    assert calls == [2]
+
+    with pytest.raises(ValueError) as exc_info:
+        example_function(3)
+    assert "return[3] error" in str(exc_info.value)
+
+
+def test_coroutine_return_value():
+    @ReturnValidator().is_string()
+    async def example_function(value):
+        await asyncio.sleep(0)
+        return value
+
+    assert asyncio.run(example_function("a")) == "a"
+
+    with pytest.raises(ValueError) as exc_info:
+        asyncio.run(example_function(1))
+    assert "return error" in str(exc_info.value)
+
+
+def test_generator_items():
+    @ReturnValidator().is_int()
+    def example_function(values):
+        sent = yield values[0]
+        yield sent
+        yield from values[1:]
+        return "done"
+
+    generator = example_function([1, "2"])
+    assert next(generator) == 1
+    assert generator.send(5) == 5
+
+    with pytest.raises(ValueError) as exc_info:
+        next(generator)
+    assert "yield[2] error" in str(exc_info.value)
+
+
+def test_generator_forwards_throw_and_return_value():
+    @ReturnValidator().is_int()
+    def example_function():
+        try:
+            yield 1
+        except KeyError:
+            yield 2
+        return "done"
+
+    generator = example_function()
+    assert next(generator) == 1
+    assert generator.throw(KeyError()) == 2
+    with pytest.raises(StopIteration) as exc_info:
+        next(generator)
+    assert exc_info.value.value == "done"
+
+
+def test_async_generator_items():
+    @ReturnValidator().is_int()
+    async def example_function(values):
+        for value in values:
+            yield value
+
+    async def collect(values):
+        return [value async for value in example_function(values)]
+
+    assert asyncio.run(collect([1, 2])) == [1, 2]
+
+    with pytest.raises(ValueError) as exc_info:
+        asyncio.run(collect([1, "2"]))
+    assert "yield[1] error" in str(exc_info.value)
+
+
+def test_sampled_return_value():
+    @ReturnValidator(sample_rate=0.5, seed=0).is_int()
+    def example_function(value):
+        return value
+
+    failures = 0
+    for _ in range(200):
+        try:
+            example_function("1")
+        except ValueError:
+            failures += 1
+    assert 50 < failures < 150
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(CallValidateMethodError):
+        ReturnValidator(sample_rate=0)
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import pytest
+
+from pyparamvalidate.core.param_validator import ParameterValidator
+from pyparamvalidate.core.single_flight import AsyncSingleFlight, SingleFlight
+from pyparamvalidate.core.validator import CallValidateMethodError
+
+
+class SlowLookup:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self._lock = Lock()
+
+    def __call__(self, value):
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return value > 0
+
+
+def test_single_flight_shares_concurrent_calls():
+    lookup = SlowLookup()
+
+    @ParameterValidator("user_id").customize(lookup).single_flight()
+    def example_function(user_id):
+        return user_id
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(example_function, [1] * 8)) == [1] * 8
+    assert lookup.calls == 1
+
+    # 不通过时，共用结果的调用抛出相同的异常
+    with ThreadPoolExecutor(4) as executor:
+        futures = [executor.submit(example_function, -1) for _ in range(4)]
+    for future in futures:
+        with pytest.raises(ValueError, match='user_id error'):
+            future.result()
+    assert lookup.calls == 2
+
+    # 校验完成之后不缓存结果
+    example_function(1)
+    assert lookup.calls == 3
+
+
+def test_single_flight_concurrency_limit():
+    lookup = SlowLookup(0.05)
+
+    @ParameterValidator("user_id").customize(lookup).single_flight(max_concurrency=2)
+    def example_function(user_id):
+        return user_id
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(example_function, range(1, 9))) == list(range(1, 9))
+    assert lookup.calls == 8
+    assert lookup.max_running == 2
+
+
+def test_single_flight_requires_rule():
+    with pytest.raises(CallValidateMethodError):
+        ParameterValidator("user_id").single_flight()
+    with pytest.raises(CallValidateMethodError):
+        ParameterValidator("user_id").is_int().single_flight(max_concurrency=0)
+
+
+def test_thread_single_flight_unhashable_key():
+    flight = SingleFlight()
+    assert flight.do(None, lambda: 1) == 1
+    assert flight.stats == [1, 0]
+
+
+def test_async_single_flight():
+    lookup = SlowLookup(0.05)
+
+    @ParameterValidator("user_id").customize(lookup).single_flight()
+    async def example_function(user_id):
+        return user_id
+
+    async def main():
+        results = await asyncio.gather(*(example_function(1) for _ in range(10)), example_function(2))
+        assert results == [1] * 10 + [2]
+
+        with pytest.raises(ValueError):
+            await example_function(-1)
+
+    asyncio.run(main())
+    assert lookup.calls == 3
+
+
+def test_async_single_flight_concurrency_limit():
+    flight = AsyncSingleFlight(max_concurrency=1)
+    running = []
+
+    async def call(value):
+        running.append(value)
+        assert len(running) == 1
+        await asyncio.sleep(0.01)
+        running.remove(value)
+        return value
+
+    async def main():
+        return await asyncio.gather(*(flight.do(value % 3, lambda value=value: call(value)) for value in range(6)))
+
+    results = asyncio.run(main())
+    assert results == [0, 1, 2, 0, 1, 2]
+    assert flight.stats == [3, 3]
+
+
+def test_thread_single_flight_raises_error_copies():
+    flight = SingleFlight()
+    errors = []
+
+    def fail():
+        time.sleep(0.05)
+        raise ValueError("value error")
+
+    def call():
+        try:
+            flight.do(1, fail)
+        except ValueError as e:
+            errors.append(e)
+
+    with ThreadPoolExecutor(4) as executor:
+        for _ in range(4):
+            executor.submit(call)
+    assert len(errors) == 4
+    assert all(str(error) == "value error" for error in errors)
+    # 每个线程抛出不同的异常对象
+    assert len({id(error) for error in errors}) == 4
+
+
+def test_async_single_flight_leader_cancelled():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do(1, call))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do(1, call)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        # 等待者没有被取消，其中一个重新执行调用，其他等待者共用它的结果
+        assert await asyncio.gather(*followers) == ["ok"] * 3
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    asyncio.run(main())
+    assert len(calls) == 2
+    assert flight.stats == [2, 2]
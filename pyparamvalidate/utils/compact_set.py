@@ -0,0 +1,223 @@
+import operator
+from array import array
+from bisect import bisect_left
+from weakref import WeakValueDictionary
+
+'''
+超大允许值列表(allowlist)的紧凑成员集合
+
+is_allowed_value(allowed_values) 直接持有调用者传入的容器，百万级别的 set / list 每个元素都需要一个 Python 对象和哈希表槽位，
+且每个装饰器各自持有一份。使用 compact_allowlist 可以将其转换为紧凑的只读集合：
+
+- 整数：去重后排序，保存在 array('q') 中(每个元素 8 字节)，使用 bisect 二分查找；
+- 字符串：去重后排序，UTF-8 编码之后首尾相连保存在一个 bytes 中，另用整数数组保存每个字符串的偏移量，
+  不为每个字符串保留 Python 对象，使用 bisect 二分查找，可选使用 Bloom 过滤器预先排除不存在的值；
+- 内容相同的 allowlist 只保留一份，多个装饰器共享同一个对象。
+
+示例：
+
+    from pyparamvalidate import ParameterValidator, compact_allowlist
+
+    @ParameterValidator("user_id").is_allowed_value(compact_allowlist(blocked_user_ids))
+    def example_function(user_id):
+        ...
+'''
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# 已创建的紧凑集合：{内容摘要: 紧凑集合}，内容相同的 allowlist 共享同一个对象
+_shared = WeakValueDictionary()
+
+
+class BloomFilter:
+    """
+    Bloom 过滤器：判断值 "一定不存在" 或 "可能存在"
+    """
+
+    def __init__(self, values, error_rate=0.01):
+        """
+        :param values: 集合中的所有值
+        :param error_rate: 期望的误判率
+        """
+        import math
+
+        count = max(len(values), 1)
+        self.size = max(int(-count * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / count * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+        for value in values:
+            for position in self._positions(value):
+                self._bits[position >> 3] |= 1 << (position & 7)
+
+    def _positions(self, value):
+        # 使用 double hashing，由一个哈希值派生出 hash_count 个位置
+        hash_value = hash(value)
+        h1 = hash_value & 0xFFFFFFFF
+        h2 = ((hash_value >> 32) & 0xFFFFFFFF) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def __contains__(self, value):
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class SortedIntSet:
+    """
+    基于 array('q') 的有序整数集合，成员判断与 value in set_of_ints 等价：与整数相等的其他数值(如 3.0、numpy.int64(3)、
+    Decimal(3))同样被视为存在
+    """
+
+    def __init__(self, values):
+        self._items = array('q', sorted(set(values)))
+
+    def __contains__(self, value):
+        if isinstance(value, float):
+            if not value.is_integer():
+                return False
+            value = int(value)
+        elif not isinstance(value, int):
+            try:
+                # 实现了 __index__ 的整数类型，如 numpy.int64
+                value = operator.index(value)
+            except TypeError:
+                # 其他数值类型(如 Decimal、Fraction)，与 set 一样，与整数相等时视为该整数
+                try:
+                    integer = int(value)
+                except (TypeError, ValueError, OverflowError):
+                    return False
+                if integer != value:
+                    return False
+                value = integer
+
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            return False
+
+        items = self._items
+        index = bisect_left(items, value)
+        return index < len(items) and items[index] == value
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(<{len(self)} items>)'
+
+
+def _encode(value):
+    # surrogatepass：保留单独的代理字符；UTF-8 编码之后的字节顺序与字符串的码位顺序一致
+    return value.encode('utf-8', 'surrogatepass')
+
+
+class _PackedStrings:
+    """
+    首尾相连保存的 UTF-8 字符串，支持 len() 和下标访问(返回 bytes)，供 bisect 使用
+    """
+
+    __slots__ = ('blob', 'offsets')
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        # offsets[i] 为第 i 个字符串的起始位置，最后一个元素为 blob 的长度
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        offsets = self.offsets
+        return self.blob[offsets[index]:offsets[index + 1]]
+
+
+class SortedStrSet:
+    """
+    有序、去重、紧凑保存的字符串集合，成员判断与 value in set_of_strs 等价
+    """
+
+    def __init__(self, values, bloom=False, error_rate=0.01):
+        """
+        :param values: 字符串集合
+        :param bloom: 是否使用 Bloom 过滤器预先排除不存在的值，适用于大部分被校验的值都不在集合中的场景
+        :param error_rate: Bloom 过滤器的误判率
+        """
+        values = sorted(set(values))
+        self._bloom = BloomFilter(values, error_rate) if bloom else None
+
+        encoded = [_encode(value) for value in values]
+        del values
+        blob = b''.join(encoded)
+        # 偏移量使用 4 字节整数，blob 超过 4 GB 时使用 8 字节整数
+        offsets = array('I' if len(blob) < (1 << 32) and array('I').itemsize == 4 else 'q', [0])
+        position = 0
+        for item in encoded:
+            position += len(item)
+            offsets.append(position)
+        self._items = _PackedStrings(blob, offsets)
+
+    def __contains__(self, value):
+        if not isinstance(value, str):
+            return False
+
+        if self._bloom is not None and value not in self._bloom:
+            return False
+
+        items = self._items
+        value = _encode(value)
+        index = bisect_left(items, value)
+        return index < len(items) and items[index] == value
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        items = self._items
+        return (items[index].decode('utf-8', 'surrogatepass') for index in range(len(items)))
+
+    def __repr__(self):
+        return f'{type(self).__name__}(<{len(self)} items>)'
+
+
+def _digest(kind, buffers, options):
+    import hashlib
+
+    digest = hashlib.sha256(f'{kind}:{options}:'.encode())
+    for buffer in buffers:
+        digest.update(buffer)
+        digest.update(b'\0')
+    return digest.digest()
+
+
+def compact_allowlist(values, bloom=False, error_rate=0.01):
+    """
+    将 allowlist 转换为紧凑的只读成员集合，内容相同的 allowlist 返回同一个对象。
+
+    :param values: 允许值，全部为整数时返回 SortedIntSet，全部为字符串时返回 SortedStrSet，
+                   否则返回 frozenset(包含不可哈希的值时原样返回)
+    :param bloom: 字符串集合是否使用 Bloom 过滤器
+    :param error_rate: Bloom 过滤器的误判率
+    """
+    if isinstance(values, (SortedIntSet, SortedStrSet)):
+        return values
+
+    values = values if isinstance(values, (list, tuple, set, frozenset)) else list(values)
+
+    # bool 是 int 的子类，但 True in {1} 与 True in array('q', [1]) 的语义相同，因此也可以使用 SortedIntSet
+    if all(type(value) is int or type(value) is bool for value in values) and values \
+            and _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+        compact = SortedIntSet(values)
+        key = _digest('int', (compact._items,), '')
+    elif all(type(value) is str for value in values) and values:
+        compact = SortedStrSet(values, bloom, error_rate)
+        # 偏移量数组的类型与 blob 的长度有关，内容相同时一定相同
+        key = _digest('str', (compact._items.blob, compact._items.offsets), (bloom, error_rate))
+    else:
+        try:
+            return frozenset(values)
+        except TypeError:
+            return values
+
+    return _shared.setdefault(key, compact)
@@ -1,13 +1,18 @@
 class DictUtility:
 
-    def trim_dict(self, adict, trim_key=True, trim_value=True):
+    def trim_dict(self, adict, trim_key=True, trim_value=True, inplace=False):
         """
-        去除字典键和值的前后空格。
+        去除字典键和值的前后空格，支持嵌套的字典、列表和元组。
+
+        - 使用显式栈迭代处理，嵌套层级很深的字典也不会超过 Python 的递归深度限制；
+        - 写时复制：没有任何键或值需要去除空格的字典、列表、元组原样返回(包括嵌套的子对象)，只复制发生变化的部分；
+        - inplace 为 True 时直接修改原字典和其中的列表，不复制，元组不可修改，发生变化时替换为新的元组。
 
         :param adict: 要处理的字典
         :param trim_key: 是否去除键前后的空格，默认为 True
-        :param trim_value: 是否去除值前后的空格，默认为 True
-        :return: 处理后的字典
+        :param trim_value: 是否去除值前后的空格(包括列表、元组中的字符串)，默认为 True
+        :param inplace: 是否直接修改原字典，默认为 False
+        :return: 处理后的字典，没有变化时返回原字典
 
         示例:
             - nested_dict = {' key1 ': {'nested_key1': ' value1 ', 'nested_key2': {'nested_nested_key': ' nested_value '}}}
@@ -15,53 +20,225 @@ class DictUtility:
             - print("原始字典：", nested_dict)
             - print("处理后的字典：", trimmed_dict)
         """
-        idict = {}
-        for k, v in adict.items():
-            # 如果 trim_key 为 True 且键是字符串，则去除键前后的空格
-            if trim_key and isinstance(k, str):
-                k = k.strip()
-
-            # 如果 trim_value 为 True 且值是字符串，则去除值前后的空格
-            if trim_value and isinstance(v, str):
-                idict[k] = v.strip()
-            elif isinstance(v, dict):
-                # 如果值是嵌套字典，则递归调用 trim_dict 函数
-                idict[k] = self.trim_dict(v, trim_key, trim_value)
-            else:
-                idict[k] = v
-        return idict
+        if not isinstance(adict, (dict, list, tuple)):
+            return adict
+
+        # 正在处理的容器的 id，用于跳过循环引用
+        active = {id(adict)}
+        stack = [_TrimFrame(adict, trim_key)]
+        while True:
+            frame = stack[-1]
+            if frame.index < len(frame.entries):
+                value = frame.current_value()
+                if isinstance(value, (dict, list, tuple)) and id(value) not in active:
+                    active.add(id(value))
+                    stack.append(_TrimFrame(value, trim_key))
+                    continue
+
+                frame.record(value.strip() if trim_value and isinstance(value, str) else value)
+                continue
+
+            stack.pop()
+            active.discard(id(frame.container))
+            result = frame.finish(inplace)
+            if not stack:
+                return result
+            stack[-1].record(result)
 
     def is_similar_dict(self, dict1, dict2, ignore_keys_whitespace=True):
         """
         比对两个字典，如果 key 完全相同， 且 value 类型相同，则返回为True, 支持多层嵌套比对。
 
+        与同一个模板字典比对大量字典时，可以先将模板编译为 DictShape，再传给 dict2，避免每次比对都重新处理模板：
+
+            shape = DictShape(template)
+            all(DictUtility().is_similar_dict(item, shape) for item in items)
+
         :param dict1: 第一个要比对的字典
-        :param dict2: 第二个要比对的字典
-        :param ignore_keys_whitespace: 是否忽略 key 的前后空格，默认为 True
+        :param dict2: 第二个要比对的字典(模板)，也可以是 DictShape
+        :param ignore_keys_whitespace: 是否忽略 key 的前后空格，默认为 True，dict2 为 DictShape 时使用 DictShape 的设置
         :return: 若字典相同则返回 True，否则返回 False
         """
-        if ignore_keys_whitespace:
-            dict1 = self.trim_dict(dict1, trim_key=True, trim_value=False)
-            dict2 = self.trim_dict(dict2, trim_key=True, trim_value=False)
+        shape = dict2 if isinstance(dict2, DictShape) else DictShape(dict2, ignore_keys_whitespace)
+        return shape.matches(dict1)
+
+    def group_by_shape(self, dicts, ignore_keys_whitespace=True):
+        """
+        按结构对字典分组，结构相同(key 完全相同，且 value 类型完全相同)的字典分为一组。
+
+        :param dicts: 要分组的字典
+        :param ignore_keys_whitespace: 是否忽略 key 的前后空格，默认为 True
+        :return: {结构签名(DictShape.signature): [字典]}，保持字典的原有顺序
+        """
+        groups = {}
+        for adict in dicts:
+            signature = DictShape(adict, ignore_keys_whitespace).signature
+            groups.setdefault(signature, []).append(adict)
+        return groups
+
+
+def _strip_keys(adict):
+    # 去除 key 的前后空格，只在有 key 需要去除空格时才复制(只复制当前层级)
+    if not any(isinstance(key, str) and key != key.strip() for key in adict):
+        return adict
+    return {key.strip() if isinstance(key, str) else key: value for key, value in adict.items()}
+
+
+class DictShape:
+    """
+    字典的结构：每个 key 对应的值类型，以及嵌套字典的结构。
+
+    - signature 为可哈希的结构签名，结构相同的字典签名相同，可以作为 dict 的 key 对大量字典分组；
+    - matches 与 DictUtility.is_similar_dict 的比对规则相同，遇到第一个不一致的 key 或值类型时立即返回 False。
+    """
+
+    __slots__ = ('fields', 'ignore_keys_whitespace', '_signature')
+
+    def __init__(self, template, ignore_keys_whitespace=True):
+        """
+        :param template: 模板字典
+        :param ignore_keys_whitespace: 是否忽略 key 的前后空格
+        """
+        self.ignore_keys_whitespace = ignore_keys_whitespace
+        self._signature = None
 
-        # 比对两个字典的 key 是否完全一致
-        keys1 = set(dict1.keys())
-        keys2 = set(dict2.keys())
+        # 使用显式栈自顶向下构建嵌套字典的结构
+        self.fields = {}
+        stack = [(template, self)]
+        while stack:
+            adict, shape = stack.pop()
+            if ignore_keys_whitespace:
+                adict = _strip_keys(adict)
+            for key, value in adict.items():
+                child = None
+                if isinstance(value, dict):
+                    # 先创建空结构，由栈中的下一轮循环填充
+                    child = DictShape({}, ignore_keys_whitespace)
+                    stack.append((value, child))
+                shape.fields[key] = (type(value), child)
 
-        if keys1 != keys2:
-            return False
+    @property
+    def signature(self):
+        """
+        可哈希的结构签名：frozenset({(key, 值类型, 嵌套字典的结构签名或 None)})
+        """
+        if self._signature is None:
+            # 先收集所有嵌套结构，再按自底向上的顺序计算签名
+            shapes = [self]
+            for shape in shapes:
+                shapes.extend(child for _, child in shape.fields.values() if child is not None)
+            for shape in reversed(shapes):
+                shape._signature = frozenset(
+                    (key, value_type, child._signature if child is not None else None)
+                    for key, (value_type, child) in shape.fields.items())
+        return self._signature
 
-        # 比对两个字典的 value 数据类型是否一致
-        for key in keys1:
-            value1 = dict1[key]
-            value2 = dict2[key]
+    def __eq__(self, other):
+        return isinstance(other, DictShape) and self.signature == other.signature
 
-            if not isinstance(value1, type(value2)):
+    def __hash__(self):
+        return hash(self.signature)
+
+    def matches(self, adict):
+        """
+        判断字典是否与模板结构相同：key 完全相同，且每个值都是模板中对应值的类型的实例
+        """
+        stack = [(adict, self)]
+        while stack:
+            adict, shape = stack.pop()
+            if shape.ignore_keys_whitespace:
+                adict = _strip_keys(adict)
+
+            fields = shape.fields
+            if len(adict) != len(fields):
                 return False
 
-            # 如果 value 是字典类型，则递归调用 compare_dicts 进行比对
-            if isinstance(value1, dict):
-                if not self.is_similar_dict(value1, value2):
+            for key, value in adict.items():
+                field = fields.get(key)
+                if field is None:
+                    return False
+
+                value_type, child = field
+                if not isinstance(value, value_type):
                     return False
 
+                if isinstance(value, dict):
+                    if child is None:
+                        return False
+                    stack.append((value, child))
         return True
+
+
+class _TrimFrame:
+    """
+    trim_dict 显式栈中的一帧：一个正在处理的字典、列表或元组
+    """
+
+    __slots__ = ('container', 'entries', 'index', 'results', 'keys_changed', 'is_dict', 'trim_key')
+
+    def __init__(self, container, trim_key):
+        self.container = container
+        self.is_dict = isinstance(container, dict)
+        # 字典先取出所有键值对，避免在迭代过程中修改字典(inplace)
+        self.entries = list(container.items()) if self.is_dict else container
+        self.index = 0
+        # 处理结果，只在第一次发生变化时才创建(写时复制)
+        self.results = None
+        self.keys_changed = False
+        self.trim_key = trim_key
+
+    def current_value(self):
+        entry = self.entries[self.index]
+        return entry[1] if self.is_dict else entry
+
+    def record(self, result):
+        """
+        记录当前元素的处理结果，并移动到下一个元素
+        """
+        index = self.index
+        self.index = index + 1
+
+        if self.is_dict:
+            key, value = self.entries[index]
+            new_key = key.strip() if self.trim_key and isinstance(key, str) else key
+            if new_key != key:
+                self.keys_changed = True
+            changed = new_key != key or result is not value
+            result = (new_key, result)
+        else:
+            changed = result is not self.entries[index]
+
+        if self.results is None:
+            if not changed:
+                return
+            self.results = list(self.entries[:index])
+        self.results.append(result)
+
+    def finish(self, inplace):
+        """
+        返回处理之后的容器，没有变化时返回原容器
+        """
+        container, results = self.container, self.results
+        if results is None:
+            return container
+
+        if isinstance(container, tuple):
+            return tuple(results) if type(container) is tuple else type(container)(*results)
+
+        if not inplace:
+            return dict(results) if self.is_dict else results
+
+        if self.is_dict:
+            if self.keys_changed:
+                # 键发生变化时重建字典，保持键的顺序
+                container.clear()
+                container.update(results)
+            else:
+                for (key, value), (_, original) in zip(results, self.entries):
+                    if value is not original:
+                        container[key] = value
+        else:
+            for index, (value, original) in enumerate(zip(results, self.entries)):
+                if value is not original:
+                    container[index] = value
+        return container